@@ -0,0 +1,104 @@
+"""import 비용 측정
+
+`python -X importtime`으로 모듈 import 시간을 새 프로세스에서 여러 번 측정해
+중앙값을 출력한다. 누적 시간이 큰 모듈을 함께 출력해서 어떤 의존성이
+시작 시간을 차지하는지 확인할 수 있다.
+
+    $ python benchmarks/bench_import.py
+    $ python benchmarks/bench_import.py pykrx.stock --repeat 10 --json out.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+def _parents(module: str) -> set:
+    """pykrx.stock -> {"pykrx", "pykrx.stock"}"""
+    parts = module.split(".")
+    return {".".join(parts[: i + 1]) for i in range(len(parts))}
+
+
+def importtime(module: str) -> dict:
+    """새 인터프리터에서 module을 import하고 module과 그 하위에서 import된
+    모듈별 누적 시간(us)을 반환한다. 인터프리터 시작(site 등) 비용은 제외한다.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip(), int(cumulative)))
+
+    # -X importtime은 하위 모듈을 상위 모듈보다 먼저 출력하고, pykrx.stock을
+    # import하면 pykrx와 pykrx.stock이 각각 최상위 항목으로 출력된다.
+    targets = _parents(module)
+    result = {}
+    collecting = False
+    for depth, name, cumulative in reversed(entries):
+        if depth == 0:
+            if name not in targets:
+                if collecting:
+                    break
+                continue
+            collecting = True
+            result[name] = cumulative
+        elif collecting:
+            result[name] = cumulative
+    result[module] = sum(result.get(x, 0) for x in targets)
+    return result
+
+
+def run(module: str, repeat: int = 5, top: int = 10) -> dict:
+    runs = [importtime(module) for _ in range(repeat)]
+    total = statistics.median(x.get(module, 0) for x in runs)
+    names = set().union(*runs)
+    modules = {
+        x: statistics.median(r.get(x, 0) for r in runs)
+        for x in names
+        if x not in _parents(module)
+    }
+    heaviest = sorted(modules.items(), key=lambda x: x[1], reverse=True)[:top]
+    return {
+        "module": module,
+        "repeat": repeat,
+        "total_ms": total / 1000,
+        "modules": len(names),
+        "heaviest_ms": {k: v / 1000 for k, v in heaviest},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", nargs="?", default="pykrx")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run(args.module, args.repeat, args.top)
+    print(
+        f"import {report['module']}: {report['total_ms']:.1f} ms "
+        f"({report['modules']} modules, median of {report['repeat']})"
+    )
+    for name, ms in report["heaviest_ms"].items():
+        print(f"  {ms:8.1f} ms  {name}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
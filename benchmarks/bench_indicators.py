@@ -0,0 +1,141 @@
+"""기술적 지표의 패널 계산과 종목별 pandas 계산 비교
+
+날짜 x 종목 합성 시세 패널에서 이동 평균, RSI, 볼린저 밴드, 52주 최고/최저가를
+pykrx.analytics로 한 번에 계산한 시간과, 종목마다 Series.rolling으로 계산한
+시간을 비교한다. 두 결과가 같은지도 함께 확인한다.
+
+    $ python benchmarks/bench_indicators.py
+    $ python benchmarks/bench_indicators.py --dates 2500 --tickers 2500 --json ind.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from pykrx import analytics
+
+
+def _panel(dates: int, tickers: int, seed: int = 0) -> tuple:
+    """로그 정규 random walk로 만든 종가/고가/저가 패널"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2014-01-02", periods=dates, name="날짜")
+    columns = [f"{i:06d}" for i in range(tickers)]
+    close = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (dates, tickers)), axis=0))
+    spread = 1 + np.abs(rng.normal(0, 0.01, (dates, tickers)))
+    frames = [close, close * spread, close / spread]
+    return tuple(pd.DataFrame(x, index=index, columns=columns) for x in frames)
+
+
+def _rsi(close: pd.Series, window: int) -> pd.Series:
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(window).mean()
+    loss = (-delta).clip(lower=0).rolling(window).mean()
+    return 100 - 100 / (1 + gain / loss)
+
+
+# (이름, 패널 계산, 종목별 pandas 계산). 인자는 (종가, 고가, 저가)다.
+SCENARIOS = [
+    ("rolling_mean_20", lambda c, hi, lo: analytics.rolling_mean(c, 20),
+     lambda c, hi, lo: c.rolling(20).mean()),
+    ("rolling_mean_200", lambda c, hi, lo: analytics.rolling_mean(c, 200),
+     lambda c, hi, lo: c.rolling(200).mean()),
+    ("rsi_14", lambda c, hi, lo: analytics.rsi(c, 14),
+     lambda c, hi, lo: _rsi(c, 14)),
+    ("bollinger_20", lambda c, hi, lo: analytics.bollinger_bands(c, 20)["상단"],
+     lambda c, hi, lo: c.rolling(20).mean() + 2 * c.rolling(20).std()),
+    ("high_52w", lambda c, hi, lo: analytics.rolling_max(hi, analytics.WEEKS_52),
+     lambda c, hi, lo: hi.rolling(analytics.WEEKS_52).max()),
+    ("low_52w", lambda c, hi, lo: analytics.rolling_min(lo, analytics.WEEKS_52),
+     lambda c, hi, lo: lo.rolling(analytics.WEEKS_52).min()),
+]  # fmt: skip
+
+
+def _time(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def run(dates: int, tickers: int, repeat: int, keyword: str = None) -> dict:
+    close, high, low = _panel(dates, tickers)
+    results = {}
+    for name, panel, series in SCENARIOS:
+        if keyword and keyword not in name:
+            continue
+
+        def per_ticker(series=series):
+            return pd.DataFrame(
+                {
+                    x: series(close[x], high[x], low[x])
+                    for x in close.columns  # noqa: B023
+                }
+            )
+
+        expected = per_ticker()
+        result = panel(close, high, low)
+        # RSI 0처럼 기대값이 0에 가까우면 절대 오차로 비교한다.
+        expected_values = expected.to_numpy()
+        error = np.nanmax(
+            np.abs(result.to_numpy() - expected_values)
+            / np.maximum(np.abs(expected_values), 1.0)
+        )
+        same_nan = bool((result.isna() == expected.isna()).all().all())
+
+        panel_s = _time(lambda panel=panel: panel(close, high, low), repeat)
+        pandas_s = _time(per_ticker, max(repeat // 5, 1))
+        results[name] = {
+            "panel_ms": panel_s * 1000,
+            "pandas_ms": pandas_s * 1000,
+            "speedup": pandas_s / panel_s if panel_s > 0 else None,
+            "max_rel_error": float(error),
+            "same_nan": same_nan,
+        }
+    return {
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "python": sys.version.split()[0],
+        "dates": dates,
+        "tickers": tickers,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dates", type=int, default=1500)
+    parser.add_argument("--tickers", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("-k", dest="keyword", help="이름에 keyword가 있는 항목만 실행")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run(args.dates, args.tickers, args.repeat, args.keyword)
+    print(
+        f"pandas {report['pandas']} / numpy {report['numpy']} "
+        f"({report['dates']} dates x {report['tickers']} tickers, "
+        f"median of {report['repeat']})"
+    )
+    print(f"{'':20}{'panel ms':>10}{'pandas ms':>11}{'speedup':>9}{'rel err':>10}")
+    for name, item in report["results"].items():
+        print(
+            f"{name:20}{item['panel_ms']:>10.1f}{item['pandas_ms']:>11.1f}"
+            f"{item['speedup']:>8.1f}x{item['max_rel_error']:>10.1e}"
+            + ("" if item["same_nan"] else "  NaN mismatch")
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""대형 전종목/장기 조회의 메모리 측정
+
+pykrx.testing.FakeServer가 만드는 전 종목 규모의 합성 응답으로 전종목 OHLCV,
+ETF/ELW 목록, 여러 해의 지수 시세 등을 조회하고 tracemalloc으로 최대 할당량,
+호출 뒤에 남은 크기, 결과 대비 복사 횟수를 단계(tracing span)별로 측정한다.
+최대 RSS는 항목마다 새 프로세스에서 측정한다.
+
+    $ python benchmarks/bench_memory.py
+    $ python benchmarks/bench_memory.py --size 2500 --json memory.json
+"""
+
+import argparse
+import gc
+import importlib
+import json
+import resource
+import subprocess
+import sys
+import threading
+import tracemalloc
+
+DATE = "20240102"
+
+# (이름, 모듈, 함수, 인자, 준비 호출 인자). 준비 호출로 티커 목록 등을 먼저
+# 읽어서 측정에서 제외한다.
+SCENARIOS = [
+    ("market_ohlcv_by_ticker_all", "stock", "get_market_ohlcv_by_ticker",
+     (DATE, "ALL"), ("20240103", "KOSPI")),
+    ("market_cap_by_ticker_all", "stock", "get_market_cap_by_ticker",
+     (DATE, "ALL"), ("20240103", "KOSPI")),
+    ("market_ticker_list_all", "stock", "get_market_ticker_list",
+     (DATE, "ALL"), None),
+    ("etf_ticker_list", "stock", "get_etf_ticker_list", (DATE,), None),
+    ("elw_ticker_list", "stock", "get_elw_ticker_list", (DATE,), None),
+    ("etf_ohlcv_by_ticker", "stock", "get_etf_ohlcv_by_ticker",
+     (DATE,), ("20240103",)),
+    ("index_ohlcv_by_date_6y", "stock", "get_index_ohlcv_by_date",
+     ("20180102", "20231229", "1001"), ("20231201", "20231229", "1001")),
+]  # fmt: skip
+
+
+def _size(result) -> int:
+    """결과 객체가 차지하는 메모리 (byte)"""
+    if hasattr(result, "memory_usage"):
+        usage = result.memory_usage(deep=True)
+        return int(getattr(usage, "sum", lambda: usage)())
+    if isinstance(result, list):
+        return sys.getsizeof(result) + sum(sys.getsizeof(x) for x in result)
+    return sys.getsizeof(result)
+
+
+class MemoryHook:
+    """span마다 tracemalloc의 최대 할당량과 남은 크기를 기록하는 hook
+
+    tracemalloc의 최대값은 프로세스 전체에서 하나이므로, span이 시작하거나 끝날
+    때마다 열려 있는 모든 span에 현재까지의 최대값을 반영하고 초기화한다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open = {}
+        self.stages = {}
+
+    def _fold(self):
+        current, peak = tracemalloc.get_traced_memory()
+        for item in self._open.values():
+            item["peak"] = max(item["peak"], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def on_start(self, span):
+        with self._lock:
+            current = self._fold()
+            self._open[id(span)] = {"start": current, "peak": current}
+
+    def on_end(self, span):
+        with self._lock:
+            current = self._fold()
+            item = self._open.pop(id(span), None)
+            if item is None:
+                return
+            stage = self.stages.setdefault(
+                span.name, {"calls": 0, "peak": 0, "retained": 0}
+            )
+            stage["calls"] += 1
+            stage["peak"] = max(stage["peak"], item["peak"] - item["start"])
+            stage["retained"] += current - item["start"]
+
+
+def measure(name: str, base_url: str) -> dict:
+    """새 프로세스에서 실행되어 한 항목을 측정한다."""
+    from pykrx.website.comm import throttle, tracing, webio
+
+    for origin in ("https://data.krx.co.kr", "http://fchart.stock.naver.com"):
+        webio.set_base_url(origin, base_url)
+    throttle.set_limits("data.krx.co.kr", rate=1e9, max_rate=1e9)
+
+    _, module, func, args, warmup = next(x for x in SCENARIOS if x[0] == name)
+    api = getattr(importlib.import_module(f"pykrx.{module}"), func)
+    api(*(warmup or args))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    hook = tracing.add_hook(MemoryHook())
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        result = api(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        gc.collect()
+        current, _ = tracemalloc.get_traced_memory()
+        peak = max([peak] + [x["peak"] for x in hook._open.values()])
+        peak = max([peak - start] + [x["peak"] for x in hook.stages.values()])
+    finally:
+        tracemalloc.stop()
+        tracing.remove_hook(hook)
+
+    size = _size(result)
+    return {
+        "rows": len(result),
+        "result_kb": size / 1024,
+        "peak_kb": peak / 1024,
+        "retained_kb": (current - start) / 1024,
+        "copies": peak / size if size else None,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rss_growth_mb": (
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+        )
+        / 1024,
+        "dtypes": {k: str(v) for k, v in getattr(result, "dtypes", {}).items()},
+        "stages": {
+            k: {
+                "calls": v["calls"],
+                "peak_kb": v["peak"] / 1024,
+                "retained_kb": v["retained"] / 1024,
+                "copies": v["peak"] / size if size else None,
+            }
+            for k, v in hook.stages.items()
+        },
+    }
+
+
+def run(size: int = 2500, keyword: str = None) -> dict:
+    from pykrx.testing import FakeServer
+
+    results = {}
+    with FakeServer(size=size) as server:
+        for name, *_ in SCENARIOS:
+            if keyword and keyword not in name:
+                continue
+            proc = subprocess.run(
+                [sys.executable, __file__, "--child", name, server.url],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode:
+                error = (proc.stderr.strip().splitlines() or ["?"])[-1]
+                results[name] = {"error": error}
+            else:
+                results[name] = json.loads(proc.stdout)
+    return {"size": size, "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2500, help="합성 시장의 종목 수")
+    parser.add_argument("-k", dest="keyword", help="이름에 keyword가 있는 항목만 실행")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(*args.child)))
+        return
+
+    report = run(args.size, args.keyword)
+    print(f"synthetic market of {report['size']} tickers")
+    print(
+        f"{'':28}{'rows':>7}{'result KB':>11}{'peak KB':>10}{'kept KB':>10}"
+        f"{'copies':>8}{'RSS MB':>8}  stage peak (copies)"
+    )
+    for name, item in report["results"].items():
+        if "error" in item:
+            print(f"{name:28}{item['error']}")
+            continue
+        stages = " ".join(
+            f"{k}={v['copies']:.1f}"
+            for k, v in sorted(item["stages"].items(), key=lambda x: -x[1]["peak_kb"])
+            if v["copies"] is not None and v["copies"] >= 0.05
+        )
+        print(
+            f"{name:28}{item['rows']:>7}{item['result_kb']:>11.0f}"
+            f"{item['peak_kb']:>10.0f}{item['retained_kb']:>10.0f}"
+            f"{item['copies'] or 0:>8.1f}{item['rss_mb']:>8.0f}  {stages}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""녹화된 응답으로 측정하는 오프라인 벤치마크
+
+tests/cassettes의 VCR 응답을 HTTP 없이 세션에 바로 돌려주는 transport를
+webio 세션에 붙이고, stock/bond 공개 함수를 호출해서 전체 시간과 단계별
+시간(tracing), 초당 행 수, 최대 메모리를 측정한다. 네트워크를 쓰지 않으므로
+파싱과 변환 성능의 회귀를 버전 사이에 비교할 수 있다.
+
+    $ python benchmarks/bench_offline.py
+    $ python benchmarks/bench_offline.py --repeat 20 --json before.json
+    $ python benchmarks/bench_offline.py -k ohlcv --json after.json
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+import urllib.parse
+from pathlib import Path
+
+import requests
+import yaml
+from requests.adapters import BaseAdapter
+
+ROOT = Path(__file__).resolve().parent.parent
+CASSETTE_DIR = ROOT / "tests" / "cassettes"
+
+# tests/conftest.py와 같이 요청 매칭에서 제외하는 날짜 파라미터
+IGNORED_KEYS = {
+    "strtDd",
+    "endDd",
+    "trdDd",
+    "fromdate",
+    "todate",
+    "startDt",
+    "endDt",
+    "stDt",
+    "enDt",
+    "date",
+    "count",
+}
+
+# (이름, 모듈, 함수, 인자). 인자는 tests/integration에서 녹화한 호출을 따른다.
+SCENARIOS = [
+    ("market_ohlcv_by_date", "stock", "get_market_ohlcv_by_date",
+     ("20210118", "20210126", "005930")),
+    ("market_ohlcv_by_ticker", "stock", "get_market_ohlcv_by_ticker", ("20210122",)),
+    ("market_cap_by_ticker", "stock", "get_market_cap_by_ticker", ("20210104",)),
+    ("market_fundamental_by_date", "stock", "get_market_fundamental_by_date",
+     ("20210104", "20210108", "005930")),
+    ("market_fundamental_by_ticker", "stock", "get_market_fundamental_by_ticker",
+     ("20210104",)),
+    ("market_trading_value_by_investor", "stock", "get_market_trading_value_by_investor",
+     ("20210115", "20210122", "KOSPI")),
+    ("market_trading_value_by_date", "stock", "get_market_trading_value_by_date",
+     ("20210115", "20210122", "KOSPI")),
+    ("index_ohlcv_by_date", "stock", "get_index_ohlcv_by_date",
+     ("20210101", "20210130", "1001")),
+    ("index_price_change_by_ticker", "stock", "get_index_price_change_by_ticker",
+     ("20210104", "20210108")),
+    ("index_portfolio_deposit_file", "stock", "get_index_portfolio_deposit_file",
+     ("1001", "20210129")),
+    ("etf_ohlcv_by_ticker", "stock", "get_etf_ohlcv_by_ticker", ("20210325",)),
+    ("etf_portfolio_deposit_file", "stock", "get_etf_portfolio_deposit_file",
+     ("152100", "20210402")),
+    ("etf_price_change_by_ticker", "stock", "get_etf_price_change_by_ticker",
+     ("20210325", "20210402")),
+    ("shorting_balance_by_date", "stock", "get_shorting_balance_by_date",
+     ("20200106", "20200110", "005930")),
+    ("shorting_investor_value_by_date", "stock", "get_shorting_investor_value_by_date",
+     ("20200106", "20200110")),
+    ("otc_treasury_yields_by_ticker", "bond", "get_otc_treasury_yields",
+     ("20220202",)),
+    ("otc_treasury_yields_by_date", "bond", "get_otc_treasury_yields",
+     ("20220104", "20220203", "국고채1년")),
+]  # fmt: skip
+
+
+def _params(request: requests.PreparedRequest) -> dict:
+    url = urllib.parse.urlsplit(request.url)
+    pairs = urllib.parse.parse_qsl(url.query, keep_blank_values=True)
+    body = request.body
+    if isinstance(body, bytes):
+        body = body.decode("utf-8")
+    if body:
+        pairs += urllib.parse.parse_qsl(body, keep_blank_values=True)
+    return dict(pairs)
+
+
+def _key(method: str, url: str, params: dict) -> tuple:
+    url = urllib.parse.urlsplit(url)
+    items = frozenset((k, v) for k, v in params.items() if k not in IGNORED_KEYS)
+    return method, url.netloc + url.path, items
+
+
+def _body(response: dict) -> bytes:
+    body = response["body"]["string"]
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if body[:2] == b"\x1f\x8b":
+        return gzip.decompress(body)
+    return body
+
+
+class CassetteAdapter(BaseAdapter):
+    """tests/cassettes의 응답을 돌려주는 requests transport
+
+    메서드, url, 날짜를 제외한 파라미터가 같은 녹화 응답을 찾고, 없으면 같은
+    bld(또는 url)의 첫 응답을 돌려준다. 녹화되지 않은 요청은 404로 응답한다.
+    """
+
+    def __init__(self, directory: Path = CASSETTE_DIR):
+        super().__init__()
+        self.exact = {}
+        self.fallback = {}
+        self.misses = 0
+        for path in sorted(directory.rglob("*.yaml")):
+            with open(path, encoding="utf-8") as f:
+                cassette = yaml.safe_load(f)
+            for item in cassette.get("interactions", []):
+                request, response = item["request"], item["response"]
+                if response["status"]["code"] != 200:
+                    continue
+                prepared = requests.Request(
+                    request["method"], request["uri"], data=request.get("body")
+                ).prepare()
+                params = _params(prepared)
+                key = _key(request["method"], request["uri"], params)
+                body = _body(response)
+                self.exact.setdefault(key, body)
+                self.fallback.setdefault(key[:2] + (params.get("bld"),), body)
+
+    def __len__(self):
+        return len(self.exact)
+
+    def send(self, request, **kwargs):
+        params = _params(request)
+        key = _key(request.method, request.url, params)
+        body = self.exact.get(key)
+        if body is None:
+            body = self.fallback.get(key[:2] + (params.get("bld"),))
+        resp = requests.Response()
+        resp.request = request
+        resp.url = request.url
+        if body is None:
+            self.misses += 1
+            resp.status_code = 404
+            resp._content = b""
+        else:
+            resp.status_code = 200
+            resp._content = body
+            resp.headers["Content-Type"] = "text/html;charset=UTF-8"
+        resp.encoding = "utf-8"
+        return resp
+
+    def close(self):
+        pass
+
+
+class replay:
+    """webio 세션에 CassetteAdapter를 붙이고 요청 한도를 푸는 context manager"""
+
+    def __init__(self, adapter: CassetteAdapter):
+        self.adapter = adapter
+
+    def __enter__(self):
+        from pykrx.website.comm import throttle, webio
+
+        self.session = webio._session
+        self.adapters = dict(self.session.adapters)
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+        self.limits = (dict(throttle.HOST_LIMITS), dict(throttle.BLD_LIMITS))
+        unlimited = {"rate": 1e9, "max_rate": 1e9, "concurrency": 64}
+        for name in list(throttle.HOST_LIMITS) + list(throttle.BLD_LIMITS):
+            throttle.set_limits(name, **unlimited)
+        return self.adapter
+
+    def __exit__(self, exc_type, exc, tb):
+        from pykrx.website.comm import throttle
+
+        self.session.adapters.clear()
+        self.session.adapters.update(self.adapters)
+        for table, saved in zip(
+            (throttle.HOST_LIMITS, throttle.BLD_LIMITS), self.limits, strict=True
+        ):
+            table.clear()
+            table.update(saved)
+        throttle._limiters.clear()
+        return False
+
+
+def _rows(result) -> int:
+    return getattr(result, "shape", (len(result),))[0]
+
+
+def measure(func, args: tuple, repeat: int = 10) -> dict:
+    """func(*args)의 전체 시간, 단계별 자기 시간, 최대 메모리
+
+    첫 호출은 ticker 목록 등의 초기화 비용이 섞이므로 측정에서 제외한다.
+    """
+    from pykrx.website.comm import tracing
+
+    result = func(*args)
+    rows = _rows(result)
+
+    times = []
+    stages = {}
+    for _ in range(repeat):
+        with tracing.collect() as c:
+            start = time.perf_counter()
+            func(*args)
+            times.append(time.perf_counter() - start)
+        for name, item in c.breakdown().items():
+            stages.setdefault(name, []).append(item["self"])
+
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    median = statistics.median(times)
+    return {
+        "rows": rows,
+        "columns": getattr(result, "shape", (0, 0))[1],
+        "median_ms": median * 1000,
+        "min_ms": min(times) * 1000,
+        "rows_per_sec": rows / median if median > 0 else None,
+        "peak_kb": peak / 1024,
+        "stages_ms": {k: statistics.median(v) * 1000 for k, v in stages.items()},
+    }
+
+
+def run(repeat: int = 10, keyword: str = None) -> dict:
+    import importlib
+
+    import pandas as pd
+
+    import pykrx
+
+    adapter = CassetteAdapter()
+    results = {}
+    with replay(adapter):
+        for name, module, func, args in SCENARIOS:
+            if keyword and keyword not in name:
+                continue
+            api = getattr(importlib.import_module(f"pykrx.{module}"), func)
+            try:
+                results[name] = measure(api, args, repeat)
+            except Exception as e:
+                results[name] = {"error": f"{type(e).__name__}: {e}"}
+    return {
+        "pykrx": pykrx.__version__,
+        "pandas": pd.__version__,
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "responses": len(adapter),
+        "unmatched_requests": adapter.misses,
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("-k", dest="keyword", help="이름에 keyword가 있는 항목만 실행")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    report = run(args.repeat, args.keyword)
+    print(
+        f"pykrx {report['pykrx']} / pandas {report['pandas']} "
+        f"({report['responses']} recorded responses, median of {report['repeat']})"
+    )
+    print(f"{'':34}{'rows':>7}{'ms':>9}{'rows/s':>11}{'peak KB':>10}  stages (ms)")
+    for name, item in report["results"].items():
+        if "error" in item:
+            print(f"{name:34}{item['error']}")
+            continue
+        stages = " ".join(
+            f"{k}={v:.2f}"
+            for k, v in sorted(item["stages_ms"].items(), key=lambda x: -x[1])
+            if v >= 0.01
+        )
+        print(
+            f"{name:34}{item['rows']:>7}{item['median_ms']:>9.2f}"
+            f"{item['rows_per_sec'] or 0:>11.0f}{item['peak_kb']:>10.0f}  {stages}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
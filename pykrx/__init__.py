@@ -1,30 +1,34 @@
-import importlib.resources as resources
-import platform
+import importlib
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+from .font import install_font_hook, setup_font
 
-from . import bond, stock
+# matplotlib 글꼴 설정과 하위 패키지 import는 처음 사용할 때 수행한다.
+install_font_hook()
 
-os = platform.system()
+_SUBMODULES = ("analytics", "bond", "stock")
 
-if os == "Darwin":
-    plt.rc("font", family="AppleGothic")
-else:
-    with resources.path("pykrx", "NanumBarunGothic.ttf") as font_path:
-        fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
-        fm.fontManager.ttflist.insert(0, fe)
-        plt.rc("font", family=fe.name)
+__all__ = ["analytics", "bond", "setup_font", "stock"]
 
-plt.rcParams["axes.unicode_minus"] = False
 
-__all__ = ["bond", "stock"]
+def _version() -> str:
+    # Version is automatically managed by setuptools_scm from git tags
+    try:
+        from importlib.metadata import version
 
-# Version is automatically managed by setuptools_scm from git tags
-try:
-    from importlib.metadata import version
+        return version("pykrx")
+    except Exception:
+        # Fallback for development/editable installs without metadata
+        return "0.0.0+unknown"
 
-    __version__ = version("pykrx")
-except Exception:
-    # Fallback for development/editable installs without metadata
-    __version__ = "0.0.0+unknown"
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    if name == "__version__":
+        globals()["__version__"] = _version()
+        return globals()["__version__"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES) | {"__version__"})
@@ -0,0 +1,45 @@
+from .curve import (
+    SPREADS,
+    TENORS,
+    get_yield_curve_spreads,
+    interpolate_yield_curve,
+)
+from .indicators import (
+    WEEKS_52,
+    bollinger_bands,
+    high_low_52w,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    rsi,
+)
+from .options import (
+    black_greeks,
+    black_price,
+    get_option_greeks,
+    implied_volatility,
+    norm_cdf,
+    norm_pdf,
+)
+
+__all__ = [
+    "SPREADS",
+    "TENORS",
+    "WEEKS_52",
+    "black_greeks",
+    "black_price",
+    "bollinger_bands",
+    "get_option_greeks",
+    "get_yield_curve_spreads",
+    "high_low_52w",
+    "implied_volatility",
+    "interpolate_yield_curve",
+    "norm_cdf",
+    "norm_pdf",
+    "rolling_max",
+    "rolling_mean",
+    "rolling_min",
+    "rolling_std",
+    "rsi",
+]
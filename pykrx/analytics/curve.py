@@ -0,0 +1,143 @@
+import numpy as np
+from pandas import DataFrame
+
+# 국고채 수익률 곡선의 만기 (년). CD(91일)는 단기 구간의 기준으로 사용한다.
+TENORS = {
+    "CD": 0.25,
+    "국고채1년": 1.0,
+    "국고채2년": 2.0,
+    "국고채3년": 3.0,
+    "국고채5년": 5.0,
+    "국고채10년": 10.0,
+    "국고채20년": 20.0,
+    "국고채30년": 30.0,
+}
+
+# 기본 스프레드: {이름: (장기 또는 위험 채권, 기준 채권)}
+SPREADS = {
+    "10년-3년": ("국고채10년", "국고채3년"),
+    "10년-2년": ("국고채10년", "국고채2년"),
+    "30년-10년": ("국고채30년", "국고채10년"),
+    "3년-CD": ("국고채3년", "CD"),
+    "AA-국고채3년": ("회사채AA", "국고채3년"),
+    "BBB-국고채3년": ("회사채BBB", "국고채3년"),
+}
+
+_METHODS = ["linear", "monotone"]
+
+
+def _nodes(curve: DataFrame) -> tuple:
+    columns = sorted((x for x in curve.columns if x in TENORS), key=TENORS.get)
+    if len(columns) < 2:
+        raise ValueError("보간에는 TENORS의 만기가 2개 이상 필요합니다.")
+    x = np.array([TENORS[c] for c in columns])
+    y = curve[columns].to_numpy(dtype=np.float64)
+    return x, y
+
+
+def _pchip_slopes(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Fritsch-Carlson 방식의 단조 보존 3차 Hermite 미분값 (행마다 독립)"""
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+    if len(x) == 2:
+        return np.hstack([delta, delta])
+
+    m = np.zeros_like(y)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    d0, d1 = delta[:, :-1], delta[:, 1:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        harmonic = (w1 + w2) / (w1 / d0 + w2 / d1)
+    m[:, 1:-1] = np.where(d0 * d1 > 0, harmonic, 0.0)
+    m[:, 1:-1] = np.where(np.isnan(d0) | np.isnan(d1), np.nan, m[:, 1:-1])
+
+    def edge(h0, h1, d0, d1):
+        d = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+        d = np.where(np.sign(d) != np.sign(d0), 0.0, d)
+        limit = (np.sign(d0) != np.sign(d1)) & (np.abs(d) > 3 * np.abs(d0))
+        return np.where(limit, 3 * d0, d)
+
+    m[:, 0] = edge(h[0], h[1], delta[:, 0], delta[:, 1])
+    m[:, -1] = edge(h[-1], h[-2], delta[:, -1], delta[:, -2])
+    return m
+
+
+def interpolate_yield_curve(
+    curve: DataFrame, tenors: list, method: str = "linear"
+) -> DataFrame:
+    """수익률 곡선을 원하는 만기로 보간
+
+    모든 일자를 한 번에 계산한다. 보간 구간은 만기 축에서만 정해지므로
+    searchsorted를 한 번만 수행하고, 일자 축은 배열 연산으로 처리한다.
+    가장 짧거나 긴 만기 밖은 양 끝 수익률로 고정한다. 보간에 사용하는
+    만기의 수익률이 없는 일자는 NaN이다.
+
+    Args:
+        curve  (DataFrame    ): get_otc_treasury_yield_curve의 결과
+        tenors (list         ): 보간할 만기 (년)
+        method (str, optional): linear - 선형 / monotone - 단조 보존 3차 보간
+
+    Returns:
+        DataFrame: 일자 index, 만기 columns인 수익률 DataFrame
+    """
+    if method not in _METHODS:
+        raise ValueError(f"{method}: method는 {_METHODS} 중 하나입니다.")
+    x, y = _nodes(curve)
+    q = np.clip(np.asarray(tenors, dtype=np.float64), x[0], x[-1])
+    i = np.clip(np.searchsorted(x, q, side="right") - 1, 0, len(x) - 2)
+    h = x[i + 1] - x[i]
+    t = (q - x[i]) / h
+    y0, y1 = y[:, i], y[:, i + 1]
+
+    if method == "linear":
+        values = (1 - t) * y0 + t * y1
+    else:
+        m = _pchip_slopes(x, y)
+        t2, t3 = t * t, t * t * t
+        values = (
+            (2 * t3 - 3 * t2 + 1) * y0
+            + (t3 - 2 * t2 + t) * h * m[:, i]
+            + (-2 * t3 + 3 * t2) * y1
+            + (t3 - t2) * h * m[:, i + 1]
+        )
+    return DataFrame(values, index=curve.index, columns=list(tenors))
+
+
+def get_yield_curve_spreads(curve: DataFrame, spreads: dict = None) -> DataFrame:
+    """수익률 곡선의 스프레드, 곡률과 기울기 (bp)
+
+    - spreads의 (A, B)마다 A - B
+    - 곡률: 2 x 국고채5년 - 국고채3년 - 국고채10년
+    - 기울기: 일자마다 TENORS의 수익률을 만기 (년)에 회귀한 기울기 (bp/년).
+      수익률이 없는 만기는 그 일자의 회귀에서 제외한다.
+
+    Args:
+        curve   (DataFrame): get_otc_treasury_yield_curve의 결과
+        spreads (dict, optional): {이름: (A, B)}. 입력하지 않으면 SPREADS 중
+                                  curve에 있는 채권종류의 스프레드
+
+    Returns:
+        DataFrame: 일자 index, 스프레드 이름/곡률/기울기 columns인 DataFrame
+    """
+    if spreads is None:
+        spreads = {k: v for k, v in SPREADS.items() if set(v) <= set(curve.columns)}
+    df = DataFrame(index=curve.index)
+    for name, (a, b) in spreads.items():
+        df[name] = (curve[a] - curve[b]) * 100
+    if {"국고채3년", "국고채5년", "국고채10년"} <= set(curve.columns):
+        df["곡률"] = (
+            2 * curve["국고채5년"] - curve["국고채3년"] - curve["국고채10년"]
+        ) * 100
+
+    x, y = _nodes(curve)
+    valid = ~np.isnan(y)
+    n = valid.sum(axis=1)
+    xs = np.where(valid, x, 0.0)
+    ys = np.where(valid, y, 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mx = xs.sum(axis=1) / n
+        my = ys.sum(axis=1) / n
+        dx = np.where(valid, x - mx[:, None], 0.0)
+        slope = (dx * (ys - my[:, None])).sum(axis=1) / (dx * dx).sum(axis=1)
+    df["기울기"] = np.where(n >= 2, slope * 100, np.nan)
+    return df
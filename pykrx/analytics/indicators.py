@@ -0,0 +1,244 @@
+import functools
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+# 52주 고가/저가의 영업일 수
+WEEKS_52 = 252
+
+_BANDS = ["중심선", "상단", "하단"]
+_RSI_METHODS = ["sma", "wilder"]
+
+
+def _jit(func):
+    """numba가 설치되어 있으면 처음 호출할 때 func를 컴파일한다.
+
+    numba가 없으면 func를 그대로 사용한다. func는 종목 축을 numpy 배열
+    연산으로 처리하고 날짜 축만 반복하므로 컴파일하지 않아도 동작한다.
+    """
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                import numba
+            except ImportError:
+                compiled = func
+            else:
+                compiled = numba.njit(cache=True)(func)
+        return compiled(*args)
+
+    return wrapper
+
+
+def _values(panel) -> np.ndarray:
+    return np.asarray(panel, dtype=np.float64)
+
+
+def _wrap(values: np.ndarray, panel) -> DataFrame:
+    if isinstance(panel, DataFrame):
+        return DataFrame(values, index=panel.index, columns=panel.columns)
+    return DataFrame(values)
+
+
+def _window_sum(a: np.ndarray, window: int) -> np.ndarray:
+    """axis 0 방향으로 [t - window + 1, t] 구간의 합
+
+    누적합의 차로 구하므로 window와 관계없이 배열 연산 몇 번으로 끝난다.
+    """
+    c = np.cumsum(a, axis=0)
+    out = np.empty_like(c)
+    out[:window] = c[:window]
+    np.subtract(c[window:], c[:-window], out=out[window:])
+    return out
+
+
+def _window_count(nan: np.ndarray, window: int) -> np.ndarray:
+    """구간 안의 NaN이 아닌 값의 수. NaN이 없으면 계산 없이 만든다."""
+    if not nan.any():
+        return np.minimum(np.arange(1, nan.shape[0] + 1), window)[:, None]
+    return _window_sum(~nan, window)
+
+
+def _rolling_mean_std(
+    x: np.ndarray, window: int, ddof: int = 1, std: bool = True
+) -> tuple:
+    """NaN을 제외한 이동 평균과 표준편차
+
+    누적합의 자릿수 손실을 줄이기 위해 종목마다 첫 값을 빼고 더한다.
+    구간 안의 값이 window개보다 적으면 NaN이다 (pandas rolling과 같다).
+    """
+    nan = np.isnan(x)
+    first = np.argmax(~nan, axis=0)
+    offset = x[first, np.arange(x.shape[1])]
+    offset = np.where(np.isnan(offset), 0.0, offset)
+    v = x - offset
+    if nan.any():
+        v[nan] = 0.0
+    n = _window_count(nan, window)
+    s = _window_sum(v, window)
+    full = n >= window
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = s / n
+        if std:
+            var = (_window_sum(v * v, window) - s * mean) / (n - ddof)
+            std = np.where(full, np.sqrt(np.maximum(var, 0)), np.nan)
+        else:
+            std = None
+    return np.where(full, mean + offset, np.nan), std
+
+
+def _rolling_extreme(x: np.ndarray, window: int, ufunc) -> np.ndarray:
+    """van Herk/Gil-Werman 방식의 이동 최대/최소
+
+    날짜 축을 window 크기의 블록으로 나눠 블록 안의 앞쪽 누적값과 뒤쪽
+    누적값을 구하면, 모든 구간의 값은 두 누적값 하나씩의 비교로 끝난다.
+    window와 관계없이 원소마다 상수 번의 비교만 한다.
+    """
+    n, m = x.shape
+    out = np.full((n, m), np.nan)
+    if window > n:
+        return out
+    nan = np.isnan(x)
+    fill = -np.inf if ufunc is np.maximum else np.inf
+    blocks = -(-n // window)
+    padded = np.full((blocks * window, m), fill)
+    padded[:n] = x
+    padded[:n][nan] = fill
+    shaped = padded.reshape(blocks, window, m)
+    prefix = ufunc.accumulate(shaped, axis=1).reshape(-1, m)
+    suffix = ufunc.accumulate(shaped[:, ::-1], axis=1)[:, ::-1].reshape(-1, m)
+
+    ufunc(suffix[: n - window + 1], prefix[window - 1 : n], out=out[window - 1 :])
+    return np.where(_window_count(nan, window) >= window, out, np.nan)
+
+
+def rolling_mean(panel, window: int) -> DataFrame:
+    """이동 평균
+
+    panel.rolling(window).mean()과 같은 값을 전 종목에 대해 한 번에 구한다.
+    구간 안의 값이 window개보다 적으면 NaN이다.
+
+    Args:
+        panel  (DataFrame): 날짜 index, 티커 columns인 DataFrame (예:
+                            PanelStore.frame("종가"))
+        window (int      ): 이동 구간의 영업일 수
+
+    Returns:
+        DataFrame: panel과 같은 모양의 float64 DataFrame
+    """
+    return _wrap(_rolling_mean_std(_values(panel), window, std=False)[0], panel)
+
+
+def rolling_std(panel, window: int, ddof: int = 1) -> DataFrame:
+    """이동 표준편차 (panel.rolling(window).std(ddof)와 같다)"""
+    return _wrap(_rolling_mean_std(_values(panel), window, ddof)[1], panel)
+
+
+def rolling_max(panel, window: int) -> DataFrame:
+    """이동 최대 (panel.rolling(window).max()와 같다)"""
+    return _wrap(_rolling_extreme(_values(panel), window, np.maximum), panel)
+
+
+def rolling_min(panel, window: int) -> DataFrame:
+    """이동 최소 (panel.rolling(window).min()와 같다)"""
+    return _wrap(_rolling_extreme(_values(panel), window, np.minimum), panel)
+
+
+def bollinger_bands(panel, window: int = 20, k: float = 2.0) -> DataFrame:
+    """볼린저 밴드
+
+    Args:
+        panel  (DataFrame): 날짜 index, 티커 columns인 종가 DataFrame
+        window (int  , optional): 이동 구간의 영업일 수
+        k      (float, optional): 표준편차 배수
+
+    Returns:
+        DataFrame: 날짜 index, (중심선/상단/하단, 티커) columns인 DataFrame
+    """
+    mean, std = _rolling_mean_std(_values(panel), window)
+    return pd.concat(
+        [_wrap(x, panel) for x in (mean, mean + k * std, mean - k * std)],
+        axis=1,
+        keys=_BANDS,
+    )
+
+
+def high_low_52w(high, low=None, window: int = WEEKS_52) -> DataFrame:
+    """52주 (window 영업일) 최고가와 최저가
+
+    Args:
+        high   (DataFrame): 날짜 index, 티커 columns인 고가 DataFrame
+        low    (DataFrame, optional): 저가 DataFrame. 입력하지 않으면 high로
+                                      최저가도 구한다 (예: 종가 기준).
+        window (int      , optional): 구간의 영업일 수
+
+    Returns:
+        DataFrame: 날짜 index, (최고가/최저가, 티커) columns인 DataFrame
+    """
+    low = high if low is None else low
+    return pd.concat(
+        [rolling_max(high, window), rolling_min(low, window)],
+        axis=1,
+        keys=["최고가", "최저가"],
+    )
+
+
+@_jit
+def _wilder_mean(x, window):
+    """Wilder 평활 평균. 첫 window개 값의 단순 평균에서 시작하고, NaN은
+    건너뛰어 평활 상태를 유지한다."""
+    n, m = x.shape
+    out = np.full((n, m), np.nan)
+    state = np.zeros(m)
+    count = np.zeros(m)
+    for i in range(n):
+        row = x[i]
+        valid = ~np.isnan(row)
+        v = np.where(valid, row, 0.0)
+        count += valid.astype(np.float64)
+        warm = valid & (count <= window)
+        state = np.where(warm, state + v / window, state)
+        smooth = valid & (count > window)
+        state = np.where(smooth, state + (v - state) / window, state)
+        out[i] = np.where(count >= window, state, np.nan)
+    return out
+
+
+def rsi(panel, window: int = 14, method: str = "sma") -> DataFrame:
+    """상대강도지수 (RSI)
+
+    method가 sma이면 상승폭과 하락폭의 window 이동 평균으로 계산한다
+    (delta.clip(lower=0).rolling(window).mean()을 쓰는 흔한 구현과 같다).
+    wilder이면 Wilder 평활 평균을 사용한다. Wilder 평활은 날짜마다 이전
+    값에 의존하므로 날짜 축을 반복하며, numba가 설치되어 있으면 컴파일해서
+    실행한다.
+
+    Args:
+        panel  (DataFrame): 날짜 index, 티커 columns인 종가 DataFrame
+        window (int, optional): 평균 구간의 영업일 수
+        method (str, optional): sma - 단순 이동 평균 / wilder - Wilder 평활
+
+    Returns:
+        DataFrame: panel과 같은 모양의 0 ~ 100 값 DataFrame. 상승과 하락이 모두
+                   없는 구간은 NaN이다.
+    """
+    if method not in _RSI_METHODS:
+        raise ValueError(f"{method}: method는 {_RSI_METHODS} 중 하나입니다.")
+    x = _values(panel)
+    delta = np.full_like(x, np.nan)
+    delta[1:] = x[1:] - x[:-1]
+    gain = np.where(np.isnan(delta), np.nan, np.maximum(delta, 0))
+    loss = np.where(np.isnan(delta), np.nan, np.maximum(-delta, 0))
+    if method == "sma":
+        gain = _rolling_mean_std(gain, window, std=False)[0]
+        loss = _rolling_mean_std(loss, window, std=False)[0]
+    else:
+        gain = _wilder_mean(gain, window)
+        loss = _wilder_mean(loss, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = 100 * gain / (gain + loss)
+    return _wrap(values, panel)
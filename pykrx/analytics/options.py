@@ -0,0 +1,263 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+_SQRT_2PI = np.sqrt(2 * np.pi)
+
+# Hart (1968)의 누적 정규분포 근사 계수. 절대 오차는 1e-15 이내다.
+_HART_NUM = [
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+    220.206867912376,
+]
+_HART_DEN = [
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+    440.413735824752,
+]
+
+_GREEKS = ["델타", "감마", "베가", "세타"]
+
+
+def norm_pdf(x: np.ndarray) -> np.ndarray:
+    """표준 정규분포의 확률밀도"""
+    x = np.asarray(x, dtype=np.float64)
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def norm_cdf(x: np.ndarray) -> np.ndarray:
+    """표준 정규분포의 누적분포
+
+    scipy 없이 배열 전체를 한 번에 계산하기 위해 Hart의 유리 함수 근사를
+    사용한다.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    z = np.abs(x)
+    e = np.exp(-0.5 * z * z)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        tail = e * np.polyval(_HART_NUM, z) / np.polyval(_HART_DEN, z)
+        b = z + 1 / (z + 2 / (z + 3 / (z + 4 / (z + 0.65))))
+        far = e / b / _SQRT_2PI
+    tail = np.where(z < 7.07106781186547, tail, far)
+    tail = np.where(z < 37, tail, 0.0)
+    return np.where(x > 0, 1 - tail, tail)
+
+
+def _d1(forward, strike, t, vol):
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (np.log(forward / strike) + 0.5 * vol * vol * t) / (vol * np.sqrt(t))
+
+
+def black_price(forward, strike, t, vol, discount=1.0, call=True) -> np.ndarray:
+    """Black 모형의 유럽형 옵션 가격
+
+    Args:
+        forward  : 선도 가격
+        strike   : 행사가
+        t        : 잔존기간 (년)
+        vol      : 변동성 (연율)
+        discount : 만기까지의 할인계수
+        call     : 콜옵션 여부 (bool 배열 가능)
+
+    Returns:
+        np.ndarray: 옵션 가격. 인자는 numpy broadcasting 규칙으로 맞춘다.
+    """
+    forward, strike, t, vol, discount, call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (forward, strike, t, vol)),
+        np.asarray(discount, dtype=np.float64),
+        np.asarray(call, dtype=bool),
+    )
+    d1 = _d1(forward, strike, t, vol)
+    d2 = d1 - vol * np.sqrt(t)
+    sign = np.where(call, 1.0, -1.0)
+    return (
+        discount * sign * (forward * norm_cdf(sign * d1) - strike * norm_cdf(sign * d2))
+    )
+
+
+def implied_volatility(
+    price,
+    forward,
+    strike,
+    t,
+    discount=1.0,
+    call=True,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """Black 모형의 내재변동성
+
+    풋은 풋-콜 패리티로 콜 가격으로 바꾼 뒤, 모든 옵션을 한 번에 Newton
+    방법으로 푼다. 매 반복에서 해를 감싸는 구간을 줄여 두고, Newton 단계가
+    구간을 벗어나거나 베가가 너무 작으면 이분법 단계로 대신한다. 수렴한
+    옵션은 다음 반복에서 제외한다.
+
+    가격이 무차익 범위 (내재가치, 할인된 선도가격) 밖이거나 잔존기간이 0
+    이하면 NaN이다.
+
+    Args:
+        price    : 옵션 가격
+        forward  : 선도 가격
+        strike   : 행사가
+        t        : 잔존기간 (년)
+        discount : 만기까지의 할인계수
+        call     : 콜옵션 여부 (bool 배열 가능)
+        tol      (float, optional): 가격 오차의 허용 범위
+        max_iter (int  , optional): 최대 반복 수
+
+    Returns:
+        np.ndarray: 연율 내재변동성
+    """
+    price, forward, strike, t, discount, call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (price, forward, strike, t)),
+        np.asarray(discount, dtype=np.float64),
+        np.asarray(call, dtype=bool),
+    )
+    shape = price.shape
+    price, forward, strike, t, discount, call = (
+        x.ravel() for x in (price, forward, strike, t, discount, call)
+    )
+    # 풋-콜 패리티: C = P + D (F - K)
+    c = np.where(call, price, price + discount * (forward - strike))
+    lower = discount * np.maximum(forward - strike, 0)
+    upper = discount * forward
+    valid = (t > 0) & (c > lower) & (c < upper) & (strike > 0)
+
+    vol = np.full(c.shape, np.nan)
+    idx = np.flatnonzero(valid)
+    c, f, k, tt, d = c[idx], forward[idx], strike[idx], t[idx], discount[idx]
+    lo = np.full(idx.shape, 1e-6)
+    hi = np.full(idx.shape, 10.0)
+    # Brenner-Subrahmanyam 근사를 초기값으로 사용한다.
+    x = np.clip(_SQRT_2PI * c / (d * f * np.sqrt(tt)), 0.01, 3.0)
+
+    for _ in range(max_iter):
+        if not len(idx):
+            break
+        d1 = _d1(f, k, tt, x)
+        d2 = d1 - x * np.sqrt(tt)
+        diff = d * (f * norm_cdf(d1) - k * norm_cdf(d2)) - c
+        vega = d * f * norm_pdf(d1) * np.sqrt(tt)
+
+        done = np.abs(diff) < tol
+        vol[idx[done]] = x[done]
+        hi = np.where(diff > 0, x, hi)
+        lo = np.where(diff > 0, lo, x)
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            step = x - diff / vega
+        bisect = ~((step > lo) & (step < hi)) | (vega < 1e-12)
+        x = np.where(bisect, (lo + hi) / 2, step)
+
+        keep = ~done & (hi - lo > 1e-12)
+        vol[idx[~done & ~keep]] = x[~done & ~keep]
+        idx, c, f, k, tt, d = (a[keep] for a in (idx, c, f, k, tt, d))
+        lo, hi, x = lo[keep], hi[keep], x[keep]
+    return vol.reshape(shape)
+
+
+def black_greeks(forward, strike, t, vol, discount=1.0, call=True) -> dict:
+    """Black 모형의 민감도
+
+    Returns:
+        dict: {"델타": 선도가격 1 변화, "감마": 델타의 선도가격 1 변화,
+               "베가": 변동성 1%p 변화, "세타": 1일 경과}에 대한 가격 변화
+    """
+    forward, strike, t, vol, discount, call = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (forward, strike, t, vol)),
+        np.asarray(discount, dtype=np.float64),
+        np.asarray(call, dtype=bool),
+    )
+    sqrt_t = np.sqrt(t)
+    d1 = _d1(forward, strike, t, vol)
+    pdf = norm_pdf(d1)
+    price = black_price(forward, strike, t, vol, discount, call)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rate = -np.log(discount) / t
+        gamma = discount * pdf / (forward * vol * sqrt_t)
+        theta = -discount * forward * pdf * vol / (2 * sqrt_t) + rate * price
+    return {
+        "델타": discount * np.where(call, norm_cdf(d1), norm_cdf(d1) - 1),
+        "감마": gamma,
+        "베가": discount * forward * pdf * sqrt_t / 100,
+        "세타": theta / 365,
+    }
+
+
+def _implied_forward(chain: DataFrame, price: str, discount: pd.Series) -> pd.Series:
+    """만기월마다 콜과 풋의 가격 차이가 가장 작은 행사가에서 패리티로 구한
+    선도가격"""
+    traded = chain[chain[price] > 0]
+    prices = traded.pivot_table(
+        index=["만기월", "행사가"], columns="구분", values=price
+    ).reindex(columns=["C", "P"])
+    diff = (prices["C"] - prices["P"]).dropna()
+    if diff.empty:
+        return pd.Series(dtype=np.float64)
+    atm = diff.abs().groupby(level="만기월").idxmin()
+    diff = diff[atm]
+    month = diff.index.get_level_values("만기월")
+    strike = diff.index.get_level_values("행사가")
+    forward = strike + diff.to_numpy() / discount[month].to_numpy()
+    return pd.Series(forward, index=month)
+
+
+def get_option_greeks(
+    chain: DataFrame,
+    date: str,
+    rate: float = 0.035,
+    forward=None,
+    price: str = "종가",
+) -> DataFrame:
+    """옵션 전 종목의 내재변동성과 민감도
+
+    잔존기간은 date부터 최종거래일까지의 달력일 / 365이다. forward를
+    입력하지 않으면 만기월마다 풋-콜 패리티로 선도가격을 구한다.
+
+        >> chain = stock.get_option_chain("20220902", "KRDRVOPK2I")
+        >> get_option_greeks(chain, "20220902")
+
+    Args:
+        chain    (DataFrame       ): get_option_chain의 결과
+        date     (str             ): 기준 일자 (YYYYMMDD)
+        rate     (float, optional ): 무위험 이자율 (연율, 연속 복리)
+        forward                    : 선도가격. 스칼라나 만기월 index의 Series
+        price    (str  , optional ): 내재변동성을 구할 가격 열 (종가/정산가)
+
+    Returns:
+        DataFrame: chain에 잔존기간/선도가/내재변동성/델타/감마/베가/세타
+                   열을 더한 DataFrame. 가격이 0이거나 무차익 범위 밖인
+                   종목의 값은 NaN이다.
+    """
+    if chain.empty:
+        return DataFrame()
+    df = chain.copy()
+    t = (df["최종거래일"] - pd.Timestamp(date)).dt.days.to_numpy() / 365
+    discount = np.exp(-rate * t)
+    if forward is None:
+        by_month = pd.Series(discount, index=df["만기월"].to_numpy())
+        by_month = by_month[~by_month.index.duplicated()]
+        forward = _implied_forward(df, price, by_month)
+    if isinstance(forward, pd.Series):
+        forward = df["만기월"].map(forward).to_numpy(dtype=np.float64)
+
+    call = (df["구분"] == "C").to_numpy()
+    strike = df["행사가"].to_numpy(dtype=np.float64)
+    premium = df[price].to_numpy(dtype=np.float64)
+    vol = implied_volatility(premium, forward, strike, t, discount, call)
+
+    df["잔존기간"] = t
+    df["선도가"] = forward
+    df["내재변동성"] = vol
+    greeks = black_greeks(forward, strike, t, vol, discount, call)
+    for name in _GREEKS:
+        df[name] = greeks[name]
+    return df
@@ -1,3 +1,4 @@
+import datetime
 from sqlite3 import NotSupportedError
 
 from pandas import DataFrame
@@ -76,6 +77,41 @@ def get_otc_treasury_yields(*args) -> DataFrame:
     return df
 
 
+def get_otc_treasury_yield_curve(
+    fromdate: str, todate: str, tickers: list = None
+) -> DataFrame:
+    """장외 채권수익률의 일자 x 채권종류 행렬
+
+    get_otc_treasury_yields(fromdate, todate, ticker)를 채권종류마다 동시에
+    조회해서 합친다. pykrx.analytics의 interpolate_yield_curve와
+    get_yield_curve_spreads로 보간과 스프레드를 계산할 수 있다.
+
+    Args:
+        fromdate (str ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list, optional): 장외 채권 티커 목록. 입력하지 않으면
+                                   11개 전체
+
+    Returns:
+        DataFrame:
+
+        > get_otc_treasury_yield_curve("20220104", "20220105")
+
+                        국고채1년  국고채2년  국고채3년  국고채5년  ...
+            일자
+            2022-01-04      1.299      1.717      1.859      2.032  ...
+            2022-01-05      1.340      1.791      1.945      2.127  ...
+    """
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+    return krx.get_otc_treasury_yield_curve(fromdate, todate, tickers)
+
+
 if __name__ == "__main__":
     # df = get_otc_treasury_yields("20220204")
     # print(df)
@@ -0,0 +1,56 @@
+import importlib.resources as resources
+import importlib.util
+import platform
+import sys
+
+
+def setup_font():
+    """matplotlib의 기본 글꼴을 한글 글꼴로 설정한다.
+
+    macOS는 AppleGothic을, 그 외 OS는 pykrx에 포함된 NanumBarunGothic을
+    사용한다. matplotlib.pyplot을 처음 import할 때 자동으로 호출된다.
+    """
+    import matplotlib
+    import matplotlib.font_manager as fm
+
+    if platform.system() == "Darwin":
+        matplotlib.rc("font", family="AppleGothic")
+    else:
+        with resources.path("pykrx", "NanumBarunGothic.ttf") as font_path:
+            fe = fm.FontEntry(fname=str(font_path), name="NanumBarunGothic")
+            fm.fontManager.ttflist.insert(0, fe)
+            matplotlib.rc("font", family=fe.name)
+
+    matplotlib.rcParams["axes.unicode_minus"] = False
+
+
+class _PyplotHook:
+    """matplotlib.pyplot이 import된 직후 setup_font를 호출하는 meta path finder"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != "matplotlib.pyplot":
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is None or spec.loader is None:
+            return spec
+
+        exec_module = spec.loader.exec_module
+
+        def _exec_module(module):
+            exec_module(module)
+            setup_font()
+
+        spec.loader.exec_module = _exec_module
+        return spec
+
+
+def install_font_hook():
+    """matplotlib을 사용하는 시점까지 글꼴 설정을 미룬다.
+
+    이미 matplotlib.pyplot이 import되어 있으면 바로 글꼴을 설정한다.
+    """
+    if "matplotlib.pyplot" in sys.modules:
+        setup_font()
+    elif not any(isinstance(x, _PyplotHook) for x in sys.meta_path):
+        sys.meta_path.insert(0, _PyplotHook())
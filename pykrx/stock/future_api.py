@@ -1,9 +1,12 @@
 import datetime
 import re
 
+import pandas as pd
 from pandas import DataFrame
 
+from pykrx.stock.stock_api import get_previous_business_days
 from pykrx.website import krx
+from pykrx.website.comm import concurrent_map
 
 yymmdd = re.compile(r"\d{4}[-/]?\d{2}[-/]?\d{2}")
 
@@ -48,20 +51,25 @@ def get_future_ohlcv(*args, **kwargs):
 
         fromdate     (str           ): 조회 시작 일자 (YYYYMMDD)
         todate       (str           ): 조회 종료 일자 (YYYYMMDD)
-        ticker       (str,  optional): 조회할 종목의 티커
-        freq         (str,  optional): d - 일 / m - 월 / y - 년
-        adjusted     (bool, optional): 수정 종가 여부 (True/False)
+        prod         (str           ): 조회 상품
 
         특정 일자의 전종목 OHLCV 조회
 
         date   (str): 조회 일자 (YYYYMMDD)
+        prod   (str): 조회 상품
 
     Returns:
         DataFrame:
 
-            특정 종목의 지정된 기간 OHLCV 조회
-            >> get_future_ohlcv("20210118", "20210126", "xxx")
-                미구현
+            특정 상품의 지정된 기간 OHLCV 조회
+            >> get_future_ohlcv("20220901", "20220902", "KRDRVFUK2I")
+
+                                                     종목명    종가  ...
+            날짜       종목코드
+            2022-09-01 101S9000  코스피200 F 202209 (주간)  314.50  ...
+                       101SC000  코스피200 F 202212 (주간)  315.50  ...
+            2022-09-02 101S9000  코스피200 F 202209 (주간)  313.85  ...
+                       101SC000  코스피200 F 202212 (주간)  314.75  ...
 
             특정 일자의 전종목 OHLCV 조회
             >> get_market_ohlcv("20210122")
@@ -77,12 +85,87 @@ def get_future_ohlcv(*args, **kwargs):
 
     dates = list(filter(yymmdd.match, [str(x) for x in args]))
     if len(dates) == 2 or ("fromdate" in kwargs and "todate" in kwargs):
-        raise NotImplementedError
-        # return get_future_ohlcv_by_date(*args, **kwargs)
+        return get_future_ohlcv_by_date(*args, **kwargs)
     else:
         return get_future_ohlcv_by_ticker(*args, **kwargs)
 
 
+def get_future_ohlcv_by_date(fromdate: str, todate: str, prod: str) -> DataFrame:
+    """특정 상품의 지정된 기간 전종목 OHLCV
+
+    KRX는 상품의 시세를 일자별 전종목 단면으로만 제공하므로, 기간의 영업일마다
+    get_future_ohlcv_by_ticker를 동시에 호출해서 합친다.
+
+    Args:
+        fromdate (str): 조회 시작 일자 (YYYYMMDD)
+        todate   (str): 조회 종료 일자 (YYYYMMDD)
+        prod     (str): 조회 상품
+
+    Returns:
+        DataFrame: (날짜, 종목코드) index의 get_future_ohlcv_by_ticker 열
+    """
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+
+    days = get_previous_business_days(fromdate=fromdate, todate=todate)
+    frames = concurrent_map(
+        lambda x: krx.get_future_ohlcv_by_ticker(x.strftime("%Y%m%d"), prod), days
+    )
+    frames = {k: v for k, v in zip(days, frames, strict=True) if not v.empty}
+    if not frames:
+        return DataFrame()
+    return pd.concat(frames, names=["날짜", "종목코드"])
+
+
+def get_future_contract_info(prod: str) -> DataFrame:
+    """상품의 종목별 상장일/최종거래일/최종결제일 조회
+
+    Args:
+        prod (str): 조회 상품
+
+    Returns:
+        DataFrame:
+
+            >> get_future_contract_info("KRDRVFUK2I")
+
+                                   종목명     상장일  최종거래일  최종결제일  거래승수
+            종목코드
+            101S9000      코스피200 F 202209 2021-09-10 2022-09-08 2022-09-13    250000
+            101SC000      코스피200 F 202212 2019-12-13 2022-12-08 2022-12-09    250000
+    """  # pylint: disable=line-too-long # noqa: E501
+    return krx.get_future_contract_info(prod)
+
+
+def get_option_chain(date: str, prod: str = "KRDRVOPK2I") -> DataFrame:
+    """특정 일자의 옵션 전 종목 시세를 구분/만기/행사가 열로 정리
+
+    pykrx.analytics.get_option_greeks에 전달해서 내재변동성과 민감도를
+    계산할 수 있다.
+
+    Args:
+        date (str          ): 조회 일자 (YYYYMMDD)
+        prod (str, optional): 옵션 상품. 입력하지 않으면 코스피200 옵션
+
+    Returns:
+        DataFrame:
+
+            >> get_option_chain("20220902")
+
+                     구분  만기월  행사가  최종거래일   종가  정산가  거래량
+            종목코드
+            201S9300    C  202209   300.0  2022-09-08  14.20   14.20    1032
+            301S9300    P  202209   300.0  2022-09-08   0.41    0.41   40021
+    """  # pylint: disable=line-too-long # noqa: E501
+    if isinstance(date, datetime.datetime):
+        date = krx.datetime2string(date)
+    return krx.get_option_chain(date.replace("-", ""), prod)
+
+
 def get_future_ohlcv_by_ticker(
     date: str, prod: str, alternative: bool = False, prev: bool = True
 ) -> DataFrame:
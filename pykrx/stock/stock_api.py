@@ -1155,6 +1155,72 @@ def get_market_trading_volume_by_date(
     return resample_ohlcv(df, freq, sum)
 
 
+def get_market_investor_flow_by_date(
+    fromdate: str,
+    todate: str,
+    ticker: str,
+    etf: bool = False,
+    etn: bool = False,
+    elw: bool = False,
+    detail: bool = False,
+    measures: list = None,
+) -> DataFrame:
+    """투자자별 일별 매도/매수/순매수 거래량과 거래대금
+
+    get_market_trading_volume_by_date와 get_market_trading_value_by_date를
+    매도/매수/순매수로 각각 호출한 결과를 하나로 합친 것과 같다. 필요한
+    요청은 동시에 보내고 순매수는 매수 - 매도로 계산한다.
+    InvestorFlowCache().enable()로 결과를 보관하면 같은 구간을 다시
+    조회하거나, 상세 조회 후 일반 조회를 할 때 KRX에 다시 요청하지 않는다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYMMDD)
+        ticker   (str           ): 조회 종목 티커
+          - KOSPI/KOSDAQ/KONEX/ALL을 입력할 경우 전체 시장을 조회
+        etf      (bool          ): 시장 포함 여부 - KOSPI/KOSDAQ/KONEX/ALL
+                                   시장일 경우에만 유효
+        etn      (bool          ): 시장 포함 여부 - KOSPI/KOSDAQ/KONEX/ALL
+                                   시장일 경우에만 유효
+        elw      (bool          ): 시장 포함 여부 - KOSPI/KOSDAQ/KONEX/ALL
+                                   시장일 경우에만 유효
+        detail   (bool, optional): 상세조회 여부
+        measures (list, optional): 조회할 항목 (거래량/거래대금). 입력하지 않으면
+                                   모두 조회
+
+    Returns:
+        DataFrame:
+
+            >> get_market_investor_flow_by_date("20210115", "20210122", "005930")
+
+                                         거래량                         거래대금
+                                           매도      매수    순매수         매도  ...
+            날짜       투자자구분
+            2021-01-15 기관합계         9744915   4738800  -5006115  8.58e+11  ...
+                       기타법인          337815    626647    288832  2.97e+10  ...
+                       개인            23420340  30906125   7485785  2.06e+12  ...
+                       외국인합계       9925099   7156597  -2768502  8.73e+11  ...
+                       전체            43428169  43428169         0  3.82e+12  ...
+
+            특정 날짜의 투자자별 순매수 거래대금
+
+            >> df = get_market_investor_flow_by_date("20210115", "20210122", "005930")
+            >> df["거래대금"]["순매수"].unstack()
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+
+    return krx.get_market_investor_flow_by_date(
+        fromdate, todate, ticker, etf, etn, elw, detail, measures
+    )
+
+
 def get_market_net_purchases_of_equities(
     fromdate: str, todate: str, market: str = "KOSPI", investor: str = "개인"
 ) -> DataFrame:
@@ -1725,6 +1791,48 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
     return df
 
 
+@market_valid_check()
+def get_market_snapshot(
+    date, market: str = "KOSPI", alternative: bool = False
+) -> DataFrame:
+    """특정 일자의 전종목 OHLCV/시가총액/PER·PBR/외국인 한도소진률/업종 조회
+
+    get_market_ohlcv_by_ticker, get_market_cap_by_ticker,
+    get_market_fundamental_by_ticker,
+    get_exhaustion_rates_of_foreign_investment_by_ticker,
+    get_market_sector_classifications를 차례로 호출한 뒤 티커로 결합한 결과와
+    같다. 필요한 KRX 요청은 동시에 보내며 중복되는 응답은 한 번만 받는다.
+
+    Args:
+        date        (str           ): 조회 일자 (YYYYMMDD)
+        market      (str , optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        alternative (bool, optional): 휴일일 경우 이전 영업일 선택 여부
+
+    Returns:
+        DataFrame:
+
+            >> get_market_snapshot("20220902")
+
+                      종목명   시가   고가   저가   종가  거래량  ...  한도소진률    업종명
+            티커
+            095570  AJ네트웍스  7220  7350  7170  7280   56802  ...    3.900391  서비스업
+            006840    AK홀딩스 15750 16000 15700 15900   12483  ...    3.269531  기타금융
+            027410         BGF  3990  4010  3960  3990  164383  ...   11.148438  기타금융
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    if isinstance(date, datetime.datetime):
+        date = krx.datetime2string(date)
+
+    date = date.replace("-", "")
+
+    df = krx.get_market_snapshot_by_ticker(date, market)
+    holiday = df.empty or (df[["시가", "고가", "저가", "종가"]] == 0).all(axis=None)
+    if holiday and alternative:
+        target_date = get_nearest_business_day_in_a_week(date=date, prev=True)
+        df = krx.get_market_snapshot_by_ticker(target_date, market)
+    return df
+
+
 # -----------------------------------------------------------------------------
 # 공매도(SHORTING) API
 # -----------------------------------------------------------------------------
@@ -2627,6 +2735,74 @@ def get_etf_tracking_error(fromdate, todate, ticker) -> DataFrame:
     return krx.get_etf_tracking_error(fromdate, todate, ticker)
 
 
+def get_etf_nav_panel(fromdate: str, todate: str, tickers: list = None) -> DataFrame:
+    """여러 ETF의 종가/NAV/괴리율/지수/추적오차율 조회
+
+    get_etf_price_deviation과 get_etf_tracking_error를 ETF마다 동시에 호출하고
+    날짜 x ETF 행렬로 맞춘다.
+
+    Args:
+        fromdate (str           ): 조회 시작 일자 (YYYYMMDD)
+        todate   (str           ): 조회 종료 일자 (YYYYMMDD)
+        tickers  (list, optional): 조회할 ETF 티커 목록. 입력하지 않으면 전체 ETF
+
+    Returns:
+        DataFrame:
+
+            >> get_etf_nav_panel("20210104", "20210108", ["069500", "152100"])
+
+                            종가                NAV          ...
+                          069500  152100     069500   152100 ...
+            날짜
+            2021-01-04   40815.0 42345.0   40885.24 42401.17 ...
+            2021-01-05   41450.0 42975.0   41510.71 43002.53 ...
+
+            특정 날짜의 전체 ETF 괴리율
+
+            >> df = get_etf_nav_panel("20210104", "20210108")
+            >> df["괴리율"].loc["2021-01-08"]
+    """
+
+    if isinstance(fromdate, datetime.datetime):
+        fromdate = krx.datetime2string(fromdate)
+    if isinstance(todate, datetime.datetime):
+        todate = krx.datetime2string(todate)
+
+    fromdate = fromdate.replace("-", "")
+    todate = todate.replace("-", "")
+
+    return krx.get_etf_nav_panel(fromdate, todate, tickers)
+
+
+def get_etf_deviation_statistics(
+    fromdate: str,
+    todate: str,
+    tickers: list = None,
+    window: int = 20,
+    threshold: float = 3.0,
+) -> DataFrame:
+    """여러 ETF의 이동 괴리율, 추적오차와 괴리율 이상치 조회
+
+    Args:
+        fromdate  (str            ): 조회 시작 일자 (YYYYMMDD)
+        todate    (str            ): 조회 종료 일자 (YYYYMMDD)
+        tickers   (list , optional): 조회할 ETF 티커 목록. 입력하지 않으면 전체 ETF
+        window    (int  , optional): 이동 구간의 영업일 수
+        threshold (float, optional): 이상치로 볼 괴리율Z의 절대값
+
+    Returns:
+        DataFrame: 날짜 index, (통계, 티커) columns. 통계는 괴리율평균,
+                   괴리율표준편차, 괴리율Z, 이상치, 추적차이, 추적오차
+
+            괴리율이 평소와 크게 다른 ETF
+
+            >> df = get_etf_deviation_statistics("20210104", "20210331")
+            >> df["이상치"].loc["2021-03-31"].loc[lambda x: x].index
+    """
+    panel = get_etf_nav_panel(fromdate, todate, tickers)
+    return krx.get_etf_deviation_statistics(panel, window, threshold)
+
+
 @overload
 def get_etf_trading_volume_and_value(fromdate: str, todate: str) -> DataFrame: ...
 
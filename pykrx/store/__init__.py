@@ -0,0 +1,26 @@
+from .flows import FLOW_FIELDS, FlowStore, update_flows
+from .futures import FutureHistory
+from .membership import IndexMembership
+from .panel import PANEL_FIELDS, PanelStore, update_panel
+from .pdf import PDF_FIELDS, EtfPdfHistory
+from .shorting import SHORTING_FIELDS, ShortingStore, update_shorting
+from .warehouse import DATASETS, Dataset, Warehouse
+
+__all__ = [
+    "DATASETS",
+    "FLOW_FIELDS",
+    "PANEL_FIELDS",
+    "PDF_FIELDS",
+    "SHORTING_FIELDS",
+    "Dataset",
+    "EtfPdfHistory",
+    "FlowStore",
+    "FutureHistory",
+    "IndexMembership",
+    "PanelStore",
+    "ShortingStore",
+    "Warehouse",
+    "update_flows",
+    "update_panel",
+    "update_shorting",
+]
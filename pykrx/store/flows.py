@@ -0,0 +1,368 @@
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.store.panel import PanelStore
+from pykrx.website.comm import FreshnessPolicy, concurrent_map
+
+# 투자자별 거래실적의 저장 필드 (거래구분_매매구분). 순매수는 매수 - 매도로 읽는다.
+FLOW_FIELDS = ["거래량_매도", "거래량_매수", "거래대금_매도", "거래대금_매수"]
+
+# 상세조회/일반조회의 투자자구분 (KRX 화면 순서)
+FLOW_INVESTORS = {
+    True: [
+        "금융투자",
+        "보험",
+        "투신",
+        "사모",
+        "은행",
+        "기타금융",
+        "연기금",
+        "기타법인",
+        "개인",
+        "외국인",
+        "기타외국인",
+        "전체",
+    ],
+    False: ["기관합계", "기타법인", "개인", "외국인합계", "전체"],
+}
+
+
+class FlowStore(PanelStore):
+    """날짜 x 티커 x 투자자 거래실적을 필드별 int64 배열 파일로 저장하는 저장소
+
+    PanelStore와 같은 날짜/티커 축을 사용하고, 각 셀에 투자자구분 수만큼의
+    값을 저장한다. 필드 파일의 shape은 (날짜 수, ticker_capacity, 투자자 수)
+    이며 numpy.memmap으로 읽는다. "거래대금_순매수"처럼 순매수 필드를 요청하면
+    매수 - 매도를 계산해서 반환한다.
+
+        root/
+            meta.json           # 날짜 축, 티커 사전, 투자자구분, 열 폭
+            거래대금_매수.bin   # shape = (날짜 수, ticker_capacity, 투자자 수)
+            _present.bin        # 해당 (날짜, 티커)에 값이 있는지 여부 (uint8)
+            _checkpoint/        # update_flows가 진행 중인 구간 (완료되면 삭제)
+
+    Args:
+        root (str): 저장소 경로 (FlowStore.create로 먼저 생성)
+    """
+
+    CHECKPOINT = "_checkpoint"
+
+    @classmethod
+    def create(
+        cls, root: str, detail: bool = True, ticker_capacity: int = 4096
+    ) -> "FlowStore":
+        """빈 거래실적 저장소를 생성한다.
+
+        Args:
+            root            (str           ): 저장소 경로
+            detail          (bool, optional): 상세조회의 투자자구분으로 저장할지
+                                              여부
+            ticker_capacity (int , optional): 티커 축의 초기 폭
+
+        Returns:
+            FlowStore: 생성된 저장소
+        """
+        store = super().create(
+            root, dict.fromkeys(FLOW_FIELDS, "int64"), ticker_capacity
+        )
+        store._meta["investors"] = FLOW_INVESTORS[detail]
+        store._meta["detail"] = detail
+        cls._write_meta(store.root, store._meta)
+        store.reload()
+        return store
+
+    @property
+    def investors(self) -> pd.Index:
+        return pd.Index(self._meta["investors"], name="투자자구분")
+
+    @property
+    def detail(self) -> bool:
+        return self._meta["detail"]
+
+    def _depth(self, name: str) -> tuple:
+        return () if name == self.PRESENT else (len(self._meta["investors"]),)
+
+    # -------------------------------------------------------------------------
+    # read
+    def field(self, name: str, fromdate: str = None, todate: str = None) -> np.ndarray:
+        """필드를 (날짜, 티커, 투자자) 3차원 memmap으로 반환한다.
+
+        Args:
+            name     (str          ): 필드명. "거래량_순매수"/"거래대금_순매수"는
+                                      매수 - 매도를 계산한 새 배열
+            fromdate (str, optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str, optional): 조회 종료 일자 (YYYYMMDD)
+
+        Returns:
+            np.ndarray: shape = (날짜 수, 티커 수, 투자자 수)
+        """
+        if name.endswith("_순매수"):
+            measure = name[: -len("_순매수")]
+            buy = self.field(f"{measure}_매수", fromdate, todate)
+            return buy - self.field(f"{measure}_매도", fromdate, todate)
+
+        depth = self._depth(name)
+        n_dates = len(self._dates)
+        if n_dates == 0:
+            return np.empty((0, len(self._tickers)) + depth, dtype=self._dtype(name))
+        mm = np.memmap(
+            self.root / f"{name}.bin",
+            dtype=self._dtype(name),
+            mode="r",
+            shape=(n_dates, self.ticker_capacity) + depth,
+        )
+        return mm[self._date_slice(fromdate, todate), : len(self._tickers)]
+
+    def frame(
+        self,
+        name: str,
+        fromdate: str = None,
+        todate: str = None,
+        investor: str = "전체",
+    ) -> DataFrame:
+        """한 투자자구분의 필드를 날짜 index, 티커 columns인 DataFrame으로 반환한다.
+
+        >> store.frame("거래대금_순매수", "20240102", "20240131", "외국인")
+        """
+        rows = self._date_slice(fromdate, todate)
+        col = self.investors.get_loc(investor)
+        return DataFrame(
+            self.field(name, fromdate, todate)[:, :, col],
+            index=self._dates[rows].rename("날짜"),
+            columns=self._tickers,
+            copy=False,
+        )
+
+    # -------------------------------------------------------------------------
+    # write
+    def append(self, date, df: DataFrame):
+        """한 영업일의 거래실적을 날짜 축 끝에 추가한다.
+
+        Args:
+            date          : 추가할 일자. 저장된 마지막 일자보다 이후여야 한다.
+            df (DataFrame): 티커가 index이고 (필드, 투자자구분)이 columns인
+                            단면. 없는 필드와 투자자구분은 0으로 저장한다.
+        """
+        columns = pd.MultiIndex.from_product([self.fields, self.investors])
+        values = df.reindex(columns=columns, fill_value=0).to_numpy(dtype=np.int64)
+        values = values.reshape(len(df), len(self.fields), 1, len(self.investors))
+        rows = {x: i for i, x in enumerate(df.index)}
+        present = np.ones(1, dtype=bool)
+        self.extend([date], list(df.index), lambda x: (values[rows[x]], present))
+
+    def extend(self, dates: list, tickers: list, load, chunk: int = 16):
+        """여러 영업일의 값을 날짜 축 끝에 추가한다.
+
+        Args:
+            dates   (list): 추가할 영업일 목록 (오름차순). 저장된 마지막 일자
+                            이후여야 한다.
+            tickers (list): 티커 목록
+            load          : load(ticker) -> (values, present). values는 shape이
+                            (필드 수, 날짜 수, 투자자 수)인 int64 배열,
+                            present는 shape이 (날짜 수,)인 bool 배열
+            chunk   (int ): 한 번에 기록할 날짜 수
+        """
+        dates = pd.DatetimeIndex([pd.Timestamp(x) for x in dates])
+        if len(self._dates) and len(dates) and dates[0] <= self._dates[-1]:
+            raise ValueError(f"{dates[0]:%Y%m%d}: 날짜는 마지막 일자 이후여야 합니다.")
+
+        names = list(self._meta["tickers"])
+        for ticker in tickers:
+            if ticker not in self._ticker_id:
+                self._ticker_id[ticker] = len(names)
+                names.append(ticker)
+        self._recover(clean=True)
+        if len(names) > self.ticker_capacity:
+            self._grow(max(len(names), self.ticker_capacity * 2))
+
+        fields = self.fields + [self.PRESENT]
+        cols = [self._ticker_id[x] for x in tickers]
+        for lo in range(0, len(dates), chunk):
+            hi = min(lo + chunk, len(dates))
+            blocks = [
+                np.zeros(
+                    (hi - lo, self.ticker_capacity) + self._depth(name),
+                    dtype=self._dtype(name),
+                )
+                for name in fields
+            ]
+            # load가 memmap을 반환하면 파일마다 descriptor를 잡으므로 티커를
+            # 하나씩 열고 필요한 날짜만 읽은 뒤 놓는다.
+            for col, ticker in zip(cols, tickers, strict=True):
+                values, present = load(ticker)
+                for i in range(len(self.fields)):
+                    blocks[i][:, col] = values[i, lo:hi]
+                blocks[-1][:, col] = present[lo:hi]
+                del values, present
+            for name, block in zip(fields, blocks, strict=True):
+                with open(self.root / f"{name}.bin", "ab") as f:
+                    f.write(block.tobytes())
+
+        # 데이터를 먼저 기록하고 meta를 갱신해야 읽는 쪽이 불완전한 행을 보지 않는다.
+        self._meta["tickers"] = names
+        self._meta["dates"] += [x.strftime("%Y%m%d") for x in dates]
+        self._write_meta(self.root, self._meta)
+        self.reload()
+
+    # -------------------------------------------------------------------------
+    # checkpoint
+    @property
+    def _checkpoint(self):
+        return self.root / self.CHECKPOINT
+
+    def pending(self) -> dict:
+        """진행 중인 구간 {"dates": [...], "tickers": [...]}. 없으면 None"""
+        path = self._checkpoint / "meta.json"
+        if not path.exists():
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def begin(self, dates: list, tickers: list):
+        # 지우다 중단된 이전 checkpoint의 티커 파일이 남아 있을 수 있다.
+        shutil.rmtree(self._checkpoint, ignore_errors=True)
+        self._checkpoint.mkdir()
+        self._write_meta(
+            self._checkpoint,
+            {"dates": [x.strftime("%Y%m%d") for x in dates], "tickers": list(tickers)},
+        )
+
+    def done(self) -> set:
+        """진행 중인 구간에서 조회를 마친 티커"""
+        return {x.stem for x in self._checkpoint.glob("*.npy") if "." not in x.stem}
+
+    def save(self, ticker: str, values: np.ndarray, present: np.ndarray):
+        # 값 파일이 있으면 조회를 마친 티커로 보므로 present를 먼저 기록한다.
+        for name, array in [(f"{ticker}.present", present), (ticker, values)]:
+            tmp = self._checkpoint / f"{name}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, self._checkpoint / f"{name}.npy")
+
+    def load(self, ticker: str) -> tuple:
+        """checkpoint의 (values, present). 필요한 부분만 읽도록 memmap으로 연다."""
+        return (
+            np.load(self._checkpoint / f"{ticker}.npy", mmap_mode="r"),
+            np.load(self._checkpoint / f"{ticker}.present.npy", mmap_mode="r"),
+        )
+
+    def commit(self) -> int:
+        """진행 중인 구간을 저장소에 추가하고 checkpoint를 지운다.
+
+        Returns:
+            int: 추가된 영업일 수. 이미 추가된 구간이면 0
+        """
+        pending = self.pending()
+        dates = pd.to_datetime(pending["dates"], format="%Y%m%d")
+        # meta를 갱신한 뒤 checkpoint를 지우기 전에 중단되었으면 추가를
+        # 건너뛴다. extend는 meta 갱신으로 한 번에 반영되므로 구간의 일부만
+        # 저장되어 있는 경우는 없다.
+        applied = len(self._dates) and len(dates) and dates[0] <= self._dates[-1]
+        if applied or not len(dates):
+            shutil.rmtree(self._checkpoint)
+            return 0
+        self.extend(dates, pending["tickers"], self.load)
+        shutil.rmtree(self._checkpoint)
+        return len(dates)
+
+
+def _fetch_flows(store: FlowStore, ticker: str, dates: pd.DatetimeIndex) -> tuple:
+    """한 티커의 구간 거래실적을 (필드 수, 날짜 수, 투자자 수) 배열로 조회한다."""
+    fromdate, todate = dates[0].strftime("%Y%m%d"), dates[-1].strftime("%Y%m%d")
+    apis = {
+        "거래량": stock.get_market_trading_volume_by_date,
+        "거래대금": stock.get_market_trading_value_by_date,
+    }
+    values = np.zeros((len(FLOW_FIELDS), len(dates), len(store.investors)), np.int64)
+    present = np.zeros(len(dates), dtype=bool)
+    for i, name in enumerate(FLOW_FIELDS):
+        measure, side = name.split("_")
+        df = apis[measure](fromdate, todate, ticker, on=side, detail=store.detail)
+        if df.empty:
+            continue
+        df = df.reindex(index=dates, columns=store.investors, fill_value=0)
+        values[i] = df.to_numpy(dtype=np.int64)
+        present |= dates.isin(df.index)
+    return values, present
+
+
+def update_flows(
+    store: FlowStore,
+    until: str = None,
+    since: str = None,
+    market: str = "ALL",
+    max_workers: int = 4,
+    calendar=None,
+) -> int:
+    """전 종목의 투자자별 거래실적을 저장되지 않은 영업일만 조회해서 추가한다.
+
+    get_market_ticker_list(until, market)의 티커마다 구간 전체의 거래량/거래대금
+    매도/매수를 조회한다. 요청은 max_workers개씩 동시에 보내며 호스트별 요청
+    한도(throttle)를 따른다. 조회를 마친 티커는 checkpoint에 기록하므로 중단된
+    뒤 다시 실행하면 남은 티커만 조회하고, 모든 티커를 마치면 구간을 저장소에
+    한 번에 추가한다.
+
+    Args:
+        store       (FlowStore    ): 대상 저장소
+        until       (str, optional): 종료 일자. 입력하지 않거나 데이터가
+                                     확정되지 않은 일자면 확정된 최근 영업일
+        since       (str, optional): 시작 일자. 저장소가 비어 있을 때 필요
+        market      (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        max_workers (int, optional): 최대 동시 요청 수
+        calendar                   : calendar(fromdate, todate) -> 영업일
+                                     Timestamp 목록. 입력하지 않으면 KRX
+                                     영업일을 조회한다.
+
+    Returns:
+        int: 추가된 영업일 수
+
+        >> store = FlowStore.create("~/.pykrx/flows")
+        >> update_flows(store, since="20240102")
+        >> update_flows(store)  # 이후에는 새 영업일만 조회
+        >> store.frame("거래대금_순매수", investor="외국인")
+    """
+    if calendar is None:
+
+        def calendar(fromdate, todate):
+            return stock.get_previous_business_days(fromdate=fromdate, todate=todate)
+
+    count = 0
+    if store.pending() is None:
+        # 추가한 구간은 고칠 수 없으므로 장중이나 정산 전의 거래실적은
+        # 추가하지 않는다.
+        settled = FreshnessPolicy().settled_through()
+        if until is None or pd.Timestamp(until) > settled:
+            until = stock.get_nearest_business_day_in_a_week(f"{settled:%Y%m%d}")
+        if len(store.dates):
+            since = (store.dates[-1] + pd.Timedelta(days=1)).strftime("%Y%m%d")
+        elif since is None:
+            raise ValueError("빈 저장소를 채우려면 since가 필요합니다.")
+        if pd.Timestamp(since) > pd.Timestamp(until):
+            return 0
+        dates = [pd.Timestamp(x) for x in calendar(since, until)]
+        if not dates:
+            return 0
+        store.begin(dates, stock.get_market_ticker_list(until, market))
+
+    pending = store.pending()
+    dates = pd.to_datetime(pending["dates"], format="%Y%m%d")
+    todo = [x for x in pending["tickers"] if x not in store.done()]
+    for i in range(0, len(todo), max_workers):
+        batch = todo[i : i + max_workers]
+        results = concurrent_map(
+            lambda x: _fetch_flows(store, x, dates), batch, max_workers
+        )
+        for ticker, (values, present) in zip(batch, results, strict=True):
+            store.save(ticker, values, present)
+    count += store.commit()
+
+    # 중단된 구간을 이어서 마친 경우 until까지 남은 영업일을 계속 조회한다.
+    if until is not None and pd.Timestamp(until) > store.dates[-1]:
+        count += update_flows(store, until, None, market, max_workers, calendar)
+    return count
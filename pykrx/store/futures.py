@@ -0,0 +1,361 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.website.comm import concurrent_map, to_timestamp
+
+# 종목별로 보관하는 get_future_ohlcv_by_ticker 필드. 현물가 열은 정산가다.
+_FIELDS = ["종가", "대비", "시가", "고가", "저가", "현물가", "거래량", "거래대금"]
+_PRICES = ["시가", "고가", "저가", "종가"]
+_ADJUST = ["difference", "ratio", None]
+_META_FILE = "meta.json"
+_INFO_FILE = "info.parquet"
+_CONTRACTS_DIR = "contracts"
+
+
+def _to_str(date) -> str:
+    return date.strftime("%Y%m%d")
+
+
+def _is_spread(code: str) -> bool:
+    # KRX 단축코드의 첫 자리는 1 - 선물, 4 - 스프레드
+    return code.startswith("4")
+
+
+class FutureHistory:
+    """선물 상품의 종목별 일별 시세 이력과 연결 선물
+
+    KRX는 선물 시세를 일자별 전종목 단면으로만 제공하므로, 영업일마다 상품의
+    전종목 시세를 동시에 조회해서 종목(월물)별 시계열로 나눠 보관한다.
+    이미 조회한 영업일은 다시 조회하지 않는다. 같은 단면을 여러 상품이나
+    프로세스에서 읽는다면 ResponseCache를 함께 사용한다.
+
+    continuous는 종목의 최종거래일로 근월물을 고르고, 롤오버마다 생기는 가격
+    차이를 과거 구간에 누적해서 조정한 연결 선물을 만든다. 전종목기본정보는
+    상장 중인 종목만 제공하므로 build마다 다시 조회해서 이전 정보와 합치고,
+    정보가 없는 만기 종목은 보관한 시세의 마지막 일자를 최종거래일로 본다.
+
+        >> h = FutureHistory("KRDRVFUK2I")
+        >> h.build("20220101", "20221231")
+        >> h.ohlcv("101S9000")
+        >> h.continuous(roll=1)
+
+    Args:
+        prod        (str           ): 선물 상품 ID (예: KRDRVFUK2I - 코스피200)
+        fetch                       : fetch(date, prod) -> 종목코드 index의 시세
+                                      DataFrame. 입력하지 않으면
+                                      get_future_ohlcv_by_ticker를 사용한다.
+        info                        : info(prod) -> 종목코드 index의 최종거래일
+                                      DataFrame. 입력하지 않으면
+                                      get_future_contract_info를 사용한다.
+        calendar                    : calendar(fromdate, todate) -> 영업일
+                                      Timestamp 목록. 입력하지 않으면 KRX
+                                      영업일을 조회한다.
+        max_workers (int , optional): 동시에 보낼 최대 요청 수
+    """
+
+    def __init__(
+        self,
+        prod: str,
+        fetch=None,
+        info=None,
+        calendar=None,
+        max_workers: int = 8,
+    ):
+        self.prod = prod
+        if fetch is None:
+            fetch = stock.get_future_ohlcv_by_ticker
+        if info is None:
+            info = stock.get_future_contract_info
+        if calendar is None:
+
+            def calendar(fromdate, todate):
+                return stock.get_previous_business_days(
+                    fromdate=fromdate, todate=todate
+                )
+
+        self.fetch = fetch
+        self.info = info
+        self.calendar = calendar
+        self.max_workers = max_workers
+        self.requests = 0
+        self._dates = pd.DatetimeIndex([])
+        self._names = {}
+        self._contracts = {}
+        self._info = None
+
+    # -------------------------------------------------------------------------
+    # build
+    def _snapshot(self, date):
+        # 실패한 일자가 있어도 성공한 일자는 보관하도록 오류를 반환하고,
+        # build가 보관을 마친 뒤 다시 발생시킨다.
+        try:
+            df = self.fetch(_to_str(date), self.prod)
+        except Exception as e:
+            return e
+        if df is None or df.empty:
+            return DataFrame()
+        return df.assign(날짜=date)
+
+    def _refresh_info(self):
+        df = self.info(self.prod)
+        self.requests += 1
+        if self._info is not None:
+            # 만기가 지나 목록에서 빠진 종목의 정보는 유지한다.
+            expired = self._info[~self._info.index.isin(df.index)]
+            df = pd.concat([expired, df]) if len(expired) else df
+        self._info = df
+
+    def build(self, fromdate: str, todate: str) -> int:
+        """[fromdate, todate]에서 조회하지 않은 영업일의 시세를 보관한다.
+
+        Args:
+            fromdate (str): 시작 일자 (YYYYMMDD)
+            todate   (str): 종료 일자 (YYYYMMDD)
+
+        Returns:
+            int: 이번 호출에서 보낸 조회 수
+        """
+        start, end = to_timestamp(fromdate), to_timestamp(todate)
+        days = [to_timestamp(x) for x in self.calendar(_to_str(start), _to_str(end))]
+        days = pd.DatetimeIndex(sorted(x for x in days if start <= x <= end))
+        days = days.difference(self._dates)
+
+        requests = self.requests
+        if self._info is None or len(days):
+            self._refresh_info()
+        if not len(days):
+            return self.requests - requests
+
+        snapshots = concurrent_map(self._snapshot, list(days), self.max_workers)
+        self.requests += len(days)
+
+        errors = [x for x in snapshots if isinstance(x, Exception)]
+        done = [
+            d for d, x in zip(days, snapshots, strict=True) if isinstance(x, DataFrame)
+        ]
+        fetched = [x for x in snapshots if isinstance(x, DataFrame) and not x.empty]
+        if fetched:
+            df = pd.concat(fetched).rename_axis("종목코드")
+            self._names.update(df["종목명"].to_dict())
+            df = df.reset_index().set_index("날짜")
+            for code, rows in df.groupby("종목코드"):
+                rows = rows[_FIELDS]
+                if code in self._contracts:
+                    rows = pd.concat([self._contracts[code], rows]).sort_index()
+                self._contracts[code] = rows
+        # 휴장일 등 시세가 없는 일자도 조회한 일자로 보고, 조회에 실패한
+        # 일자는 다음 build에서 다시 조회한다.
+        self._dates = self._dates.union(pd.DatetimeIndex(done))
+        if errors:
+            raise errors[0]
+        return self.requests - requests
+
+    # -------------------------------------------------------------------------
+    # query
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """조회한 영업일"""
+        return self._dates
+
+    @property
+    def codes(self) -> list:
+        """시세를 보관한 종목코드 목록"""
+        return sorted(self._contracts)
+
+    @property
+    def contracts(self) -> DataFrame:
+        """get_future_contract_info로 조회한 종목별 상장일/최종거래일
+
+        build마다 다시 조회해서 합치므로 조회 이후 만기가 지난 종목도
+        포함한다.
+        """
+        if self._info is None:
+            self._refresh_info()
+        return self._info
+
+    def _expiry(self) -> pd.Series:
+        """스프레드가 아닌 종목의 최종거래일 (오름차순)
+
+        종목 정보가 없는 종목은 정보를 처음 조회하기 전에 만기가 지난
+        종목이므로 보관한 시세의 마지막 일자를 최종거래일로 본다.
+        """
+        expiry = self.contracts["최종거래일"]
+        missing = [x for x in self._contracts if x not in expiry.index]
+        if missing:
+            last = pd.Series([self._contracts[x].index[-1] for x in missing], missing)
+            expiry = pd.concat([expiry, last])
+        expiry = expiry[[not _is_spread(x) for x in expiry.index]]
+        return pd.to_datetime(expiry).sort_values(kind="stable")
+
+    def ohlcv(self, code: str) -> DataFrame:
+        """한 종목의 일별 시세
+
+        Returns:
+            DataFrame:
+
+                              종가  대비    시가    고가    저가  현물가  거래량  ...
+                날짜
+                2022-09-01  314.50 -3.45  317.10  317.75  313.60  314.50  245017  ...
+                2022-09-02  313.85 -0.65  314.00  315.40  312.65  313.85  219802  ...
+        """
+        return self._contracts[code].copy()
+
+    def panel(self, field: str, fromdate: str = None, todate: str = None) -> DataFrame:
+        """날짜 x 종목코드의 필드 행렬
+
+        Args:
+            field    (str          ): 시세 필드 (예: 종가)
+            fromdate (str, optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str, optional): 조회 종료 일자 (YYYYMMDD)
+
+        Returns:
+            DataFrame: 날짜 index, 종목코드 columns인 DataFrame. 거래가 없는
+                       (날짜, 종목)은 NaN이다.
+        """
+        dates = self._slice(fromdate, todate)
+        df = DataFrame(
+            {code: rows[field] for code, rows in sorted(self._contracts.items())},
+            index=dates,
+        )
+        df.index.name = "날짜"
+        return df
+
+    def _slice(self, fromdate: str = None, todate: str = None) -> pd.DatetimeIndex:
+        dates = self._dates
+        if fromdate is not None:
+            dates = dates[dates >= to_timestamp(fromdate)]
+        if todate is not None:
+            dates = dates[dates <= to_timestamp(todate)]
+        return dates
+
+    def continuous(
+        self,
+        fromdate: str = None,
+        todate: str = None,
+        roll: int = 0,
+        adjust: str = "difference",
+    ) -> DataFrame:
+        """근월물을 이어 붙인 연결 선물
+
+        각 영업일의 근월물은 최종거래일이 roll 영업일보다 많이 남은 종목 중
+        만기가 가장 빠른 스프레드가 아닌 종목이다 (최종거래일은 contracts,
+        없으면 보관한 시세의 마지막 일자). 근월물이 바뀌는 날의 전
+        영업일에서 새 근월물과 이전 근월물의 가격 차이(또는 비율)를 구하고,
+        그 이전 구간 전체에 누적해서 더한다(곱한다). 마지막 근월물 구간은
+        원래 가격과 같다. 가격 차이는 종가로 구하며, 거래가 없어 종가가 0이면
+        정산가를 사용한다.
+
+        Args:
+            fromdate (str, optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str, optional): 조회 종료 일자 (YYYYMMDD)
+            roll     (int, optional): 최종거래일 몇 영업일 전에 차월물로
+                                      넘어갈지 (0 - 최종거래일 다음 영업일)
+            adjust   (str, optional): difference - 가격 차이 / ratio - 가격
+                                      비율 / None - 조정하지 않음
+
+        Returns:
+            DataFrame: 날짜 index, 시가/고가/저가/종가 (조정 가격), 거래량,
+                       종목코드 (근월물), 조정 (더하거나 곱한 값) columns
+        """
+        if adjust not in _ADJUST:
+            raise ValueError(f"{adjust}: adjust는 {_ADJUST} 중 하나입니다.")
+        dates = self._slice(fromdate, todate)
+
+        expiry = self._expiry()
+        codes = expiry.index.to_list()
+        if not codes or not len(dates):
+            return DataFrame()
+
+        # 종목 k는 dates[expiry[k]]까지 근월물이다.
+        expiry = dates.searchsorted(expiry, side="right") - 1 - roll
+        front = np.searchsorted(expiry, np.arange(len(dates)), side="left")
+        valid = front < len(codes)
+        front = np.minimum(front, len(codes) - 1)
+        rows = np.arange(len(dates))
+
+        def take(field):
+            values = np.full((len(dates), len(codes)), np.nan)
+            for j, code in enumerate(codes):
+                if code in self._contracts:
+                    values[:, j] = self._contracts[code][field].reindex(dates)
+            return values
+
+        close = take("종가")
+        mark = np.where(close > 0, close, take("현물가"))
+        # 근월물이 바뀐 날 t의 조정값을 t - 1의 두 종목 가격으로 구한다.
+        switch = np.flatnonzero(valid[1:] & (front[1:] != front[:-1])) + 1
+        new = mark[switch - 1, front[switch]]
+        old = mark[switch - 1, front[switch - 1]]
+        step = np.zeros(len(dates)) if adjust != "ratio" else np.ones(len(dates))
+        if adjust == "difference":
+            step[switch] = np.nan_to_num(new - old)
+        elif adjust == "ratio":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                step[switch] = np.nan_to_num(new / old, nan=1.0, posinf=1.0)
+
+        # 날짜 t에는 t 이후의 모든 롤오버 조정값을 누적한다.
+        if adjust == "ratio":
+            factor = np.cumprod(step[::-1])[::-1]
+            factor = np.append(factor[1:], 1.0)
+        else:
+            factor = np.cumsum(step[::-1])[::-1]
+            factor = np.append(factor[1:], 0.0)
+
+        df = DataFrame(index=dates.rename("날짜"))
+        for field in _PRICES:
+            price = take(field)[rows, front]
+            price = np.where(valid & (price > 0), price, np.nan)
+            df[field] = price * factor if adjust == "ratio" else price + factor
+        df["거래량"] = np.where(valid, take("거래량")[rows, front], np.nan)
+        df["종목코드"] = np.where(valid, np.asarray(codes, dtype=object)[front], None)
+        df["조정"] = factor
+        return df
+
+    # -------------------------------------------------------------------------
+    # persistence
+    def save(self, root: str):
+        """종목별 시세와 종목 정보를 root 디렉터리에 저장한다."""
+        root = Path(root).expanduser()
+        (root / _CONTRACTS_DIR).mkdir(parents=True, exist_ok=True)
+        for code, rows in self._contracts.items():
+            path = root / _CONTRACTS_DIR / f"{code}.parquet"
+            tmp = path.with_suffix(".tmp")
+            rows.to_parquet(tmp)
+            os.replace(tmp, path)
+        if self._info is not None:
+            tmp = root / f"{_INFO_FILE}.tmp"
+            self._info.to_parquet(tmp)
+            os.replace(tmp, root / _INFO_FILE)
+
+        meta = {
+            "prod": self.prod,
+            "dates": [_to_str(x) for x in self._dates],
+            "names": self._names,
+        }
+        tmp = root / f"{_META_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, root / _META_FILE)
+
+    @classmethod
+    def load(cls, root: str, **kwargs) -> "FutureHistory":
+        """save로 저장한 디렉터리를 읽는다. kwargs는 생성자에 전달한다."""
+        root = Path(root).expanduser()
+        with open(root / _META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        h = cls(meta["prod"], **kwargs)
+        h._dates = pd.to_datetime(meta["dates"], format="%Y%m%d")
+        h._names = meta["names"]
+        h._contracts = {
+            x.stem: pd.read_parquet(x)
+            for x in sorted((root / _CONTRACTS_DIR).glob("*.parquet"))
+        }
+        if (root / _INFO_FILE).exists():
+            h._info = pd.read_parquet(root / _INFO_FILE)
+        return h
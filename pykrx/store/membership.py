@@ -0,0 +1,245 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.website.comm import to_timestamp
+
+
+def _to_str(date) -> str:
+    return date.strftime("%Y%m%d")
+
+
+class IndexMembership:
+    """지수 구성 종목의 편입/편출 이력
+
+    영업일 중 step 간격의 날짜만 지수구성종목을 조회하고, 이웃한 두 표본의
+    구성 종목이 다르면 그 사이를 이분 탐색해서 변경일을 찾는다. 첫 영업일의
+    구성 종목과 이후의 편입/편출 이벤트만 보관하므로, 한 번 구축한 뒤에는
+    특정 일자의 구성 종목이나 기간의 편입 여부 행렬을 요청 없이 계산한다.
+
+    두 표본 사이에서 편입된 뒤 다시 편출되어 양쪽 표본의 구성 종목이 같으면
+    찾지 못한다. 정기 변경 외에 수시 변경이 잦은 지수는 step을 줄인다.
+
+        >> m = IndexMembership("1028")
+        >> m.build("20200101", "20231231")
+        >> m.members("20220615")
+        >> m.matrix("20220601", "20220630")
+
+    Args:
+        ticker   (str ): 지수 티커 (예: 1028 - 코스피 200)
+        step     (int , optional): 표본 사이의 영업일 수
+        fetch           : fetch(date) -> 구성 종목 티커 목록. 입력하지 않으면
+                          get_index_portfolio_deposit_file을 사용한다.
+        calendar        : calendar(fromdate, todate) -> 영업일 Timestamp 목록.
+                          입력하지 않으면 KRX 영업일을 조회한다.
+    """
+
+    def __init__(self, ticker: str, step: int = 20, fetch=None, calendar=None):
+        self.ticker = ticker
+        self.step = step
+        if fetch is None:
+
+            def fetch(date):
+                return stock.get_index_portfolio_deposit_file(ticker, date)
+
+        if calendar is None:
+
+            def calendar(fromdate, todate):
+                return stock.get_previous_business_days(
+                    fromdate=fromdate, todate=todate
+                )
+
+        self.fetch = fetch
+        self.calendar = calendar
+        self.requests = 0
+        self._dates = pd.DatetimeIndex([])
+        self._initial = frozenset()
+        self._events = []
+
+    # -------------------------------------------------------------------------
+    # build
+    def _get(self, days: list, cache: dict, i: int):
+        if i not in cache:
+            self.requests += 1
+            members = self.fetch(_to_str(days[i]))
+            cache[i] = frozenset(members) if len(members) else None
+        return cache[i]
+
+    def _bisect(self, days: list, cache: dict, lo: int, hi: int, events: list):
+        """days[lo]와 days[hi]의 구성 종목이 다를 때 사이의 변경일을 찾는다."""
+        if hi - lo == 1:
+            before, after = cache[lo], cache[hi]
+            events += [(days[hi], x, True) for x in sorted(after - before)]
+            events += [(days[hi], x, False) for x in sorted(before - after)]
+            return
+
+        mid = (lo + hi) // 2
+        # 조회 결과가 없는 날은 이웃한 날로 대신한다.
+        while mid < hi and self._get(days, cache, mid) is None:
+            mid += 1
+        if mid == hi:
+            cache[hi - 1] = cache[lo]
+            self._bisect(days, cache, hi - 1, hi, events)
+            return
+        if cache[lo] != cache[mid]:
+            self._bisect(days, cache, lo, mid, events)
+        if cache[mid] != cache[hi]:
+            self._bisect(days, cache, mid, hi, events)
+
+    def build(self, fromdate: str, todate: str) -> int:
+        """[fromdate, todate]의 편입/편출 이벤트를 찾는다.
+
+        이미 구축한 구간의 마지막 일자 이후만 요청하면 그 뒤의 영업일만
+        조회해서 이벤트를 이어 붙인다. 시작 일자가 구축한 구간보다 앞서면
+        처음부터 다시 구축한다.
+
+        Args:
+            fromdate (str): 시작 일자 (YYYYMMDD)
+            todate   (str): 종료 일자 (YYYYMMDD)
+
+        Returns:
+            int: 이번 호출에서 보낸 조회 수
+        """
+        requests = self.requests
+        start, end = to_timestamp(fromdate), to_timestamp(todate)
+        extend = len(self._dates) and self._dates[0] <= start
+        if extend:
+            if end <= self._dates[-1]:
+                return 0
+            start = self._dates[-1]
+
+        days = [to_timestamp(x) for x in self.calendar(_to_str(start), _to_str(end))]
+        days = sorted(x for x in days if start <= x <= end)
+        if not days:
+            return 0
+
+        cache = {}
+        if extend:
+            if days[0] != start:
+                days.insert(0, start)
+            cache[0] = self.members(days[0], as_set=True)
+        samples = [
+            i
+            for i in sorted({*range(0, len(days), self.step), len(days) - 1})
+            if self._get(days, cache, i) is not None
+        ]
+        if not samples:
+            return self.requests - requests
+
+        events = []
+        for lo, hi in zip(samples, samples[1:], strict=False):
+            if cache[lo] != cache[hi]:
+                self._bisect(days, cache, lo, hi, events)
+
+        if extend:
+            self._dates = self._dates.append(pd.DatetimeIndex(days[1:]))
+            self._events += events
+        else:
+            self._dates = pd.DatetimeIndex(days[samples[0] :])
+            self._initial = cache[samples[0]]
+            self._events = events
+        return self.requests - requests
+
+    # -------------------------------------------------------------------------
+    # query
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """구축한 영업일"""
+        return self._dates
+
+    def events(self) -> DataFrame:
+        """편입/편출 이벤트
+
+        Returns:
+            DataFrame:
+
+                             티커  편입
+                날짜
+                2023-06-09  000990  True
+                2023-06-09  004170  False
+        """
+        df = DataFrame(self._events, columns=["날짜", "티커", "편입"])
+        return df.set_index("날짜")
+
+    def members(self, date, as_set: bool = False):
+        """date 일자의 구성 종목
+
+        Args:
+            date            : 조회 일자. 구축한 구간 안이어야 한다.
+            as_set  (bool  ): set으로 반환할지 여부
+
+        Returns:
+            list: 정렬된 구성 종목 티커 목록
+        """
+        date = to_timestamp(date)
+        if not len(self._dates) or not self._dates[0] <= date <= self._dates[-1]:
+            raise ValueError(f"{date:%Y%m%d}: 구축한 구간 밖의 일자입니다.")
+        members = set(self._initial)
+        for day, ticker, added in self._events:
+            if day > date:
+                break
+            if added:
+                members.add(ticker)
+            else:
+                members.discard(ticker)
+        return frozenset(members) if as_set else sorted(members)
+
+    def matrix(self, fromdate: str = None, todate: str = None) -> DataFrame:
+        """영업일 x 티커의 편입 여부 행렬
+
+        Returns:
+            DataFrame: 날짜 index, 티커 columns인 bool DataFrame
+        """
+        dates = self._dates
+        if fromdate is not None:
+            dates = dates[dates >= to_timestamp(fromdate)]
+        if todate is not None:
+            dates = dates[dates <= to_timestamp(todate)]
+        changes = DataFrame(
+            [(self._dates[0], x, 1) for x in self._initial]
+            + [(d, x, 1 if added else -1) for d, x, added in self._events],
+            columns=["날짜", "티커", "변경"],
+        )
+        # 구성 종목이나 조회 구간이 없어도 같은 축 이름의 행렬을 반환한다.
+        if not len(dates) or changes.empty:
+            index = pd.DatetimeIndex(dates, name="날짜")
+            return DataFrame(index=index, columns=pd.Index([], name="티커"), dtype=bool)
+
+        df = changes.pivot_table(
+            index="날짜", columns="티커", values="변경", aggfunc="sum", fill_value=0
+        )
+        df = df.reindex(self._dates, fill_value=0).cumsum() > 0
+        df = df.loc[dates]
+        df.index.name = "날짜"
+        return df.loc[:, df.any()]
+
+    # -------------------------------------------------------------------------
+    # persistence
+    def save(self, path: str):
+        """이벤트를 json 파일로 저장한다."""
+        path = Path(path).expanduser()
+        data = {
+            "ticker": self.ticker,
+            "dates": [_to_str(x) for x in self._dates],
+            "initial": sorted(self._initial),
+            "events": [[_to_str(d), x, added] for d, x, added in self._events],
+        }
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> "IndexMembership":
+        """save로 저장한 파일을 읽는다. kwargs는 생성자에 전달한다."""
+        with open(Path(path).expanduser(), encoding="utf-8") as f:
+            data = json.load(f)
+        m = cls(data["ticker"], **kwargs)
+        m._dates = pd.to_datetime(data["dates"], format="%Y%m%d")
+        m._initial = frozenset(data["initial"])
+        m._events = [(to_timestamp(d), x, added) for d, x, added in data["events"]]
+        return m
@@ -0,0 +1,334 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.website.comm import FreshnessPolicy, concurrent_map
+
+# get_market_snapshot의 열 중 패널로 저장하는 필드와 저장 dtype
+PANEL_FIELDS = {
+    "시가": "int32",
+    "고가": "int32",
+    "저가": "int32",
+    "종가": "int32",
+    "거래량": "int64",
+    "거래대금": "int64",
+    "등락률": "float32",
+    "시가총액": "int64",
+    "상장주식수": "int64",
+    "BPS": "int32",
+    "PER": "float32",
+    "PBR": "float32",
+    "EPS": "int32",
+    "DIV": "float32",
+    "DPS": "int32",
+}
+
+
+class PanelStore:
+    """날짜 x 티커 숫자 패널을 필드별 고정폭 배열 파일로 저장하는 저장소
+
+    각 필드는 (날짜, 티커) 순서의 row-major 바이너리 파일이며
+    numpy.memmap으로 열기 때문에 한 필드 전체를 복사 없이 읽을 수 있고,
+    여러 프로세스가 페이지 캐시를 공유한다. 티커는 ticker_capacity 폭의
+    열에 등장 순서대로 id가 부여되고, 날짜 축은 영업일 순서로 추가된다.
+
+        root/
+            meta.json     # 날짜 축, 티커 사전, 필드 dtype, 열 폭
+            종가.bin      # shape = (날짜 수, ticker_capacity)
+            _present.bin  # 해당 (날짜, 티커)에 값이 있는지 여부 (uint8)
+
+    값이 없는 셀은 정수 필드는 0, 실수 필드는 NaN으로 채워진다.
+
+    meta.json을 마지막에 갱신하므로 기록 도중 중단되면 필드 파일에 meta보다
+    긴 꼬리가 남을 수 있다. 읽을 때는 meta의 날짜 수만 사용하고, 다음 기록
+    전에 꼬리를 잘라낸다. 열 폭을 늘릴 때는 모든 필드의 새 파일(.grow)을 먼저
+    쓰고 meta를 갱신한 뒤 교체하며, 교체 도중 중단된 저장소는 열 때 교체를
+    마친다.
+
+    Args:
+        root (str): 저장소 경로 (PanelStore.create로 먼저 생성)
+    """
+
+    META_FILE = "meta.json"
+    PRESENT = "_present"
+
+    def __init__(self, root: str):
+        self.root = Path(root).expanduser()
+        self.reload()
+        self._recover()
+
+    @classmethod
+    def create(
+        cls, root: str, fields: dict = None, ticker_capacity: int = 4096
+    ) -> "PanelStore":
+        """빈 패널 저장소를 생성한다.
+
+        Args:
+            root            (str           ): 저장소 경로
+            fields          (dict, optional): {필드명: dtype}. 기본값은
+                                              PANEL_FIELDS
+            ticker_capacity (int , optional): 티커 축의 초기 폭
+
+        Returns:
+            PanelStore: 생성된 저장소
+        """
+        root = Path(root).expanduser()
+        root.mkdir(parents=True, exist_ok=True)
+        if (root / cls.META_FILE).exists():
+            raise FileExistsError(f"이미 패널 저장소가 존재합니다: {root}")
+
+        fields = dict(PANEL_FIELDS if fields is None else fields)
+        meta = {
+            "dates": [],
+            "tickers": [],
+            "fields": {k: np.dtype(v).str for k, v in fields.items()},
+            "ticker_capacity": ticker_capacity,
+        }
+        for name in list(fields) + [cls.PRESENT]:
+            (root / f"{name}.bin").touch()
+        cls._write_meta(root, meta)
+        return cls(root)
+
+    @classmethod
+    def _write_meta(cls, root: Path, meta: dict):
+        path = root / cls.META_FILE
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, path)
+
+    def reload(self):
+        """meta.json을 다시 읽어 다른 프로세스가 추가한 날짜를 반영한다."""
+        with open(self.root / self.META_FILE, encoding="utf-8") as f:
+            self._meta = json.load(f)
+        self._dates = pd.to_datetime(self._meta["dates"], format="%Y%m%d")
+        self._tickers = pd.Index(self._meta["tickers"], name="티커")
+        self._ticker_id = {x: i for i, x in enumerate(self._meta["tickers"])}
+
+    # -------------------------------------------------------------------------
+    # axes
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        return self._dates
+
+    @property
+    def tickers(self) -> pd.Index:
+        return self._tickers
+
+    @property
+    def fields(self) -> list:
+        return list(self._meta["fields"])
+
+    @property
+    def ticker_capacity(self) -> int:
+        return self._meta["ticker_capacity"]
+
+    def ticker_id(self, ticker: str) -> int:
+        return self._ticker_id[ticker]
+
+    def _dtype(self, name: str) -> np.dtype:
+        if name == self.PRESENT:
+            return np.dtype(np.uint8)
+        return np.dtype(self._meta["fields"][name])
+
+    def _depth(self, name: str) -> tuple:
+        """(날짜, 티커) 셀마다 저장하는 값의 shape"""
+        return ()
+
+    def _nbytes(self, name: str) -> int:
+        """meta 기준 필드 파일의 크기"""
+        cell = int(np.prod(self._depth(name))) * self._dtype(name).itemsize
+        return len(self._dates) * self.ticker_capacity * cell
+
+    def _recover(self, clean: bool = False):
+        """중단된 기록을 정리한다.
+
+        meta가 이미 새 열 폭을 가리키는 .grow 파일은 교체를 마친다. clean이면
+        meta와 맞지 않는 .grow 파일을 지우고, meta보다 긴 필드 파일의 꼬리를
+        잘라낸다. clean은 기록하는 쪽에서만 사용한다.
+        """
+        for name in self.fields + [self.PRESENT]:
+            path = self.root / f"{name}.bin"
+            staged = path.with_suffix(".grow")
+            if staged.exists():
+                if staged.stat().st_size == self._nbytes(name):
+                    try:
+                        os.replace(staged, path)
+                    except FileNotFoundError:
+                        pass  # 다른 프로세스가 먼저 교체했다.
+                elif clean:
+                    staged.unlink(missing_ok=True)
+            if clean and path.stat().st_size > self._nbytes(name):
+                os.truncate(path, self._nbytes(name))
+
+    def _date_slice(self, fromdate=None, todate=None) -> slice:
+        lo = 0 if fromdate is None else self._dates.searchsorted(pd.Timestamp(fromdate))
+        hi = (
+            len(self._dates)
+            if todate is None
+            else self._dates.searchsorted(pd.Timestamp(todate), side="right")
+        )
+        return slice(lo, hi)
+
+    # -------------------------------------------------------------------------
+    # read
+    def field(self, name: str, fromdate: str = None, todate: str = None) -> np.ndarray:
+        """필드를 (날짜, 티커) 2차원 memmap으로 반환한다. 복사가 일어나지 않는다.
+
+        Args:
+            name     (str          ): 필드명
+            fromdate (str, optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str, optional): 조회 종료 일자 (YYYYMMDD)
+
+        Returns:
+            np.ndarray: shape = (날짜 수, 티커 수)인 읽기 전용 memmap 뷰
+        """
+        n_dates = len(self._dates)
+        if n_dates == 0:
+            return np.empty((0, len(self._tickers)), dtype=self._dtype(name))
+        mm = np.memmap(
+            self.root / f"{name}.bin",
+            dtype=self._dtype(name),
+            mode="r",
+            shape=(n_dates, self.ticker_capacity),
+        )
+        return mm[self._date_slice(fromdate, todate), : len(self._tickers)]
+
+    def present(self, fromdate: str = None, todate: str = None) -> np.ndarray:
+        """(날짜, 티커) 셀에 값이 있는지를 나타내는 bool 배열"""
+        return self.field(self.PRESENT, fromdate, todate).view(np.bool_)
+
+    def frame(self, name: str, fromdate: str = None, todate: str = None) -> DataFrame:
+        """필드를 날짜 index, 티커 columns인 DataFrame으로 반환한다."""
+        rows = self._date_slice(fromdate, todate)
+        return DataFrame(
+            self.field(name, fromdate, todate),
+            index=self._dates[rows].rename("날짜"),
+            columns=self._tickers,
+            copy=False,
+        )
+
+    # -------------------------------------------------------------------------
+    # write
+    def append(self, date, df: DataFrame):
+        """한 영업일의 단면을 날짜 축 끝에 추가한다.
+
+        Args:
+            date          : 추가할 일자. 저장된 마지막 일자보다 이후여야 한다.
+            df (DataFrame): 티커가 index이고 필드가 columns인 단면
+        """
+        date = pd.Timestamp(str(date).replace("-", ""))
+        if len(self._dates) and date <= self._dates[-1]:
+            raise ValueError(f"{date:%Y%m%d}: 날짜는 마지막 일자 이후여야 합니다.")
+
+        tickers = list(self._meta["tickers"])
+        for ticker in df.index:
+            if ticker not in self._ticker_id:
+                self._ticker_id[ticker] = len(tickers)
+                tickers.append(ticker)
+        self._recover(clean=True)
+        if len(tickers) > self.ticker_capacity:
+            self._grow(max(len(tickers), self.ticker_capacity * 2))
+
+        cols = np.fromiter(
+            (self._ticker_id[x] for x in df.index), dtype=np.int64, count=len(df)
+        )
+        for name in self.fields + [self.PRESENT]:
+            dtype = self._dtype(name)
+            fill = np.nan if dtype.kind == "f" else 0
+            row = np.full(self.ticker_capacity, fill, dtype=dtype)
+            if name == self.PRESENT:
+                row[cols] = 1
+            elif name in df.columns:
+                values = pd.to_numeric(df[name], errors="coerce").to_numpy()
+                if dtype.kind != "f":
+                    values = np.nan_to_num(values, nan=0)
+                row[cols] = values.astype(dtype)
+            with open(self.root / f"{name}.bin", "ab") as f:
+                f.write(row.tobytes())
+
+        # 데이터를 먼저 기록하고 meta를 갱신해야 읽는 쪽이 불완전한 행을 보지 않는다.
+        self._meta["tickers"] = tickers
+        self._meta["dates"].append(date.strftime("%Y%m%d"))
+        self._write_meta(self.root, self._meta)
+        self.reload()
+
+    def _grow(self, capacity: int):
+        names = self.fields + [self.PRESENT]
+        for name in names:
+            path = self.root / f"{name}.bin"
+            self._widen(name, capacity).tofile(path.with_suffix(".grow"))
+        # 모든 .grow 파일을 쓴 뒤의 meta 갱신이 기준점이다. 이후에 중단되면
+        # _recover가 교체를 마친다.
+        self._meta["ticker_capacity"] = capacity
+        self._write_meta(self.root, self._meta)
+        self._recover()
+
+    def _widen(self, name: str, capacity: int) -> np.ndarray:
+        """필드를 capacity 폭으로 넓힌 (날짜, capacity) 배열"""
+        n_dates = len(self._dates)
+        dtype = self._dtype(name)
+        depth = self._depth(name)
+        old = np.fromfile(self.root / f"{name}.bin", dtype=dtype)
+        old = old[: n_dates * self.ticker_capacity * int(np.prod(depth))]
+        old = old.reshape((n_dates, self.ticker_capacity) + depth)
+        fill = np.nan if dtype.kind == "f" else 0
+        new = np.full((n_dates, capacity) + depth, fill, dtype=dtype)
+        new[:, : self.ticker_capacity] = old
+        return new
+
+
+def update_panel(
+    store: PanelStore,
+    until: str = None,
+    since: str = None,
+    market: str = "ALL",
+    max_workers: int = 4,
+) -> int:
+    """get_market_snapshot으로 저장되지 않은 영업일의 단면을 조회해서 추가한다.
+
+    Args:
+        store       (PanelStore   ): 대상 저장소
+        until       (str, optional): 종료 일자. 입력하지 않거나 데이터가
+                                     확정되지 않은 일자면 확정된 최근 영업일
+        since       (str, optional): 시작 일자. 저장소가 비어 있을 때 필요
+        market      (str, optional): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        max_workers (int, optional): 최대 동시 요청 수
+
+    Returns:
+        int: 추가된 영업일 수
+
+        >> store = PanelStore.create("~/.pykrx/panel")
+        >> update_panel(store, since="20040101")
+        >> store.frame("종가", "20240102", "20240131")
+    """
+    # 추가한 일자는 고칠 수 없으므로 장중이나 정산 전의 단면은 추가하지 않는다.
+    settled = FreshnessPolicy().settled_through()
+    if until is None or pd.Timestamp(until) > settled:
+        until = stock.get_nearest_business_day_in_a_week(f"{settled:%Y%m%d}")
+    if len(store.dates):
+        since = (store.dates[-1] + pd.Timedelta(days=1)).strftime("%Y%m%d")
+    elif since is None:
+        raise ValueError("빈 저장소를 채우려면 since가 필요합니다.")
+    if pd.Timestamp(since) > pd.Timestamp(until):
+        return 0
+
+    days = stock.get_previous_business_days(fromdate=since, todate=until)
+    count = 0
+    # 날짜 순서대로 추가해야 하므로 max_workers 단위로 나눠서 조회한다.
+    for i in range(0, len(days), max_workers):
+        chunk = days[i : i + max_workers]
+        frames = concurrent_map(
+            lambda x: stock.get_market_snapshot(x.strftime("%Y%m%d"), market), chunk
+        )
+        for day, df in zip(chunk, frames, strict=True):
+            if df.empty:
+                return count
+            store.append(day, df)
+            count += 1
+    return count
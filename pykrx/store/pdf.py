@@ -0,0 +1,360 @@
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.website.comm import concurrent_map, to_timestamp
+
+# PDF의 저장 필드와 get_etf_portfolio_deposit_file이 반환하는 dtype
+PDF_FIELDS = {"계약수": np.float64, "금액": np.int64, "비중": np.float32}
+
+_COLUMNS = ["날짜", "ETF", "티커", "필드", "값"]
+_META_FILE = "meta.json"
+_CHANGES_FILE = "changes.parquet"
+
+
+def _to_str(date) -> str:
+    return date.strftime("%Y%m%d")
+
+
+def _diff(etf: str, snapshots: DataFrame, base: bool) -> DataFrame:
+    """한 ETF의 일자별 PDF에서 직전 PDF와 달라진 (구성종목, 필드)만 고른다.
+
+    Args:
+        etf       (str      ): ETF 티커
+        snapshots (DataFrame): (날짜, 티커, 필드, 값) long-form PDF
+        base      (bool     ): 첫 일자가 이미 저장된 마지막 PDF인지 여부.
+                               참이면 첫 일자는 비교에만 사용한다.
+
+    Returns:
+        DataFrame: (날짜, ETF, 티커, 필드, 값) 변경 행. 편출은 값이 NaN이다.
+    """
+    wide = snapshots.pivot(index="날짜", columns=["티커", "필드"], values="값")
+    values = wide.to_numpy(dtype=np.float64)
+    prev = np.vstack([np.full((1, values.shape[1]), np.nan), values[:-1]])
+    changed = ~((values == prev) | (np.isnan(values) & np.isnan(prev)))
+    if base:
+        changed[0] = False
+    rows, cols = np.nonzero(changed)
+    return DataFrame(
+        {
+            "날짜": wide.index[rows],
+            "ETF": etf,
+            "티커": wide.columns.get_level_values("티커")[cols],
+            "필드": wide.columns.get_level_values("필드")[cols],
+            "값": values[rows, cols],
+        }
+    )
+
+
+class EtfPdfHistory:
+    """ETF PDF(구성 종목)의 변경분 이력
+
+    ETF마다 영업일별 PDF를 동시에 조회하고, 직전 영업일의 PDF와 달라진
+    (구성종목, 필드) 값만 보관한다. 편출은 값이 NaN인 행으로 기록한다.
+    계약수는 리밸런싱이나 설정/환매가 있을 때만 바뀌므로 대부분의 행이
+    생략되고, 가격에 따라 매일 바뀌는 금액/비중은 필요하지 않으면 fields에서
+    제외해서 저장 크기를 더 줄일 수 있다. 결과가 없는 일자는 직전 PDF가
+    유지된 것으로 본다. 조회가 실패한 ETF는 실패한 일자 전까지만 보관하고,
+    나머지를 보관한 뒤 오류를 발생시킨다. 실패한 일자부터는 다음 build에서
+    다시 조회한다.
+
+        >> h = EtfPdfHistory()
+        >> h.build("20240102", "20240628", ["152100", "069500"])
+        >> h.holdings("152100", "20240315")
+        >> h.matrix("152100", "계약수", "20240301", "20240331")
+
+    Args:
+        fields      (list, optional): 보관할 필드. 입력하지 않으면 계약수/금액/비중
+        fetch                       : fetch(ticker, date) -> 티커 index의 PDF
+                                      DataFrame. 입력하지 않으면
+                                      get_etf_portfolio_deposit_file을 사용한다.
+        calendar                    : calendar(fromdate, todate) -> 영업일
+                                      Timestamp 목록. 입력하지 않으면 KRX
+                                      영업일을 조회한다.
+        max_workers (int , optional): 동시에 보낼 최대 요청 수
+    """
+
+    def __init__(
+        self, fields: list = None, fetch=None, calendar=None, max_workers: int = 8
+    ):
+        self.fields = list(fields or PDF_FIELDS)
+        if fetch is None:
+            fetch = stock.get_etf_portfolio_deposit_file
+        if calendar is None:
+
+            def calendar(fromdate, todate):
+                return stock.get_previous_business_days(
+                    fromdate=fromdate, todate=todate
+                )
+
+        self.fetch = fetch
+        self.calendar = calendar
+        self.max_workers = max_workers
+        self.requests = 0
+        self._dates = pd.DatetimeIndex([])
+        self._covered = {}
+        self._changes = DataFrame(columns=_COLUMNS)
+
+    # -------------------------------------------------------------------------
+    # build
+    def _snapshot(self, job):
+        # 실패한 일자가 있어도 성공한 일자는 보관하도록 오류를 반환하고,
+        # build가 보관을 마친 뒤 다시 발생시킨다.
+        ticker, date = job
+        try:
+            df = self.fetch(ticker, _to_str(date))
+        except Exception as e:
+            return e
+        if df is None or df.empty:
+            return DataFrame()
+        # 현금 등 축약 티커가 겹치는 구성종목은 합친다.
+        df = df[self.fields].groupby(level=0, sort=False).sum()
+        df = df.rename_axis("티커").reset_index()
+        df = df.melt(id_vars="티커", var_name="필드", value_name="값")
+        return df.assign(날짜=date, ETF=ticker)
+
+    def build(self, fromdate: str, todate: str, tickers: list = None) -> int:
+        """[fromdate, todate]의 PDF를 조회해서 변경분을 보관한다.
+
+        이미 보관한 ETF는 마지막 일자 이후의 영업일만 조회한다. fromdate가
+        마지막 일자보다 뒤여도 그 다음 영업일부터 조회해서 구간을 잇는다.
+        시작 일자가 보관한 구간보다 앞서는 ETF는 처음부터 다시 조회한다.
+
+        Args:
+            fromdate (str ): 시작 일자 (YYYYMMDD)
+            todate   (str ): 종료 일자 (YYYYMMDD)
+            tickers  (list, optional): ETF 티커 목록. 입력하지 않으면
+                                       todate의 전체 ETF
+
+        Returns:
+            int: 이번 호출에서 보낸 조회 수
+        """
+        start, end = to_timestamp(fromdate), to_timestamp(todate)
+        if tickers is None:
+            tickers = stock.get_etf_ticker_list(_to_str(end))
+        bases = {}
+        for ticker in tickers:
+            covered = self._covered.get(ticker)
+            if covered is not None and covered[0] <= start:
+                bases[ticker] = covered[1]
+        # 보관한 구간을 이어서 조회하는 ETF는 fromdate가 구간 끝보다 뒤여도
+        # 그 사이의 영업일부터 조회해야 구간에 빈 곳이 생기지 않는다.
+        first = min([start] + [x + pd.Timedelta(days=1) for x in bases.values()])
+        days = [to_timestamp(x) for x in self.calendar(_to_str(first), _to_str(end))]
+        days = pd.DatetimeIndex(sorted(x for x in days if first <= x <= end))
+        if not len(days):
+            return 0
+
+        jobs = []
+        for ticker in tickers:
+            if ticker in bases:
+                jobs += [(ticker, x) for x in days[days > bases[ticker]]]
+            else:
+                self._drop(ticker)
+                jobs += [(ticker, x) for x in days[days >= start]]
+        snapshots = concurrent_map(self._snapshot, jobs, self.max_workers)
+        self.requests += len(jobs)
+
+        # ETF별 첫 실패 일자. 변경분은 연속된 구간에서만 구할 수 있으므로
+        # 그 이후의 결과는 버리고 다음 build에서 다시 조회한다.
+        errors, failed = [], {}
+        for (ticker, date), x in zip(jobs, snapshots, strict=True):
+            if isinstance(x, Exception):
+                errors.append(x)
+                failed.setdefault(ticker, date)
+        fetched = [
+            x
+            for (ticker, date), x in zip(jobs, snapshots, strict=True)
+            if not isinstance(x, Exception)
+            and not x.empty
+            and date < failed.get(ticker, pd.Timestamp.max)
+        ]
+        fetched = dict(tuple(pd.concat(fetched).groupby("ETF"))) if fetched else {}
+        changes = []
+        for ticker in tickers:
+            rows = fetched.get(ticker)
+            done = days[days < failed.get(ticker, pd.Timestamp.max)]
+            if ticker in bases:
+                last = bases[ticker]
+                if rows is not None:
+                    base = self._state(ticker, last).assign(날짜=last)
+                    changes.append(_diff(ticker, pd.concat([base, rows]), base=True))
+                if len(done):
+                    covered = self._covered[ticker]
+                    self._covered[ticker] = (covered[0], max(done[-1], last))
+            else:
+                if rows is not None:
+                    changes.append(_diff(ticker, rows, base=False))
+                # 상장 전이라 PDF가 없는 일자도 조회한 구간으로 본다.
+                if len(done) and done[-1] >= start:
+                    self._covered[ticker] = (start, done[-1])
+
+        if changes:
+            if len(self._changes):
+                changes.insert(0, self._changes)
+            changes = pd.concat(changes, ignore_index=True)
+            self._changes = changes.sort_values(["ETF", "날짜"], kind="stable")
+        if self._covered:
+            last = max(x[1] for x in self._covered.values())
+            self._dates = self._dates.union(days[days <= last])
+        if errors:
+            raise errors[0]
+        return len(jobs)
+
+    def _drop(self, ticker: str):
+        self._covered.pop(ticker, None)
+        self._changes = self._changes[self._changes["ETF"] != ticker]
+
+    # -------------------------------------------------------------------------
+    # query
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        """조회한 영업일"""
+        return self._dates
+
+    @property
+    def tickers(self) -> list:
+        """보관한 ETF 티커 목록"""
+        return sorted(self._covered)
+
+    def changes(self, ticker: str = None) -> DataFrame:
+        """보관한 변경 행
+
+        Returns:
+            DataFrame:
+
+                              ETF    티커   필드      값
+                날짜
+                2024-01-02  152100  005930  계약수  8140.0
+                2024-03-15  152100  005930  계약수  8175.0
+                2024-03-15  152100  035720  계약수     NaN
+        """
+        df = self._changes
+        if ticker is not None:
+            df = df[df["ETF"] == ticker]
+        return df.set_index("날짜")
+
+    def _check(self, ticker: str, date) -> pd.Timestamp:
+        date = to_timestamp(date)
+        covered = self._covered.get(ticker)
+        if covered is None or not covered[0] <= date <= covered[1]:
+            raise ValueError(f"{ticker} {date:%Y%m%d}: 보관한 구간 밖의 일자입니다.")
+        return date
+
+    def _state(self, ticker: str, date) -> DataFrame:
+        """date 일자의 (티커, 필드, 값) long-form PDF"""
+        df = self._changes
+        df = df[(df["ETF"] == ticker) & (df["날짜"] <= date)]
+        # 변경 행은 날짜 순이므로 (구성종목, 필드)별 마지막 행이 해당 일자의 값이다.
+        df = df.drop_duplicates(["티커", "필드"], keep="last")
+        return df.loc[df["값"].notna(), ["티커", "필드", "값"]]
+
+    def holdings(self, ticker: str, date) -> DataFrame:
+        """ticker ETF의 date 일자 PDF
+
+        Args:
+            ticker (str): ETF 티커
+            date        : 조회 일자. 보관한 구간 안이어야 한다.
+
+        Returns:
+            DataFrame: get_etf_portfolio_deposit_file과 같은 형식
+
+                         계약수       금액    비중
+                티커
+                005930   8140.0  667480000  31.77
+                000660    968.0  118580000   5.69
+        """
+        date = self._check(ticker, date)
+        df = self._state(ticker, date).pivot(index="티커", columns="필드", values="값")
+        df = df.reindex(columns=self.fields).astype(
+            {k: PDF_FIELDS[k] for k in self.fields}
+        )
+        if "금액" in df:
+            df = df.sort_values("금액", ascending=False, kind="stable")
+        df.columns.name = None
+        return df
+
+    def matrix(
+        self, ticker: str, field: str = "계약수", fromdate=None, todate=None
+    ) -> DataFrame:
+        """영업일 x 구성종목의 field 행렬
+
+        보유하지 않은 구성종목은 0이다.
+
+        Args:
+            ticker   (str): ETF 티커
+            field    (str): 계약수/금액/비중 중 보관한 필드
+            fromdate      : 조회 시작 일자. 입력하지 않으면 보관한 첫 일자
+            todate        : 조회 종료 일자. 입력하지 않으면 보관한 마지막 일자
+
+        Returns:
+            DataFrame: 날짜 index, 구성종목 티커 columns인 DataFrame
+        """
+        first, last = self._covered.get(ticker, (None, None))
+        if first is None:
+            return DataFrame()
+        dates = self._dates[(self._dates >= first) & (self._dates <= last)]
+        if fromdate is not None:
+            dates = dates[dates >= to_timestamp(fromdate)]
+        if todate is not None:
+            dates = dates[dates <= to_timestamp(todate)]
+        if not len(dates):
+            return DataFrame()
+
+        df = self._changes
+        df = df[(df["ETF"] == ticker) & (df["필드"] == field) & (df["날짜"] <= last)]
+        # 편출(NaN)이 앞의 값으로 채워지지 않도록 보유 여부를 따로 채운다.
+        values = df.pivot(index="날짜", columns="티커", values="값")
+        held = df.assign(값=df["값"].notna()).pivot(
+            index="날짜", columns="티커", values="값"
+        )
+        axis = values.index.union(dates)
+        values = values.reindex(axis).ffill()
+        held = held.reindex(axis).astype(float).ffill().fillna(0)
+        df = values.where(held > 0, 0).loc[dates]
+        df = df.loc[:, (df != 0).any()].astype(PDF_FIELDS[field])
+        df.index.name = "날짜"
+        df.columns.name = None
+        return df
+
+    # -------------------------------------------------------------------------
+    # persistence
+    def save(self, root: str):
+        """변경 행과 보관 구간을 root 디렉터리에 저장한다."""
+        root = Path(root).expanduser()
+        root.mkdir(parents=True, exist_ok=True)
+        tmp = root / f"{_CHANGES_FILE}.tmp"
+        self._changes.reset_index(drop=True).to_parquet(tmp, index=False)
+        os.replace(tmp, root / _CHANGES_FILE)
+
+        meta = {
+            "fields": self.fields,
+            "dates": [_to_str(x) for x in self._dates],
+            "covered": {
+                k: [_to_str(s), _to_str(e)] for k, (s, e) in self._covered.items()
+            },
+        }
+        tmp = root / f"{_META_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp, root / _META_FILE)
+
+    @classmethod
+    def load(cls, root: str, **kwargs) -> "EtfPdfHistory":
+        """save로 저장한 디렉터리를 읽는다. kwargs는 생성자에 전달한다."""
+        root = Path(root).expanduser()
+        with open(root / _META_FILE, encoding="utf-8") as f:
+            meta = json.load(f)
+        h = cls(fields=meta["fields"], **kwargs)
+        h._dates = pd.to_datetime(meta["dates"], format="%Y%m%d")
+        h._covered = {
+            k: (to_timestamp(s), to_timestamp(e))
+            for k, (s, e) in meta["covered"].items()
+        }
+        h._changes = pd.read_parquet(root / _CHANGES_FILE)
+        return h
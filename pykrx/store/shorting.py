@@ -0,0 +1,262 @@
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.store.panel import PanelStore
+from pykrx.website import krx
+from pykrx.website.comm import FreshnessPolicy, concurrent_map
+
+# 공매도 패널의 저장 필드와 dtype
+SHORTING_FIELDS = {
+    "공매도거래량": "int64",
+    "거래량": "int64",
+    "공매도거래대금": "int64",
+    "거래대금": "int64",
+    "공매도잔고": "int64",
+    "상장주식수": "int64",
+    "공매도금액": "int64",
+}
+
+# 읽을 때 계산하는 비율 필드 (%): {필드명: (분자, 분모)}
+_RATIOS = {
+    "거래량비중": ("공매도거래량", "거래량"),
+    "거래대금비중": ("공매도거래대금", "거래대금"),
+    "잔고비중": ("공매도잔고", "상장주식수"),
+}
+
+_MARKETS = ["KOSPI", "KOSDAQ"]
+
+
+def _by_ticker(date: str, market: str) -> tuple:
+    trading = krx.get_shorting_trading_value_and_volume_by_ticker(
+        date, market, ["주식"]
+    )
+    balance = krx.get_shorting_balance_by_ticker(date, market)
+    return trading, balance
+
+
+def _by_date(fromdate: str, todate: str, ticker: str) -> tuple:
+    trading = krx.get_shorting_trading_value_and_volume_by_date(
+        fromdate, todate, ticker
+    )
+    balance = krx.get_shorting_balance_by_date(fromdate, todate, ticker)
+    return trading, balance
+
+
+def _to_fields(trading: DataFrame, balance: DataFrame) -> DataFrame:
+    """공매도 거래와 잔고 조회 결과를 SHORTING_FIELDS 열로 합친다."""
+    df = DataFrame(
+        {
+            "공매도거래량": trading[("거래량", "공매도")],
+            "거래량": trading[("거래량", "매수")],
+            "공매도거래대금": trading[("거래대금", "공매도")],
+            "거래대금": trading[("거래대금", "매수")],
+        }
+    )
+    return df.join(balance[["공매도잔고", "상장주식수", "공매도금액"]], how="inner")
+
+
+class ShortingStore(PanelStore):
+    """날짜 x 티커 공매도 거래/잔고 패널 저장소
+
+    PanelStore에 SHORTING_FIELDS를 저장한다. "거래량비중", "거래대금비중",
+    "잔고비중"은 저장하지 않고 읽을 때 계산하며, days_to_cover로 잔고를
+    평균 거래량으로 나눈 상환 소요일을 전 종목에 대해 한 번에 계산한다.
+
+        >> store = ShortingStore.create("~/.pykrx/shorting")
+        >> update_shorting(store, since="20230102")
+        >> store.frame("잔고비중", "20240102", "20240131")
+        >> store.days_to_cover("20240102", "20240131")
+
+    Args:
+        root (str): 저장소 경로 (ShortingStore.create로 먼저 생성)
+    """
+
+    @classmethod
+    def create(cls, root: str, ticker_capacity: int = 4096) -> "ShortingStore":
+        """빈 공매도 패널 저장소를 생성한다.
+
+        Args:
+            root            (str          ): 저장소 경로
+            ticker_capacity (int, optional): 티커 축의 초기 폭
+
+        Returns:
+            ShortingStore: 생성된 저장소
+        """
+        return super().create(root, SHORTING_FIELDS, ticker_capacity)
+
+    def field(self, name: str, fromdate: str = None, todate: str = None) -> np.ndarray:
+        """필드를 (날짜, 티커) 2차원 배열로 반환한다.
+
+        비율 필드는 분모가 0이거나 값이 없는 셀이 NaN인 새 float64 배열이다.
+        """
+        if name not in _RATIOS:
+            return super().field(name, fromdate, todate)
+        numerator, denominator = (
+            self.field(x, fromdate, todate) for x in _RATIOS[name]
+        )
+        present = self.present(fromdate, todate)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = numerator / denominator.astype(np.float64) * 100
+        return np.where(present & (denominator > 0), ratio, np.nan)
+
+    def days_to_cover(
+        self, fromdate: str = None, todate: str = None, window: int = 20
+    ) -> DataFrame:
+        """공매도잔고 / 직전 window 영업일 평균 거래량
+
+        평균 거래량은 당일을 포함한 window 영업일에서 값이 있는 날만 평균하며,
+        fromdate 이전의 저장된 영업일도 사용한다. 평균 거래량이 0이거나 값이
+        있는 날이 window보다 적으면 NaN이다.
+
+        Args:
+            fromdate (str, optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str, optional): 조회 종료 일자 (YYYYMMDD)
+            window   (int, optional): 평균 거래량의 영업일 수
+
+        Returns:
+            DataFrame: 날짜 index, 티커 columns인 float64 DataFrame
+        """
+        rows = self._date_slice(fromdate, todate)
+        if rows.start >= rows.stop:
+            return DataFrame(
+                index=self._dates[rows].rename("날짜"),
+                columns=self._tickers,
+                dtype=np.float64,
+            )
+        lo = max(rows.start - window + 1, 0)
+        dates = self._dates[lo : rows.stop]
+        first, last = dates[0], dates[-1]
+
+        present = self.present(first, last)
+        volume = np.where(present, self.field("거래량", first, last), 0)
+        c = np.zeros((volume.shape[0] + 1, volume.shape[1]))
+        np.cumsum(volume, axis=0, out=c[1:])
+        n = np.zeros_like(c)
+        np.cumsum(present, axis=0, out=n[1:])
+        hi = np.arange(1, volume.shape[0] + 1)
+        start = np.maximum(hi - window, 0)
+        count = n[hi] - n[start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            average = (c[hi] - c[start]) / count
+            days = self.field("공매도잔고", first, last) / average
+        days = np.where(present & (count >= window) & (average > 0), days, np.nan)
+
+        skip = rows.start - lo
+        return DataFrame(
+            days[skip:],
+            index=dates[skip:].rename("날짜"),
+            columns=self._tickers,
+        )
+
+
+def update_shorting(
+    store: ShortingStore,
+    until: str = None,
+    since: str = None,
+    markets: list = None,
+    tickers: list = None,
+    max_workers: int = 4,
+    calendar=None,
+) -> int:
+    """저장되지 않은 영업일의 공매도 거래와 잔고를 조회해서 추가한다.
+
+    공매도 조회는 (일자, 시장)별 전종목 조회와 종목별 기간 조회가 있다.
+    전종목 조회는 영업일 수 x 시장 수, 종목별 조회는 종목 수만큼 거래/잔고
+    요청이 필요하므로 둘 중 요청이 적은 쪽을 사용한다. 오랜 기간을 처음
+    채우거나 일부 종목만 저장할 때는 종목별 조회가, 매일 갱신할 때는
+    전종목 조회가 선택된다.
+
+    공매도 잔고는 거래일보다 늦게 공시되므로 거래나 잔고가 없는 첫 영업일에서
+    멈추고, 다음 호출에서 그 날부터 다시 조회한다.
+
+    Args:
+        store       (ShortingStore ): 대상 저장소
+        until       (str , optional): 종료 일자. 입력하지 않거나 데이터가
+                                      확정되지 않은 일자면 확정된 최근
+                                      영업일
+        since       (str , optional): 시작 일자. 저장소가 비어 있을 때 필요
+        markets     (list, optional): 조회 시장. 입력하지 않으면 KOSPI/KOSDAQ
+        tickers     (list, optional): 저장할 티커 목록. 입력하지 않으면
+                                      markets의 전 종목
+        max_workers (int , optional): 최대 동시 요청 수
+        calendar                    : calendar(fromdate, todate) -> 영업일
+                                      목록. 입력하지 않으면 KRX 영업일을
+                                      조회한다.
+
+    Returns:
+        int: 추가된 영업일 수
+    """
+    # 추가한 일자는 고칠 수 없으므로 장중이나 정산 전의 거래는 추가하지 않는다.
+    settled = FreshnessPolicy().settled_through()
+    if until is None or pd.Timestamp(until) > settled:
+        until = stock.get_nearest_business_day_in_a_week(f"{settled:%Y%m%d}")
+    if len(store.dates):
+        since = (store.dates[-1] + pd.Timedelta(days=1)).strftime("%Y%m%d")
+    elif since is None:
+        raise ValueError("빈 저장소를 채우려면 since가 필요합니다.")
+    if pd.Timestamp(since) > pd.Timestamp(until):
+        return 0
+    if calendar is None:
+
+        def calendar(fromdate, todate):
+            return stock.get_previous_business_days(fromdate=fromdate, todate=todate)
+
+    days = pd.DatetimeIndex(list(calendar(since, until)))
+    if not len(days):
+        return 0
+
+    markets = list(markets or _MARKETS)
+    universe = tickers
+    if universe is None:
+        universe = [x for m in markets for x in stock.get_market_ticker_list(until, m)]
+
+    if len(days) * len(markets) <= len(universe):
+        frames = _fetch_by_ticker(days, markets, max_workers)
+    else:
+        frames = _fetch_by_date(days, universe, max_workers)
+
+    count = 0
+    for day, df in zip(days, frames, strict=False):
+        if df.empty:
+            break
+        if tickers is not None:
+            df = df[df.index.isin(tickers)]
+        store.append(day, df)
+        count += 1
+    return count
+
+
+def _fetch_by_ticker(days: pd.DatetimeIndex, markets: list, max_workers: int):
+    """영업일마다 전종목 조회 결과를 합친 단면을 순서대로 만든다."""
+    # 날짜 순서대로 추가해야 하므로 max_workers 단위로 나눠서 조회한다.
+    size = max(max_workers // len(markets), 1)
+    for i in range(0, len(days), size):
+        chunk = days[i : i + size]
+        jobs = [(x.strftime("%Y%m%d"), m) for x in chunk for m in markets]
+        results = concurrent_map(lambda x: _by_ticker(*x), jobs, max_workers)
+        for j in range(len(chunk)):
+            parts = results[j * len(markets) : (j + 1) * len(markets)]
+            if any(t.empty or b.empty for t, b in parts):
+                yield DataFrame()
+                return
+            yield pd.concat([_to_fields(t, b) for t, b in parts])
+
+
+def _fetch_by_date(days: pd.DatetimeIndex, tickers: list, max_workers: int):
+    """종목마다 기간 조회한 결과를 영업일별 단면으로 나눈다."""
+    fromdate, todate = days[0].strftime("%Y%m%d"), days[-1].strftime("%Y%m%d")
+    results = concurrent_map(
+        lambda x: _by_date(fromdate, todate, x), tickers, max_workers
+    )
+    parts = {
+        ticker: _to_fields(t, b)
+        for ticker, (t, b) in zip(tickers, results, strict=True)
+        if not t.empty and not b.empty
+    }
+    if not parts:
+        return []
+    df = pd.concat(parts, names=["티커", "날짜"])
+    groups = dict(tuple(df.reset_index("티커").groupby(level="날짜")))
+    return [groups[x].set_index("티커") if x in groups else DataFrame() for x in days]
@@ -0,0 +1,334 @@
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx import stock
+from pykrx.website.comm import (
+    FreshnessPolicy,
+    concurrent_map,
+    merge_intervals,
+    missing_intervals,
+    to_timestamp,
+)
+
+
+class Dataset:
+    """로컬 저장소에 동기화할 수 있는 데이터셋 정의
+
+    Args:
+        name   (str ): 데이터셋 이름 (저장 경로로 사용)
+        fetch       : 데이터를 조회하는 pykrx 함수
+            - by="market" : fetch(date, market) -> 티커가 index인 DataFrame
+            - by="ticker" : fetch(fromdate, todate, ticker) -> 날짜가 index인
+                            DataFrame
+        by     (str ): 셀 구분 기준 (market/ticker)
+    """
+
+    def __init__(self, name: str, fetch, by: str):
+        if by not in ("market", "ticker"):
+            raise ValueError(f"by 옵션이 올바르지 않습니다: {by}")
+        self.name = name
+        self.fetch = fetch
+        self.by = by
+
+    @property
+    def keys(self) -> list:
+        if self.by == "market":
+            return ["날짜", "티커"]
+        return ["날짜"]
+
+
+DATASETS = {
+    x.name: x
+    for x in [
+        Dataset("ohlcv_by_ticker", stock.get_market_ohlcv_by_ticker, "market"),
+        Dataset("cap_by_ticker", stock.get_market_cap_by_ticker, "market"),
+        Dataset(
+            "fundamental_by_ticker", stock.get_market_fundamental_by_ticker, "market"
+        ),
+        Dataset(
+            "foreign_by_ticker",
+            stock.get_exhaustion_rates_of_foreign_investment_by_ticker,
+            "market",
+        ),
+        Dataset("snapshot", stock.get_market_snapshot, "market"),
+        Dataset("ohlcv_by_date", stock.get_market_ohlcv_by_date, "ticker"),
+        Dataset("cap_by_date", stock.get_market_cap_by_date, "ticker"),
+        Dataset("fundamental_by_date", stock.get_market_fundamental_by_date, "ticker"),
+        Dataset("index_ohlcv_by_date", stock.get_index_ohlcv_by_date, "ticker"),
+    ]
+}
+
+
+def _to_str(date) -> str:
+    return date.strftime("%Y%m%d")
+
+
+def _trading_days(fromdate: str, todate: str) -> list:
+    return stock.get_previous_business_days(fromdate=fromdate, todate=todate)
+
+
+class Warehouse:
+    """날짜 파티션으로 나뉜 로컬 컬럼 저장소
+
+    데이터셋/키(시장 또는 티커)별로 월 단위 Parquet(또는 Feather) 파일을
+    저장하고, 어떤 (데이터셋, 키, 날짜) 셀이 저장되어 있는지 _index.json에
+    구간 형태로 기록한다. sync()는 기록되지 않은 영업일만 조회한다.
+
+        root/
+            _index.json
+            ohlcv_by_ticker/KOSPI/202401.parquet
+            ohlcv_by_date/005930/202401.parquet
+
+    Args:
+        root        (str          ): 저장소 경로
+        file_format (str, optional): parquet/feather
+        max_workers (int, optional): 일자별 조회의 최대 동시 요청 수
+        calendar                   : calendar(fromdate, todate) -> 영업일
+                                     Timestamp 목록. 입력하지 않으면 KRX
+                                     영업일을 조회한다.
+    """
+
+    INDEX_FILE = "_index.json"
+
+    def __init__(
+        self,
+        root: str,
+        file_format: str = "parquet",
+        max_workers: int = 4,
+        calendar=None,
+    ):
+        if file_format not in ("parquet", "feather"):
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_format}")
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "pykrx.store를 사용하려면 pyarrow가 필요합니다: "
+                "pip install pykrx[store]"
+            ) from e
+
+        self.root = Path(root).expanduser()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.file_format = file_format
+        self.max_workers = max_workers
+        self.calendar = calendar if calendar is not None else _trading_days
+        self._index = self._load_index()
+
+    # -------------------------------------------------------------------------
+    # index
+    def _load_index(self) -> dict:
+        path = self.root / self.INDEX_FILE
+        if not path.exists():
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_index(self):
+        path = self.root / self.INDEX_FILE
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp, path)
+
+    def coverage(self, dataset: str, key: str) -> list:
+        """저장된 셀의 날짜 구간 목록
+
+        Returns:
+            list: [(Timestamp, Timestamp), ...]
+        """
+        intervals = self._index.get(dataset, {}).get(key, [])
+        return [(to_timestamp(s), to_timestamp(e)) for s, e in intervals]
+
+    def _mark(self, dataset: str, key: str, intervals: list):
+        merged = merge_intervals(self.coverage(dataset, key) + intervals)
+        self._index.setdefault(dataset, {})[key] = [
+            [_to_str(s), _to_str(e)] for s, e in merged
+        ]
+        self._save_index()
+
+    def missing(self, dataset: str, key: str, fromdate: str, todate: str) -> list:
+        """[fromdate, todate] 중 저장되지 않은 날짜 구간 목록"""
+        return missing_intervals(self.coverage(dataset, key), fromdate, todate)
+
+    # -------------------------------------------------------------------------
+    # sync
+    def sync(self, dataset: str, key: str, until: str = None, since: str = None) -> int:
+        """저장되지 않은 영업일의 데이터만 조회해서 저장한다.
+
+        Args:
+            dataset (str          ): 데이터셋 이름 (DATASETS 참고)
+            key     (str          ): 시장 (KOSPI/KOSDAQ/KONEX/ALL) 또는 티커
+            until   (str, optional): 동기화 종료 일자. 입력하지 않으면
+                                     데이터가 확정된 최근 영업일
+            since   (str, optional): 동기화 시작 일자. 입력하지 않으면 저장된
+                                     첫 일자부터 비어 있는 날짜를 채운다.
+
+        Returns:
+            int: 새로 저장한 행의 수
+
+            >> wh = Warehouse("~/.pykrx")
+            >> wh.sync("ohlcv_by_ticker", "KOSPI", since="20240102")
+            >> wh.sync("ohlcv_by_ticker", "KOSPI")  # 이후에는 새 영업일만 조회
+        """
+        spec = DATASETS[dataset]
+        if until is None:
+            # 장중이나 정산 전의 당일 데이터는 저장하면 다시 조회하지 않는다.
+            settled = FreshnessPolicy().settled_through()
+            until = stock.get_nearest_business_day_in_a_week(f"{settled:%Y%m%d}")
+        covered = self.coverage(dataset, key)
+        if since is None:
+            if not covered:
+                raise ValueError(
+                    f"{dataset}/{key}: 최초 동기화에는 since가 필요합니다."
+                )
+            since = covered[0][0]
+        if to_timestamp(since) > to_timestamp(until):
+            return 0
+
+        gaps = missing_intervals(covered, since, until)
+        if not gaps:
+            return 0
+
+        if spec.by == "market":
+            frames, done = self._fetch_by_day(spec, key, gaps)
+        else:
+            frames, done = self._fetch_by_range(spec, key, gaps)
+
+        rows = 0
+        if frames:
+            df = pd.concat(frames)
+            rows = len(df)
+            self._write(spec, key, df)
+        if done:
+            self._mark(dataset, key, done)
+        return rows
+
+    def _fetch_by_day(self, spec: Dataset, key: str, gaps: list):
+        days = []
+        for s, e in gaps:
+            days += [to_timestamp(x) for x in self.calendar(_to_str(s), _to_str(e))]
+
+        def _fetch(day):
+            return spec.fetch(_to_str(day), key)
+
+        results = concurrent_map(_fetch, days, self.max_workers)
+
+        frames = []
+        failed = []
+        for day, df in zip(days, results, strict=True):
+            if df is None or df.empty:
+                failed.append(day)
+                continue
+            df = df.copy()
+            df.index.name = "티커"
+            df.insert(0, "날짜", day)
+            frames.append(df.reset_index())
+
+        # 조회에 실패한 영업일은 다음 동기화에서 다시 조회한다.
+        done = []
+        for s, e in gaps:
+            cursor = s
+            for day in sorted(x for x in failed if s <= x <= e):
+                if cursor < day:
+                    done.append((cursor, day - pd.Timedelta(days=1)))
+                cursor = day + pd.Timedelta(days=1)
+            if cursor <= e:
+                done.append((cursor, e))
+        return frames, done
+
+    def _fetch_by_range(self, spec: Dataset, key: str, gaps: list):
+        frames = []
+        done = []
+        for s, e in gaps:
+            df = spec.fetch(_to_str(s), _to_str(e), key)
+            if df is None or df.empty:
+                if self.calendar(_to_str(s), _to_str(e)):
+                    continue
+            else:
+                df = df.copy()
+                df.index.name = "날짜"
+                frames.append(df.reset_index())
+            done.append((s, e))
+        return frames, done
+
+    # -------------------------------------------------------------------------
+    # storage
+    def _partition_dir(self, dataset: str, key: str) -> Path:
+        return self.root / dataset / key
+
+    def _write(self, spec: Dataset, key: str, df: DataFrame):
+        path = self._partition_dir(spec.name, key)
+        path.mkdir(parents=True, exist_ok=True)
+        for month, part in df.groupby(df["날짜"].dt.strftime("%Y%m")):
+            file = path / f"{month}.{self.file_format}"
+            if file.exists():
+                part = pd.concat([self._read_file(file), part])
+                part = part.drop_duplicates(spec.keys, keep="last")
+            part = part.sort_values(spec.keys).reset_index(drop=True)
+            tmp = file.with_suffix(".tmp")
+            if self.file_format == "parquet":
+                part.to_parquet(tmp, index=False)
+            else:
+                part.to_feather(tmp)
+            os.replace(tmp, file)
+
+    def _read_file(self, file: Path, columns: list = None) -> DataFrame:
+        if self.file_format == "parquet":
+            return pd.read_parquet(file, columns=columns)
+        return pd.read_feather(file, columns=columns)
+
+    def read(
+        self,
+        dataset: str,
+        key: str,
+        fromdate: str = None,
+        todate: str = None,
+        columns: list = None,
+    ) -> DataFrame:
+        """저장된 데이터를 디스크에서 읽는다.
+
+        기간에 해당하지 않는 월 파티션은 열지 않으며, columns에 지정한 열만
+        읽는다.
+
+        Args:
+            dataset  (str           ): 데이터셋 이름
+            key      (str           ): 시장 또는 티커
+            fromdate (str , optional): 조회 시작 일자 (YYYYMMDD)
+            todate   (str , optional): 조회 종료 일자 (YYYYMMDD)
+            columns  (list, optional): 읽을 열 목록
+
+        Returns:
+            DataFrame: by="market"이면 (날짜, 티커), by="ticker"이면 날짜가
+                       index인 DataFrame
+        """
+        spec = DATASETS[dataset]
+        path = self._partition_dir(dataset, key)
+        if not path.exists():
+            return DataFrame()
+
+        lo = to_timestamp(fromdate) if fromdate is not None else None
+        hi = to_timestamp(todate) if todate is not None else None
+        if columns is not None:
+            columns = spec.keys + [x for x in columns if x not in spec.keys]
+
+        frames = []
+        for file in sorted(path.glob(f"*.{self.file_format}")):
+            month = pd.Timestamp(file.stem + "01")
+            if lo is not None and month + pd.offsets.MonthEnd(0) < lo:
+                continue
+            if hi is not None and month > hi:
+                continue
+            df = self._read_file(file, columns)
+            if lo is not None:
+                df = df[df["날짜"] >= lo]
+            if hi is not None:
+                df = df[df["날짜"] <= hi]
+            frames.append(df)
+
+        if not frames:
+            return DataFrame()
+        return pd.concat(frames, ignore_index=True).set_index(spec.keys)
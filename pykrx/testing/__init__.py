@@ -0,0 +1,4 @@
+from .schemas import SCHEMAS, SyntheticMarket
+from .server import Behavior, FakeServer
+
+__all__ = ["SCHEMAS", "Behavior", "FakeServer", "SyntheticMarket"]
@@ -0,0 +1,895 @@
+import datetime
+import math
+import zlib
+
+# 전종목 장외 채권수익률의 종목명과 개별추이 조회 코드
+BONDS = [
+    ("국고채 1년", "3006", 1.5),
+    ("국고채 2년", "3019", 2.0),
+    ("국고채 3년", "3000", 2.2),
+    ("국고채 5년", "3007", 2.4),
+    ("국고채 10년", "3013", 2.6),
+    ("국고채 20년", "3014", 2.65),
+    ("국고채 30년", "3017", 2.55),
+    ("국민주택 1종 5년", "3008", 2.55),
+    ("회사채 AA-(무보증 3년)", "3009", 2.8),
+    ("회사채 BBB- (무보증 3년)", "3010", 8.6),
+    ("CD(91일)", "4000", 1.5),
+]
+
+# 지수 분류(idxIndMidclssCd)별 (지수명, 영문명, 그룹, 티커, 기준일)
+INDICES = {
+    "01": [("KRX 300", "KRX 300", "5", "300", "2010.01.04")],
+    "02": [
+        ("코스피", "KOSPI", "1", "001", "1980.01.04"),
+        ("코스피 200", "KOSPI 200", "1", "028", "1990.01.03"),
+    ],
+    "03": [
+        ("코스닥", "KOSDAQ", "2", "001", "1996.07.01"),
+        ("코스닥 150", "KOSDAQ 150", "2", "203", "2010.01.04"),
+    ],
+    "04": [
+        ("KRX 300 정보기술", "KRX 300 Information Technology", "5", "603", "2010.01.04")
+    ],
+}
+
+# 투자자별 거래실적 상세 조회의 투자자구분 (TRDVAL1 ~ TRDVAL11 순서)
+INVESTORS = [
+    "금융투자",
+    "보험",
+    "투신",
+    "사모",
+    "은행",
+    "기타금융",
+    "연기금",
+    "기타법인",
+    "개인",
+    "외국인",
+    "기타외국인",
+]
+
+# 일반 조회의 투자자구분별 상세 투자자구분의 위치
+_GENERAL_INVESTORS = [range(0, 7), [7], [8], [9, 10]]
+
+_MARKETS = {
+    "STK": ("유가증권", "KOSPI"),
+    "KSQ": ("코스닥", "KOSDAQ"),
+}
+
+
+def _noise(*keys) -> float:
+    """keys로 정해지는 [0, 1) 사이의 값"""
+    text = "/".join(str(x) for x in keys).encode("utf-8")
+    return zlib.crc32(text) / 2**32
+
+
+def _parse(date: str) -> datetime.date:
+    return datetime.datetime.strptime(date.replace("-", ""), "%Y%m%d").date()
+
+
+def business_days(start: str, end: str) -> list:
+    """start~end 사이의 평일 (최근 날짜부터, KRX 기간 조회 응답 순서)"""
+    s, e = _parse(start), _parse(end)
+    days = []
+    while e >= s:
+        if e.weekday() < 5:
+            days.append(e)
+        e -= datetime.timedelta(days=1)
+    return days
+
+
+def _previous(day: datetime.date) -> datetime.date:
+    day -= datetime.timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= datetime.timedelta(days=1)
+    return day
+
+
+def _n(value) -> str:
+    return f"{value:,}"
+
+
+def _f(value: float, digits: int = 2) -> str:
+    return f"{value:,.{digits}f}"
+
+
+def _slash(day: datetime.date) -> str:
+    return day.strftime("%Y/%m/%d")
+
+
+def _fluc(change: float) -> str:
+    return "1" if change > 0 else "2" if change < 0 else "3"
+
+
+class SyntheticMarket:
+    """KRX와 Naver 응답을 만드는 결정적 합성 시장
+
+    같은 (seed, 종목, 일자)에는 항상 같은 값을 만들므로 기간을 나눠 조회해도
+    결과가 이어진다. 첫 종목은 005930이고 평일만 거래일로 본다.
+
+    Args:
+        size (int, optional): 상장 종목 수
+        seed (int, optional): 합성 데이터의 seed
+    """
+
+    def __init__(self, size: int = 200, seed: int = 0):
+        self.seed = seed
+        self.tickers = []
+        for i in range(size):
+            code = f"{(5930 + i * 7919) % 1000000:06d}"
+            market = "STK" if i % 3 else "KSQ"
+            self.tickers.append(
+                {
+                    "short_code": code,
+                    "full_code": f"KR7{code}000",
+                    "name": f"합성{i:04d}",
+                    "market": market,
+                    "shares": int(10_000_000 + _noise(seed, code, "shares") * 1e9),
+                }
+            )
+        self._by_isin = {x["full_code"]: x for x in self.tickers}
+        # ETF/ETN/ELW는 상장 종목 수에 비례해서 만든다.
+        self.products = {
+            "ETF": [f"{400000 + i * 37:06d}" for i in range(max(size // 4, 1))],
+            "ETN": [f"{580000 + i:06d}" for i in range(max(size // 20, 1))],
+            "ELW": [f"57{i:04d}" for i in range(min(size, 9999))],
+        }
+
+    def listed(self, market: str = "ALL") -> list:
+        return [x for x in self.tickers if market in ("ALL", x["market"])]
+
+    def ticker(self, isin: str) -> dict:
+        return self._by_isin.get(isin)
+
+    def close(self, code: str, day: datetime.date) -> int:
+        base = 1000 + _noise(self.seed, code, "base") * 99000
+        t = day.toordinal()
+        phase = _noise(self.seed, code, "phase") * 2 * math.pi
+        level = 0.3 * math.sin(t / 60 + phase) + 0.1 * math.sin(t / 9 + phase)
+        level += 0.04 * (_noise(self.seed, code, t) - 0.5)
+        tick = 5 if base < 5000 else 10 if base < 50000 else 100
+        return max(int(base * math.exp(level) / tick) * tick, tick)
+
+    def ohlcv(self, code: str, day: datetime.date) -> dict:
+        close = self.close(code, day)
+        prev = self.close(code, _previous(day))
+        spread = 0.01 + 0.03 * _noise(self.seed, code, day, "spread")
+        open_ = int(prev + (close - prev) * _noise(self.seed, code, day, "open"))
+        high = int(max(open_, close) * (1 + spread))
+        low = int(min(open_, close) * (1 - spread))
+        volume = int(10_000 + _noise(self.seed, code, day, "volume") * 5_000_000)
+        return {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "prev": prev,
+            "volume": volume,
+            "value": volume * (high + low) // 2,
+        }
+
+    def fundamental(self, code: str) -> dict:
+        eps = int(100 + _noise(self.seed, code, "eps") * 10000)
+        bps = int(eps * (5 + 10 * _noise(self.seed, code, "bps")))
+        dps = int(eps * 0.3 * _noise(self.seed, code, "dps"))
+        return {"eps": eps, "bps": bps, "dps": dps}
+
+    def index(self, code: str, day: datetime.date) -> float:
+        base = 1000 * (1 + _noise(self.seed, code, "index") * 2)
+        t = day.toordinal()
+        return base * math.exp(0.2 * math.sin(t / 80) + 0.01 * _noise(code, t))
+
+    def bond(self, code: str, base: float, day: datetime.date) -> float:
+        t = day.toordinal()
+        return base + 0.5 * math.sin(t / 120) + 0.02 * _noise(self.seed, code, t)
+
+    def shorting(self, ticker: dict, day: datetime.date) -> dict:
+        """공매도 거래량/거래대금과 잔고수량. 잔고는 상장주식수의 3% 이내다."""
+        code = ticker["short_code"]
+        p = self.ohlcv(code, day)
+        ratio = 0.05 * _noise(self.seed, code, day, "short")
+        t = day.toordinal()
+        level = 0.5 + 0.5 * math.sin(t / 30 + _noise(self.seed, code) * 6)
+        balance = int(ticker["shares"] * 0.03 * level * _noise(self.seed, code, "bal"))
+        return {
+            "volume": int(p["volume"] * ratio),
+            "value": int(p["value"] * ratio),
+            "balance": balance,
+        }
+
+    def flows(self, target: str, day: datetime.date, measure: int) -> list:
+        """상세 투자자구분(INVESTORS)별 (매도, 매수). 매도와 매수의 합계는 같다.
+
+        Args:
+            target  (str ): 종목 ISIN 또는 시장 ID
+            day     (date): 거래일
+            measure (int ): 1: 거래량 / 2: 거래대금
+        """
+        scale = 1_000_000 if target in ("STK", "KSQ", "KNX", "ALL") else 10_000
+        price = 1 if measure == 1 else 1000 + int(_noise(self.seed, target) * 99000)
+        flows = []
+        for name in INVESTORS:
+            sell, buy = (
+                int(scale * _noise(self.seed, target, day, name, side))
+                for side in ("sell", "buy")
+            )
+            flows.append([sell, buy])
+        # 개인의 매수로 매도와 매수의 합계를 맞춘다.
+        flows[8][0] += scale * 10
+        flows[8][1] = sum(x[0] for x in flows) - sum(
+            x[1] for i, x in enumerate(flows) if i != 8
+        )
+        return [(sell * price, buy * price) for sell, buy in flows]
+
+
+def _price_row(market: SyntheticMarket, ticker: dict, day: datetime.date) -> dict:
+    p = market.ohlcv(ticker["short_code"], day)
+    change = p["close"] - p["prev"]
+    return {
+        "TDD_CLSPRC": _n(p["close"]),
+        "FLUC_TP_CD": _fluc(change),
+        "CMPPREVDD_PRC": _n(change),
+        "FLUC_RT": _f(change / p["prev"] * 100),
+        "TDD_OPNPRC": _n(p["open"]),
+        "TDD_HGPRC": _n(p["high"]),
+        "TDD_LWPRC": _n(p["low"]),
+        "ACC_TRDVOL": _n(p["volume"]),
+        "ACC_TRDVAL": _n(p["value"]),
+        "MKTCAP": _n(p["close"] * ticker["shares"]),
+        "LIST_SHRS": _n(ticker["shares"]),
+    }
+
+
+def _fundamental_row(market: SyntheticMarket, ticker: dict, day: datetime.date):
+    p = market.ohlcv(ticker["short_code"], day)
+    f = market.fundamental(ticker["short_code"])
+    change = p["close"] - p["prev"]
+    return {
+        "TDD_CLSPRC": _n(p["close"]),
+        "FLUC_TP_CD": _fluc(change),
+        "CMPPREVDD_PRC": _n(change),
+        "FLUC_RT": _f(change / p["prev"] * 100),
+        "EPS": _n(f["eps"]),
+        "PER": _f(p["close"] / f["eps"]),
+        "FWD_EPS": "-",
+        "FWD_PER": "-",
+        "BPS": _n(f["bps"]),
+        "PBR": _f(p["close"] / f["bps"]),
+        "DPS": _n(f["dps"]),
+        "DVD_YLD": _f(f["dps"] / p["close"] * 100),
+    }
+
+
+def finder_stkisu(market: SyntheticMarket, params: dict) -> dict:
+    rows = []
+    for x in market.listed(params.get("mktsel", "ALL")):
+        name, eng = _MARKETS[x["market"]]
+        rows.append(
+            {
+                "full_code": x["full_code"],
+                "short_code": x["short_code"],
+                "codeName": x["name"],
+                "marketCode": x["market"],
+                "marketName": name,
+                "marketEngName": eng,
+                "ord1": "",
+                "ord2": "16",
+            }
+        )
+    return {"block1": rows}
+
+
+def finder_listdelisu(market: SyntheticMarket, params: dict) -> dict:
+    return {"block1": []}
+
+
+def 전종목시세(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"OutBlock_1": []}
+    rows = []
+    for x in market.listed(params.get("mktId", "ALL")):
+        row = {
+            "ISU_SRT_CD": x["short_code"],
+            "ISU_CD": x["full_code"],
+            "ISU_ABBRV": x["name"],
+            "MKT_NM": _MARKETS[x["market"]][1],
+            "SECT_TP_NM": "",
+        }
+        row.update(_price_row(market, x, day))
+        row["MKT_ID"] = x["market"]
+        rows.append(row)
+    return {"OutBlock_1": rows}
+
+
+def 개별종목시세(market: SyntheticMarket, params: dict) -> dict:
+    ticker = market.ticker(params.get("isuCd"))
+    if ticker is None:
+        return {"output": []}
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        rows.append({"TRD_DD": _slash(day), **_price_row(market, ticker, day)})
+    return {"output": rows}
+
+
+def PER_PBR_배당수익률_전종목(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"output": []}
+    rows = []
+    for x in market.listed(params.get("mktId", "ALL")):
+        row = {
+            "ISU_SRT_CD": x["short_code"],
+            "ISU_CD": x["full_code"],
+            "MKT_ID": x["market"],
+            "ISU_ABBRV": x["name"],
+            "ISU_ABBRV_STR": x["name"],
+        }
+        row.update(_fundamental_row(market, x, day))
+        rows.append(row)
+    return {"output": rows}
+
+
+def PER_PBR_배당수익률_개별(market: SyntheticMarket, params: dict) -> dict:
+    ticker = market.ticker(params.get("isuCd"))
+    if ticker is None:
+        return {"output": []}
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        rows.append({"TRD_DD": _slash(day), **_fundamental_row(market, ticker, day)})
+    return {"output": rows}
+
+
+def 전체지수기본정보(market: SyntheticMarket, params: dict) -> dict:
+    rows = []
+    for name, eng, group, code, base in INDICES.get(params.get("idxIndMidclssCd"), []):
+        rows.append(
+            {
+                "IDX_NM": name,
+                "IDX_ENG_NM": eng,
+                "BAS_TM_CONTN": base,
+                "ANNC_TM_CONTN": base,
+                "BAS_IDX_CONTN": "1,000.00",
+                "CALC_CYCLE_CONTN": "1초",
+                "CALC_TM_CONTN": "09:00:10 ~ 15:30:00",
+                "COMPST_ISU_CNT": _n(len(market.tickers)),
+                "IND_TP_CD": group,
+                "IDX_IND_CD": code,
+            }
+        )
+    return {"output": rows}
+
+
+def 개별지수시세(market: SyntheticMarket, params: dict) -> dict:
+    code = params.get("indIdx", "") + params.get("indIdx2", "")
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        close = market.index(code, day)
+        prev = market.index(code, _previous(day))
+        change = close - prev
+        volume = int(1e8 + _noise(code, day, "volume") * 5e8)
+        rows.append(
+            {
+                "TRD_DD": _slash(day),
+                "CLSPRC_IDX": _f(close),
+                "FLUC_TP_CD": _fluc(change),
+                "PRV_DD_CMPR": _f(change),
+                "UPDN_RATE": _f(change / prev * 100),
+                "OPNPRC_IDX": _f(prev),
+                "HGPRC_IDX": _f(max(prev, close) * 1.005),
+                "LWPRC_IDX": _f(min(prev, close) * 0.995),
+                "ACC_TRDVOL": _n(volume),
+                "ACC_TRDVAL": _n(volume * 30_000),
+                "MKTCAP": _n(int(close * 1e12)),
+            }
+        )
+    return {"output": rows}
+
+
+def 전종목_장외채권수익률(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"output": []}
+    rows = []
+    for name, code, base in BONDS:
+        value = market.bond(code, base, day)
+        prev = market.bond(code, base, _previous(day))
+        rows.append(
+            {
+                "ITM_TP_NM": name,
+                "LST_ORD_BAS_YD": _f(value, 3),
+                "CMP_YD": _f(value - prev, 3),
+            }
+        )
+    return {"output": rows}
+
+
+def 개별추이_장외채권수익률(market: SyntheticMarket, params: dict) -> dict:
+    code = params.get("bndKindTpCd")
+    base = {x[1]: x[2] for x in BONDS}.get(code)
+    if base is None:
+        return {"output": []}
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        value = market.bond(code, base, day)
+        prev = market.bond(code, base, _previous(day))
+        rows.append(
+            {
+                "DISCLS_DD": _slash(day),
+                "LST_ORD_BAS_YD": _f(value, 3),
+                "CMP_YD": _f(value - prev, 3),
+            }
+        )
+    return {"output": rows}
+
+
+def _investor_flows(market: SyntheticMarket, target: str, params: dict) -> dict:
+    measure = int(params.get("trdVolVal", 1))
+    side = int(params.get("askBid", 3))
+    detail = params.get("detailView") == "1"
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        flows = market.flows(target, day, measure)
+        values = [(sell, buy, buy - sell)[side - 1] for sell, buy in flows]
+        if not detail:
+            values = [sum(values[i] for i in x) for x in _GENERAL_INVESTORS]
+        row = {"TRD_DD": _slash(day)}
+        row.update({f"TRDVAL{i + 1}": _n(x) for i, x in enumerate(values)})
+        row["TRDVAL_TOT"] = _n(sum(values))
+        rows.append(row)
+    return {"output": rows}
+
+
+def 투자자별_거래실적_전체시장_일별추이(market: SyntheticMarket, params: dict) -> dict:
+    return _investor_flows(market, params.get("mktId", "ALL"), params)
+
+
+def 투자자별_거래실적_개별종목_일별추이(market: SyntheticMarket, params: dict) -> dict:
+    if market.ticker(params.get("isuCd")) is None:
+        return {"output": []}
+    return _investor_flows(market, params["isuCd"], params)
+
+
+_ISSUERS = ["KB증권", "미래에셋증권", "삼성증권", "한국투자증권", "NH투자증권"]
+
+
+def _product_rows(market: SyntheticMarket, kind: str) -> list:
+    rows = []
+    for i, code in enumerate(market.products[kind]):
+        listed = datetime.date(2010, 1, 4) + datetime.timedelta(days=i * 3)
+        issuer = _ISSUERS[i % len(_ISSUERS)]
+        rows.append(
+            {
+                "ISU_CD": f"KR7{code}000",
+                "ISU_SRT_CD": code,
+                "ISU_NM": f"{issuer} 합성{kind}{i:04d}",
+                "ISU_ABBRV": f"합성{kind}{i:04d}",
+                "LIST_DD": _slash(listed),
+                "IDX_CALC_INST_NM1": issuer,
+            }
+        )
+    return rows
+
+
+def ETF_전종목기본종목(market: SyntheticMarket, params: dict) -> dict:
+    return {"output": _product_rows(market, "ETF")}
+
+
+def ETN_전종목기본종목(market: SyntheticMarket, params: dict) -> dict:
+    return {"output": _product_rows(market, "ETN")}
+
+
+def ELW_전종목기본종목(market: SyntheticMarket, params: dict) -> dict:
+    rows = _product_rows(market, "ELW")
+    for i, row in enumerate(rows):
+        row["ULY_NM"] = market.tickers[i % len(market.tickers)]["name"]
+        row["RGHT_TP_NM"] = "콜" if i % 2 else "풋"
+        row["ELW_EXER_TP"] = "유럽형"
+    return {"output": rows}
+
+
+def 전종목시세_ETF(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"output": []}
+    rows = []
+    for code in market.products["ETF"]:
+        ticker = {"short_code": code, "shares": 1_000_000}
+        row = {"ISU_SRT_CD": code, "ISU_CD": f"KR7{code}000", "SECUGRP_ID": "EF"}
+        row.update(_price_row(market, ticker, day))
+        close = market.close(code, day)
+        row["NAV"] = _f(close * (1 + 0.002 * (_noise(code, day) - 0.5)))
+        row["OBJ_STKPRC_IDX"] = _f(close / 100)
+        rows.append(row)
+    return {"output": rows}
+
+
+_SHORTING_MARKETS = {"1": "STK", "2": "KSQ", "3": "KNX"}
+
+
+def _shorting_row(market: SyntheticMarket, ticker: dict, day: datetime.date):
+    p, short = market.ohlcv(ticker["short_code"], day), market.shorting(ticker, day)
+    return {
+        "CVSRTSELL_TRDVOL": _n(short["volume"]),
+        "ACC_TRDVOL": _n(p["volume"]),
+        "TRDVOL_WT": _f(short["volume"] / p["volume"] * 100),
+        "CVSRTSELL_TRDVAL": _n(short["value"]),
+        "ACC_TRDVAL": _n(p["value"]),
+        "TRDVAL_WT": _f(short["value"] / p["value"] * 100),
+    }
+
+
+def _balance_row(market: SyntheticMarket, ticker: dict, day: datetime.date):
+    close = market.close(ticker["short_code"], day)
+    balance = market.shorting(ticker, day)["balance"]
+    return {
+        "BAL_QTY": _n(balance),
+        "LIST_SHRS": _n(ticker["shares"]),
+        "BAL_AMT": _n(balance * close),
+        "MKTCAP": _n(ticker["shares"] * close),
+        "BAL_RTO": _f(balance / ticker["shares"] * 100),
+    }
+
+
+def 개별종목_공매도_거래_전종목(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"OutBlock_1": []}
+    rows = [
+        {
+            "ISU_CD": x["short_code"],
+            "ISU_ABBRV": x["name"],
+            **_shorting_row(market, x, day),
+        }
+        for x in market.listed(params["mktId"])
+    ]
+    return {"OutBlock_1": rows}
+
+
+def 개별종목_공매도_거래_개별추이(market: SyntheticMarket, params: dict) -> dict:
+    ticker = market.ticker(params.get("isuCd"))
+    if ticker is None:
+        return {"OutBlock_1": []}
+    rows = [
+        {"TRD_DD": _slash(day), **_shorting_row(market, ticker, day)}
+        for day in business_days(params["strtDd"], params["endDd"])
+    ]
+    return {"OutBlock_1": rows}
+
+
+def 전종목_공매도_잔고(market: SyntheticMarket, params: dict) -> dict:
+    day = _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"OutBlock_1": []}
+    rows = [
+        {
+            "ISU_CD": x["short_code"],
+            "ISU_ABBRV": x["name"],
+            **_balance_row(market, x, day),
+        }
+        for x in market.listed(_SHORTING_MARKETS[str(params["mktTpCd"])])
+    ]
+    return {"OutBlock_1": rows}
+
+
+def 개별종목_공매도_잔고(market: SyntheticMarket, params: dict) -> dict:
+    ticker = market.ticker(params.get("isuCd"))
+    if ticker is None:
+        return {"OutBlock_1": []}
+    rows = [
+        {"RPT_DUTY_OCCR_DD": _slash(day), **_balance_row(market, ticker, day)}
+        for day in business_days(params["strtDd"], params["endDd"])
+    ]
+    return {"OutBlock_1": rows}
+
+
+def _nav(market: SyntheticMarket, code: str, day: datetime.date) -> float:
+    close = market.close(code, day)
+    return close * (1 + 0.004 * (_noise(market.seed, code, day, "nav") - 0.5))
+
+
+def 추적오차율추이(market: SyntheticMarket, params: dict) -> dict:
+    code = params["isuCd"][3:9]
+    rows = []
+    for day in business_days(params["strtDd"], params["endDd"]):
+        nav, prev = _nav(market, code, day), _nav(market, code, _previous(day))
+        index = nav / 100 * (1 + 0.002 * (_noise(code, day, "index") - 0.5))
+        rows.append(
+            {
+                "TRD_DD": _slash(day),
+                "LST_NAV": _f(nav),
+                "NAV_CHG_RT": _f((nav / prev - 1) * 100),
+                "OBJ_STKPRC_IDX": _f(index),
+                "IDX_CHG_RTO": _f((nav / prev - 1) * 100),
+                "TRACE_YD_MULT": "1.0",
+                "TRACE_ERR_RT": _f(0.1 + _noise(code, "trace")),
+            }
+        )
+    return {"output": rows}
+
+
+def 괴리율추이(market: SyntheticMarket, params: dict) -> dict:
+    code = params["isuCd"][3:9]
+    rows = []
+    for day in reversed(business_days(params["strtDd"], params["endDd"])):
+        close, nav = market.close(code, day), _nav(market, code, day)
+        rows.append(
+            {
+                "TRD_DD": _slash(day),
+                "FLUC_TP_CD": "1",
+                "CLSPRC": _n(close),
+                "LST_NAV": _f(nav),
+                "DIVRG_RT": _f((close / nav - 1) * 100),
+            }
+        )
+    return {"output": rows}
+
+
+def _second_thursday(year: int, month: int) -> datetime.date:
+    first = datetime.date(year, month, 1)
+    return first + datetime.timedelta(days=(3 - first.weekday()) % 7 + 7)
+
+
+def _future_contracts(prod: str) -> list:
+    """2020년부터 2027년까지 분기 만기 선물의 (종목코드, 만기월, 최종거래일)"""
+    digit = 1 + int(_noise(prod, "code") * 8)
+    return [
+        (f"1{digit}{y % 100:02d}{m:02d}00", f"{y}{m:02d}", _second_thursday(y, m))
+        for y in range(2020, 2028)
+        for m in (3, 6, 9, 12)
+    ]
+
+
+def _future_price(market: SyntheticMarket, prod: str, day, expiry) -> float:
+    """기초지수에 만기까지의 보유비용을 더한 선물 가격"""
+    spot = market.index(prod, day) / 3
+    basis = 0.03 * (expiry - day).days / 365
+    return round(spot * (1 + basis + 0.001 * _noise(prod, expiry, day)), 2)
+
+
+# 합성 옵션 가격의 금리, 보유비용과 변동성 smile
+_OPTION_RATE = 0.035
+_OPTION_CARRY = 0.03
+
+
+def _option_volatility(moneyness: float) -> float:
+    return 0.2 - 0.1 * moneyness + 0.3 * moneyness**2
+
+
+def _option_expiries() -> list:
+    """2020년부터 2027년까지 월물 옵션의 (만기월, 최종거래일)"""
+    return [
+        (f"{y}{m:02d}", _second_thursday(y, m))
+        for y in range(2020, 2028)
+        for m in range(1, 13)
+    ]
+
+
+def _option_price(call: bool, forward: float, strike: float, t: float) -> float:
+    """Black 모형의 옵션 가격"""
+    discount = math.exp(-_OPTION_RATE * t)
+    if t <= 0:
+        intrinsic = forward - strike if call else strike - forward
+        return max(intrinsic, 0.0)
+    vol = _option_volatility(math.log(strike / forward))
+    d1 = (math.log(forward / strike) + vol**2 * t / 2) / (vol * math.sqrt(t))
+    d2 = d1 - vol * math.sqrt(t)
+
+    def cdf(x):
+        return (1 + math.erf(x / math.sqrt(2))) / 2
+
+    if call:
+        return discount * (forward * cdf(d1) - strike * cdf(d2))
+    return discount * (strike * cdf(-d2) - forward * cdf(-d1))
+
+
+def _option_info(prod: str) -> dict:
+    digit = 1 + int(_noise(prod, "code") * 8)
+    rows = []
+    for month, last in _option_expiries():
+        listed = last - datetime.timedelta(days=365)
+        for cp, right in (("C", "콜"), ("P", "풋")):
+            code = f"{2 if cp == 'C' else 3}{digit}{month[2:]}00"
+            rows.append(
+                {
+                    "ISU_CD": f"KR4{code}0",
+                    "ISU_SRT_CD": code,
+                    "ISU_NM": f"합성 {cp} {month} 300.0",
+                    "ISU_ABBRV": f"{cp} {month} 300.0",
+                    "ISU_ENG_NM": f"SYNTHETIC {cp} {month} 300.0",
+                    "LIST_DD": _slash(listed),
+                    "LSTTRD_DD": _slash(last),
+                    "LST_SETL_DD": _slash(last + datetime.timedelta(days=1)),
+                    "ULY_TP_NM": "지수(Index)",
+                    "SETLMULT": "250,000",
+                    "RGHT_TP_NM": right,
+                    "EXER_PRC": "300.00",
+                }
+            )
+    return {"output": rows}
+
+
+def _option_chain(market: SyntheticMarket, prod: str, day) -> dict:
+    """가까운 3개 월물, ATM 주변 21개 행사가의 콜/풋 시세"""
+    digit = 1 + int(_noise(prod, "code") * 8)
+    spot = market.index(prod, day) / 3
+    atm = round(spot / 2.5) * 2.5
+    rows = []
+    for month, last in [x for x in _option_expiries() if x[1] >= day][:3]:
+        t = (last - day).days / 365
+        forward = spot * math.exp(_OPTION_CARRY * t)
+        for i in range(21):
+            strike = atm + 2.5 * (i - 10)
+            for cp in ("C", "P"):
+                code = f"{2 if cp == 'C' else 3}{digit}{month[2:]}{i:02d}"
+                price = round(_option_price(cp == "C", forward, strike, t), 2)
+                volume = int(10_000 * (0.5 + _noise(prod, code, day))) if price else 0
+                close = _f(price) if price else "-"
+                rows.append(
+                    {
+                        "ISU_CD": f"KR4{code}0",
+                        "ISU_SRT_CD": code,
+                        "ISU_NM": f"합성 {cp} {month} {strike:.1f}",
+                        "TDD_CLSPRC": close,
+                        "FLUC_TP_CD": "0",
+                        "CMPPREVDD_PRC": "-",
+                        "TDD_OPNPRC": close,
+                        "TDD_HGPRC": close,
+                        "TDD_LWPRC": close,
+                        "SPOT_PRC": _f(spot),
+                        "SETL_PRC": _f(price),
+                        "ACC_TRDVOL": _n(volume),
+                        "ACC_TRDVAL": _n(int(volume * price * 250_000)),
+                        "ACC_OPNINT_QTY": _n(volume * 3),
+                        "SECUGRP_ID": "OP",
+                    }
+                )
+    return {"output": rows}
+
+
+def 선물_전종목기본정보(market: SyntheticMarket, params: dict) -> dict:
+    if params["prodId"].startswith("KRDRVOP"):
+        return _option_info(params["prodId"])
+    rows = []
+    for code, month, last in _future_contracts(params["prodId"]):
+        listed = last - datetime.timedelta(days=3 * 365)
+        rows.append(
+            {
+                "ISU_CD": f"KR4{code}0",
+                "ISU_SRT_CD": code,
+                "ISU_NM": f"합성 F {month}",
+                "ISU_ABBRV": f"F {month}",
+                "ISU_ENG_NM": f"SYNTHETIC F {month}",
+                "LIST_DD": _slash(listed),
+                "LSTTRD_DD": _slash(last),
+                "LST_SETL_DD": _slash(last + datetime.timedelta(days=1)),
+                "ULY_TP_NM": "지수(Index)",
+                "SETLMULT": "250,000",
+                "RGHT_TP_NM": "-",
+                "EXER_PRC": ".00",
+            }
+        )
+    return {"output": rows}
+
+
+def 선물_전종목시세(market: SyntheticMarket, params: dict) -> dict:
+    prod, day = params["prodId"], _parse(params["trdDd"])
+    if day.weekday() >= 5:
+        return {"output": []}
+    if prod.startswith("KRDRVOP"):
+        return _option_chain(market, prod, day)
+    # 만기가 가까운 4개 분기물과 최근월-차근월 스프레드
+    listed = [x for x in _future_contracts(prod) if x[2] >= day][:4]
+    rows = []
+    for i, (code, month, last) in enumerate(listed):
+        close = _future_price(market, prod, day, last)
+        prev = _future_price(market, prod, _previous(day), last)
+        volume = int(300_000 * 0.1**i * (0.5 + _noise(prod, code, day)))
+        rows.append(
+            {
+                "ISU_CD": f"KR4{code}0",
+                "ISU_SRT_CD": code,
+                "ISU_NM": f"합성 F {month} (주간)",
+                "TDD_CLSPRC": _f(close),
+                "FLUC_TP_CD": _fluc(close - prev),
+                "CMPPREVDD_PRC": _f(close - prev),
+                "TDD_OPNPRC": _f(prev),
+                "TDD_HGPRC": _f(max(prev, close) * 1.002),
+                "TDD_LWPRC": _f(min(prev, close) * 0.998),
+                "SPOT_PRC": _f(market.index(prod, day) / 3),
+                "SETL_PRC": _f(close),
+                "ACC_TRDVOL": _n(volume),
+                "ACC_TRDVAL": _n(int(volume * close * 250_000)),
+                "ACC_OPNINT_QTY": _n(volume * 2),
+                "SECUGRP_ID": "FU",
+            }
+        )
+    (near, m1, _), (far, m2, _) = listed[:2]
+    spread = float(rows[1]["TDD_CLSPRC"].replace(",", "")) - float(
+        rows[0]["TDD_CLSPRC"].replace(",", "")
+    )
+    rows.append(
+        {
+            **rows[0],
+            "ISU_CD": f"KR4{near[:6]}S0",
+            "ISU_SRT_CD": f"4{near[1:6]}SP",
+            "ISU_NM": f"합성 SP {m1[2:]}-{m2[2:]} (주간)",
+            "TDD_CLSPRC": _f(spread),
+            "TDD_OPNPRC": _f(spread),
+            "TDD_HGPRC": _f(spread),
+            "TDD_LWPRC": _f(spread),
+            "SETL_PRC": "0.00",
+            "ACC_TRDVOL": _n(1_000),
+            "ACC_TRDVAL": _n(int(abs(spread) * 250_000_000)),
+        }
+    )
+    return {"output": rows}
+
+
+# 합성 응답을 만들 수 있는 bld
+SCHEMAS = {
+    "dbms/comm/finder/finder_stkisu": finder_stkisu,
+    "dbms/comm/finder/finder_listdelisu": finder_listdelisu,
+    "dbms/MDC/STAT/standard/MDCSTAT01501": 전종목시세,
+    "dbms/MDC/STAT/standard/MDCSTAT01701": 개별종목시세,
+    "dbms/MDC/STAT/standard/MDCSTAT03501": PER_PBR_배당수익률_전종목,
+    "dbms/MDC/STAT/standard/MDCSTAT03502": PER_PBR_배당수익률_개별,
+    "dbms/MDC/STAT/standard/MDCSTAT00401": 전체지수기본정보,
+    "dbms/MDC/STAT/standard/MDCSTAT00301": 개별지수시세,
+    "dbms/MDC/STAT/standard/MDCSTAT04601": ETF_전종목기본종목,
+    "dbms/MDC/STAT/standard/MDCSTAT06701": ETN_전종목기본종목,
+    "dbms/MDC/STAT/standard/MDCSTAT08501": ELW_전종목기본종목,
+    "dbms/MDC/STAT/standard/MDCSTAT04301": 전종목시세_ETF,
+    "dbms/MDC/STAT/standard/MDCSTAT05901": 추적오차율추이,
+    "dbms/MDC/STAT/standard/MDCSTAT06001": 괴리율추이,
+    "dbms/MDC/STAT/standard/MDCSTAT02202": 투자자별_거래실적_전체시장_일별추이,
+    "dbms/MDC/STAT/standard/MDCSTAT02203": 투자자별_거래실적_전체시장_일별추이,
+    "dbms/MDC/STAT/standard/MDCSTAT02302": 투자자별_거래실적_개별종목_일별추이,
+    "dbms/MDC/STAT/standard/MDCSTAT02303": 투자자별_거래실적_개별종목_일별추이,
+    "dbms/MDC/STAT/srt/MDCSTAT30101": 개별종목_공매도_거래_전종목,
+    "dbms/MDC/STAT/srt/MDCSTAT30102": 개별종목_공매도_거래_개별추이,
+    "dbms/MDC/STAT/srt/MDCSTAT30501": 전종목_공매도_잔고,
+    "dbms/MDC/STAT/srt/MDCSTAT30502": 개별종목_공매도_잔고,
+    "dbms/MDC/STAT/standard/MDCSTAT12501": 선물_전종목시세,
+    "dbms/MDC/STAT/standard/MDCSTAT12801": 선물_전종목기본정보,
+    "dbms/MDC/STAT/standard/MDCSTAT11401": 전종목_장외채권수익률,
+    "dbms/MDC/STAT/standard/MDCSTAT11402": 개별추이_장외채권수익률,
+}
+
+
+def naver_sise(market: SyntheticMarket, params: dict, today=None) -> bytes:
+    """fchart.stock.naver.com/sise.nhn 형식의 일봉 XML (EUC-KR)"""
+    code = params.get("symbol", "")
+    count = int(params.get("count", 0) or 0)
+    day = today or datetime.date.today()
+    if day.weekday() >= 5:
+        day = _previous(day)
+    days = []
+    while len(days) < count:
+        days.append(day)
+        day = _previous(day)
+    items = []
+    for day in reversed(days):
+        p = market.ohlcv(code, day)
+        data = "|".join(
+            str(x)
+            for x in (
+                day.strftime("%Y%m%d"),
+                p["open"],
+                p["high"],
+                p["low"],
+                p["close"],
+                p["volume"],
+            )
+        )
+        items.append(f'<item data="{data}" />')
+    ticker = next((x for x in market.tickers if x["short_code"] == code), None)
+    name = ticker["name"] if ticker else code
+    text = (
+        '<?xml version="1.0" encoding="EUC-KR" ?>\n<protocol>\n'
+        f'<chartdata symbol="{code}" name="{name}" count="{count}" '
+        f'timeframe="{params.get("timeframe", "day")}" precision="0">\n'
+        + "\n".join(items)
+        + "\n</chartdata>\n</protocol>\n"
+    )
+    return text.encode("euc-kr")
@@ -0,0 +1,273 @@
+import json
+import random
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pykrx.testing.schemas import SCHEMAS, SyntheticMarket, naver_sise
+
+KRX_ORIGIN = "https://data.krx.co.kr"
+NAVER_ORIGIN = "http://fchart.stock.naver.com"
+
+_BLOCKED_PAGE = (
+    "<html><head><title>KRX</title></head>"
+    "<body>비정상적인 접근이 감지되었습니다.</body></html>"
+).encode()
+
+
+class Behavior:
+    """가짜 서버의 지연, 오류, 요청 제한 설정
+
+    오류는 요청마다 정해진 확률로 하나만 발생하며, seed가 같으면 같은 순서로
+    발생한다.
+
+    Args:
+        latency        (optional): 응답 지연 (초)
+            - float    : 고정 지연
+            - tuple    : (최소, 최대) 사이의 균등 분포
+            - callable : random.Random을 받아 지연을 반환하는 함수
+                         예) lambda r: r.lognormvariate(-3, 0.5)
+        error_rate     (float, optional): 500 응답 비율
+        blocked_rate   (float, optional): 200과 함께 HTML 차단 페이지를 보내는 비율
+        empty_rate     (float, optional): 빈 본문을 보내는 비율
+        truncated_rate (float, optional): json을 중간에 자르는 비율
+        rate_limit     (float, optional): 초당 허용 요청 수. 넘으면 429
+        burst          (int  , optional): rate_limit의 버킷 크기
+        max_concurrency(int  , optional): 동시 처리 요청 수. 넘으면 503
+        seed           (int  , optional): 지연과 오류 발생 순서의 seed
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        error_rate: float = 0.0,
+        blocked_rate: float = 0.0,
+        empty_rate: float = 0.0,
+        truncated_rate: float = 0.0,
+        rate_limit: float = None,
+        burst: int = 1,
+        max_concurrency: int = None,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.blocked_rate = blocked_rate
+        self.empty_rate = empty_rate
+        self.truncated_rate = truncated_rate
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.seed = seed
+
+    def delay(self, rng: random.Random) -> float:
+        if callable(self.latency):
+            return max(float(self.latency(rng)), 0.0)
+        if isinstance(self.latency, tuple):
+            return rng.uniform(*self.latency)
+        return float(self.latency)
+
+    def fault(self, rng: random.Random):
+        """이번 요청에 주입할 오류 (error/blocked/empty/truncated) 또는 None"""
+        x = rng.random()
+        for kind in ("error", "blocked", "empty", "truncated"):
+            rate = getattr(self, f"{kind}_rate")
+            if x < rate:
+                return kind
+            x -= rate
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        params = dict(urllib.parse.parse_qsl(body, keep_blank_values=True))
+        self.server.fake._handle(self, "POST", self.path.split("?")[0], params)
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query, keep_blank_values=True))
+        self.server.fake._handle(self, "GET", url.path, params)
+
+    def send(self, status: int, body: bytes, content_type: str, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeServer:
+    """data.krx.co.kr와 fchart.stock.naver.com을 흉내 내는 로컬 HTTP 서버
+
+    SCHEMAS에 있는 bld와 Naver 일봉 요청에 실제와 같은 형식의 결정적인 합성
+    응답을 보낸다. 지원하지 않는 bld에는 빈 output을 보낸다. with 블록에서
+    사용하면 webio의 요청 주소를 이 서버로 바꾸고, 블록을 나올 때 되돌린다.
+
+        >> with FakeServer(Behavior(latency=(0.01, 0.05), error_rate=0.01)) as s:
+        >>     df = stock.get_market_ohlcv("20240102", market="ALL")
+        >> s.stats()
+        {'requests': 3, 'status': {200: 3}, 'bld': {...}, 'max_inflight': 1}
+
+    Args:
+        behavior (Behavior, optional): 지연, 오류, 요청 제한 설정
+        size     (int     , optional): 합성 시장의 종목 수
+        seed     (int     , optional): 합성 데이터의 seed
+        port     (int     , optional): 포트. 0이면 임의의 빈 포트
+        addr     (str     , optional): 바인드 주소
+    """
+
+    def __init__(
+        self,
+        behavior: Behavior = None,
+        size: int = 200,
+        seed: int = 0,
+        port: int = 0,
+        addr: str = "127.0.0.1",
+    ):
+        self.behavior = behavior or Behavior()
+        self.market = SyntheticMarket(size, seed)
+        self._addr = (addr, port)
+        self._server = None
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.behavior.seed)
+        self._tokens = float(self.behavior.burst)
+        self._refilled = time.monotonic()
+        self._inflight = 0
+        self._stats = {"requests": 0, "status": {}, "bld": {}, "max_inflight": 0}
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServer":
+        self._server = ThreadingHTTPServer(self._addr, _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def install(self):
+        """webio가 KRX와 Naver로 보내는 요청을 이 서버로 보낸다."""
+        from pykrx.website.comm import webio
+
+        webio.set_base_url(KRX_ORIGIN, self.url)
+        webio.set_base_url(NAVER_ORIGIN, self.url)
+
+    def uninstall(self):
+        from pykrx.website.comm import webio
+
+        webio.set_base_url(KRX_ORIGIN, None)
+        webio.set_base_url(NAVER_ORIGIN, None)
+
+    def __enter__(self) -> "FakeServer":
+        self.start()
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.uninstall()
+        self.stop()
+        return False
+
+    def stats(self) -> dict:
+        """요청 수, 상태 코드별/bld별 응답 수, 최대 동시 처리 수"""
+        with self._lock:
+            return {
+                "requests": self._stats["requests"],
+                "status": dict(self._stats["status"]),
+                "bld": dict(self._stats["bld"]),
+                "max_inflight": self._stats["max_inflight"],
+            }
+
+    def _admit(self, name: str):
+        """요청 제한을 적용하고 (거절 상태 코드, 지연, 오류)를 정한다."""
+        behavior = self.behavior
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bld"][name] = self._stats["bld"].get(name, 0) + 1
+            if behavior.rate_limit is not None:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(behavior.burst),
+                    self._tokens + (now - self._refilled) * behavior.rate_limit,
+                )
+                self._refilled = now
+                if self._tokens < 1:
+                    return 429, 0.0, None
+                self._tokens -= 1
+            limit = behavior.max_concurrency
+            if limit is not None and self._inflight >= limit:
+                return 503, 0.0, None
+            self._inflight += 1
+            self._stats["max_inflight"] = max(
+                self._stats["max_inflight"], self._inflight
+            )
+            return None, behavior.delay(self._rng), behavior.fault(self._rng)
+
+    def _count(self, status: int):
+        with self._lock:
+            self._stats["status"][status] = self._stats["status"].get(status, 0) + 1
+
+    def _handle(self, handler: _Handler, method: str, path: str, params: dict):
+        if path == "/comm/bldAttendant/getJsonData.cmd" and method == "POST":
+            name = params.get("bld", "")
+        elif path == "/sise.nhn" and method == "GET":
+            name = "naver/sise"
+        else:
+            self._count(404)
+            handler.send(404, b"", "text/plain")
+            return
+
+        rejected, delay, fault = self._admit(name)
+        if rejected is not None:
+            self._count(rejected)
+            handler.send(rejected, b"", "text/plain", {"Retry-After": "1"})
+            return
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            status, body, content_type = self._respond(name, params, fault)
+        finally:
+            with self._lock:
+                self._inflight -= 1
+        self._count(status)
+        handler.send(status, body, content_type)
+
+    def _respond(self, name: str, params: dict, fault) -> tuple:
+        if fault == "error":
+            return 500, b"", "text/plain"
+        if fault == "blocked":
+            return 200, _BLOCKED_PAGE, "text/html;charset=UTF-8"
+        if fault == "empty":
+            return 200, b"", "text/html;charset=UTF-8"
+
+        if name == "naver/sise":
+            body = naver_sise(self.market, params)
+            content_type = "text/xml;charset=EUC-KR"
+        else:
+            schema = SCHEMAS.get(name)
+            result = schema(self.market, params) if schema else {"output": []}
+            result["CURRENT_DATETIME"] = time.strftime("%Y.%m.%d %p %I:%M:%S")
+            body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+            # KRX는 json도 text/html로 보낸다.
+            content_type = "text/html;charset=UTF-8"
+        if fault == "truncated":
+            body = body[: len(body) // 2]
+        return 200, body, content_type
@@ -1,3 +1,63 @@
-from pykrx.website.comm.util import dataframe_empty_handler, singleton
+from pykrx.website.comm.cache import (
+    BusinessCalendar,
+    FreshnessPolicy,
+    IntervalCache,
+    ResponseCache,
+)
+from pykrx.website.comm.context import (
+    CancelToken,
+    Deadline,
+    current_deadline,
+    deadline,
+)
+from pykrx.website.comm.retry import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    TransientError,
+    set_retry_policy,
+)
+from pykrx.website.comm.throttle import AimdLimiter, set_limits
+from pykrx.website.comm.tracing import SpanHook, add_hook, remove_hook
+from pykrx.website.comm.util import (
+    SingleFlight,
+    concurrent_map,
+    dataframe_empty_handler,
+    merge_intervals,
+    missing_intervals,
+    singleton,
+    to_numeric,
+    to_timestamp,
+)
+from pykrx.website.comm.webio import set_base_url, set_timeout
 
-__all__ = ["dataframe_empty_handler", "singleton"]
+__all__ = [
+    "AimdLimiter",
+    "BusinessCalendar",
+    "CancelToken",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "Deadline",
+    "FreshnessPolicy",
+    "IntervalCache",
+    "ResponseCache",
+    "RetryPolicy",
+    "SingleFlight",
+    "SpanHook",
+    "TransientError",
+    "add_hook",
+    "concurrent_map",
+    "current_deadline",
+    "dataframe_empty_handler",
+    "deadline",
+    "merge_intervals",
+    "missing_intervals",
+    "remove_hook",
+    "set_base_url",
+    "set_limits",
+    "set_retry_policy",
+    "set_timeout",
+    "singleton",
+    "to_numeric",
+    "to_timestamp",
+]
@@ -0,0 +1,410 @@
+import contextvars
+import datetime
+import math
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+from pykrx.website.comm.util import (
+    freeze,
+    merge_intervals,
+    missing_intervals,
+    singleton,
+    to_timestamp,
+)
+
+KST = datetime.timezone(datetime.timedelta(hours=9), "KST")
+
+
+# BusinessCalendar가 영업일을 조회하는 중인지 여부. 조회 요청이 캐시를 거치며
+# 다시 calendar를 호출하면 평일로 판단한다.
+_loading = contextvars.ContextVar("pykrx_calendar_loading", default=False)
+
+
+def _load_business_days(fromdate: str, todate: str) -> list:
+    # get_previous_business_days와 같은 종목의 일별 시세로 영업일을 구한다.
+    from pykrx.website.krx.market.wrap import get_market_ohlcv_by_date
+
+    return get_market_ohlcv_by_date(fromdate, todate, "000020").index.to_list()
+
+
+class BusinessCalendar:
+    """KRX 영업일 달력. FreshnessPolicy의 기본 calendar다.
+
+    연도마다 한 번 영업일을 조회해서 보관한다. 조회한 구간 밖의 일자(올해의
+    남은 일자 등)와 조회에 실패한 연도는 평일을 영업일로 보고, refresh 초가
+    지나면 다시 조회한다.
+
+    Args:
+        loader            : loader(fromdate, todate) -> 영업일 Timestamp 목록.
+                            입력하지 않으면 KRX에서 조회한다.
+        refresh (float, optional): 올해 또는 조회에 실패한 연도를 다시 조회하는
+                                   간격 (초)
+    """
+
+    def __init__(self, loader=None, refresh: float = 3600):
+        self.loader = loader if loader is not None else _load_business_days
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._years = {}
+
+    def __call__(self, date) -> bool:
+        date = pd.Timestamp(date).normalize()
+        if date.weekday() >= 5:
+            return False
+        if _loading.get():
+            return True
+        days, until = self._year(date.year)
+        if until is None or date > until:
+            return True
+        return date in days
+
+    def _year(self, year: int) -> tuple:
+        """(영업일 집합, 영업일 집합이 확정된 마지막 일자)"""
+        with self._lock:
+            entry = self._years.get(year)
+        now = time.monotonic()
+        if entry is not None and (entry[2] or now - entry[3] < self.refresh):
+            return entry[:2]
+
+        # 오늘은 장중일 수 있으므로 어제까지의 영업일만 확정된 것으로 본다.
+        today = pd.Timestamp(datetime.datetime.now(KST).date())
+        until = min(pd.Timestamp(year, 12, 31), today - pd.Timedelta(days=1))
+        days = []
+        if until.year == year:
+            token = _loading.set(True)
+            try:
+                days = list(self.loader(f"{year}0101", until.strftime("%Y%m%d")))
+            except Exception:
+                days = []
+            finally:
+                _loading.reset(token)
+        if days:
+            days = frozenset(pd.Timestamp(x).normalize() for x in days)
+            entry = (days, until, until.month == 12 and until.day == 31, now)
+        else:
+            entry = (frozenset(), None, False, now)
+        with self._lock:
+            self._years[year] = entry
+        return entry[:2]
+
+
+# 모든 FreshnessPolicy가 기본으로 공유하는 달력
+_calendar = BusinessCalendar()
+
+
+class FreshnessPolicy:
+    """KRX 장 운영 시간과 영업일을 기준으로 캐시 항목의 만료 시간을 정한다.
+
+    일별 데이터는 장 마감 후 정산(settle_time)이 끝나야 확정된다. 확정된
+    일자만 포함하는 응답은 만료되지 않고, 당일(또는 이후) 일자를 포함하는
+    응답은 장중/장 마감 후에 따라 짧게 보관한다. 확정된 일자의 빈 응답은
+    조회 구간에 영업일이 없으면 만료되지 않고, 영업일이 있으면 일시적인
+    오류일 수 있으므로 negative_ttl 동안만 보관한다.
+
+    Args:
+        session_open   (datetime.time, optional): 정규장 시작 시각 (KST)
+        session_close  (datetime.time, optional): 정규장 종료 시각 (KST)
+        settle_time    (datetime.time, optional): 일별 데이터 확정 시각 (KST)
+        intraday_ttl   (float        , optional): 장중 만료 시간 (초)
+        post_close_ttl (float        , optional): 장 마감 후 확정 전 만료 시간 (초)
+        negative_ttl   (float        , optional): 빈 응답의 만료 시간 (초)
+        calendar                                : calendar(Timestamp) -> 영업일
+                                                  여부. 기본값은 KRX 영업일
+                                                  (BusinessCalendar)
+        clock                                   : clock() -> 현재 시각
+                                                  (timezone aware datetime)
+    """
+
+    def __init__(
+        self,
+        session_open: datetime.time = datetime.time(9, 0),
+        session_close: datetime.time = datetime.time(15, 30),
+        settle_time: datetime.time = datetime.time(18, 0),
+        intraday_ttl: float = 60,
+        post_close_ttl: float = 600,
+        negative_ttl: float = 3600,
+        calendar=None,
+        clock=None,
+    ):
+        self.session_open = session_open
+        self.session_close = session_close
+        self.settle_time = settle_time
+        self.intraday_ttl = intraday_ttl
+        self.post_close_ttl = post_close_ttl
+        self.negative_ttl = negative_ttl
+        self.calendar = calendar if calendar is not None else _calendar
+        self.clock = clock if clock is not None else lambda: datetime.datetime.now(KST)
+
+    def now(self) -> pd.Timestamp:
+        """현재 KST 시각 (timezone 정보 없음)"""
+        return pd.Timestamp(self.clock()).tz_convert(KST).tz_localize(None)
+
+    def settled_through(self, now: pd.Timestamp = None) -> pd.Timestamp:
+        """데이터가 확정된 마지막 일자"""
+        now = self.now() if now is None else now
+        today = now.normalize()
+        if not self.calendar(today) or now.time() >= self.settle_time:
+            return today
+        return today - pd.Timedelta(days=1)
+
+    def ttl(self, start, end, empty: bool = False) -> float:
+        """[start, end] 구간을 담은 응답의 만료 시간
+
+        Args:
+            start        : 응답의 시작 일자
+            end          : 응답의 종료 일자
+            empty (bool) : 응답에 행이 없는지 여부
+
+        Returns:
+            float: 만료 시간 (초). 만료되지 않으면 math.inf
+        """
+        now = self.now()
+        start, end = to_timestamp(start), to_timestamp(end)
+        if end <= self.settled_through(now):
+            if not empty:
+                return math.inf
+            days = pd.date_range(start, end)
+            if any(self.calendar(x) for x in days):
+                return self.negative_ttl
+            return math.inf
+
+        today = now.normalize()
+        if not self.calendar(today):
+            return self.intraday_ttl
+        if now.time() < self.session_open:
+            at = datetime.datetime.combine(today.date(), self.session_open)
+            return max((at - now).total_seconds(), self.intraday_ttl)
+        if now.time() < self.session_close:
+            return self.intraday_ttl
+        at = datetime.datetime.combine(today.date(), self.settle_time)
+        return max(min((at - now).total_seconds(), self.post_close_ttl), 1)
+
+    def expires(self, start, end, empty: bool = False):
+        """만료 시각. 만료되지 않으면 None"""
+        ttl = self.ttl(start, end, empty)
+        if math.isinf(ttl):
+            return None
+        return self.now() + pd.Timedelta(seconds=ttl)
+
+
+@singleton
+class IntervalCache:
+    """기간 조회(strtDd/endDd) 응답을 일자별 행으로 보관하는 캐시
+
+    (bld, 기간을 제외한 파라미터)마다 이미 조회한 날짜 구간과 일자별 행을
+    보관한다. 조회 구간이 일부 겹치면 비어 있는 하위 구간만 다시 조회하고
+    보관된 행과 합쳐 하나의 연속된 응답으로 돌려준다. 확정되지 않은 일자와
+    빈 응답의 구간은 policy가 정한 시각까지만 조회한 구간으로 취급한다.
+    기본적으로 꺼져 있으며 enable()로 사용한다.
+
+        >> IntervalCache().enable()
+        >> stock.get_market_ohlcv("20200101", "20240102", "005930")
+        >> stock.get_market_ohlcv("20200101", "20240103", "005930")  # 하루만 조회
+
+    Args:
+        maxsize (int, optional): 보관할 최대 키 수. 초과하면 가장 오래 사용하지
+                                 않은 키를 버린다.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.enabled = False
+        self.maxsize = maxsize
+        self.policy = FreshnessPolicy()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def enable(self, maxsize: int = None, policy: FreshnessPolicy = None):
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if policy is not None:
+            self.policy = policy
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def make_key(params: dict) -> tuple:
+        return tuple(
+            sorted(
+                (k, str(v)) for k, v in params.items() if k not in ("strtDd", "endDd")
+            )
+        )
+
+    def coverage(self, key: tuple) -> list:
+        """만료되지 않은 조회 구간 목록"""
+        now = self.policy.now()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return []
+            entry["volatile"] = [x for x in entry["volatile"] if x[2] > now]
+            return entry["covered"] + [(s, e) for s, e, _ in entry["volatile"]]
+
+    def missing(self, key: tuple, start, end) -> list:
+        """[start, end] 중 보관되지 않은 (Timestamp, Timestamp) 구간 목록"""
+        return missing_intervals(self.coverage(key), start, end)
+
+    def put(
+        self, key: tuple, start, end, result: dict, date_field: str, lag: int = 0
+    ) -> bool:
+        """[start, end] 구간의 응답을 일자별로 나눠서 보관한다.
+
+        확정된 일자와 확정되지 않은 일자로 구간을 나누고, 각 구간의 만료
+        시각은 policy로 정한다. 공매도 잔고처럼 며칠 늦게 공개되는 데이터는
+        lag로 확정된 마지막 일자 이전의 영업일도 확정되지 않은 구간으로
+        보관한다 (빈 구간과 같이 negative_ttl 동안 보관한다).
+
+        Args:
+            key        (tuple): make_key로 만든 키
+            start             : 응답의 조회 시작 일자
+            end               : 응답의 조회 종료 일자
+            result     (dict ): KRX json 응답
+            date_field (str  ): 행의 일자 필드 (예: TRD_DD)
+            lag        (int  , optional): 공개가 늦는 영업일 수
+
+        Returns:
+            bool: 보관 여부. 행 목록이 없는 응답은 보관하지 않는다.
+        """
+        output = next((k for k, v in result.items() if isinstance(v, list)), None)
+        if output is None:
+            return False
+
+        rows = {}
+        for row in result[output]:
+            rows.setdefault(to_timestamp(row[date_field]), []).append(row)
+
+        start, end = to_timestamp(start), to_timestamp(end)
+        settled = self.policy.settled_through()
+        final = settled
+        while lag > 0:
+            final -= pd.Timedelta(days=1)
+            lag -= self.policy.calendar(final)
+        parts = []
+        for s, e in [
+            (start, min(end, final)),
+            (max(start, final + pd.Timedelta(days=1)), min(end, settled)),
+            (max(start, settled + pd.Timedelta(days=1)), end),
+        ]:
+            if s <= e:
+                empty = not any(s <= x <= e for x in rows)
+                expires = self.policy.expires(s, e, empty)
+                if expires is None and e > final:
+                    expires = self.policy.now() + pd.Timedelta(
+                        seconds=self.policy.negative_ttl
+                    )
+                parts.append((s, e, expires))
+
+        with self._lock:
+            entry = self._entries.setdefault(
+                key,
+                {
+                    "output": output,
+                    "meta": {},
+                    "covered": [],
+                    "volatile": [],
+                    "rows": {},
+                },
+            )
+            entry["meta"] = {k: v for k, v in result.items() if k != output}
+            for x in [x for x in entry["rows"] if start <= x <= end]:
+                del entry["rows"][x]
+            entry["rows"].update(rows)
+            for s, e, expires in parts:
+                if expires is None:
+                    entry["covered"] = merge_intervals(entry["covered"] + [(s, e)])
+                else:
+                    entry["volatile"].append((s, e, expires))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return True
+
+    def get(self, key: tuple, start, end) -> dict:
+        """보관된 [start, end] 구간의 행을 KRX 응답과 같은 형태로 반환한다.
+
+        행은 KRX 응답과 같이 최근 일자부터 정렬된다.
+        """
+        start, end = to_timestamp(start), to_timestamp(end)
+        with self._lock:
+            entry = self._entries[key]
+            self._entries.move_to_end(key)
+            rows = [
+                row
+                for date in sorted(entry["rows"], reverse=True)
+                if start <= date <= end
+                for row in entry["rows"][date]
+            ]
+            return {**entry["meta"], entry["output"]: rows}
+
+
+@singleton
+class ResponseCache:
+    """단일 일자(trdDd) 조회 응답을 policy가 정한 만료 시각까지 보관하는 캐시
+
+    확정된 일자의 응답은 만료되지 않고, 당일 응답과 빈 응답(휴장일 등)은
+    FreshnessPolicy에 따라 짧게 보관한다. 기본적으로 꺼져 있으며 enable()로
+    사용한다.
+
+    Args:
+        maxsize (int, optional): 보관할 최대 응답 수
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.enabled = False
+        self.maxsize = maxsize
+        self.policy = FreshnessPolicy()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def enable(self, maxsize: int = None, policy: FreshnessPolicy = None):
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if policy is not None:
+            self.policy = policy
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def make_key(params: dict) -> tuple:
+        return freeze(params)
+
+    def get(self, key: tuple):
+        """보관된 응답. 없거나 만료되었으면 None"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            result, expires = item
+            if expires is not None and expires <= self.policy.now():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+
+    def put(self, key: tuple, date, result: dict):
+        """date 일자의 응답을 보관한다. 행 목록이 없는 응답은 보관하지 않는다."""
+        outputs = [v for v in result.values() if isinstance(v, list)]
+        if not outputs:
+            return
+        expires = self.policy.expires(date, date, empty=not any(outputs))
+        with self._lock:
+            self._entries[key] = (result, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,140 @@
+import contextlib
+import contextvars
+import threading
+import time
+from concurrent.futures import CancelledError
+
+from pykrx.website.comm import metrics, tracing
+
+_current = contextvars.ContextVar("pykrx_deadline", default=None)
+
+
+class CancelToken:
+    """작업 취소 신호
+
+    다른 스레드나 asyncio 태스크에서 cancel()을 호출하면 이 토큰을 사용하는
+    deadline 안의 다음 네트워크 요청, 대기, 청크 사이의 휴식에서
+    CancelledError가 발생한다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._event.wait(timeout)
+
+
+class Deadline:
+    """작업 전체의 마감 시각과 취소 토큰
+
+    Args:
+        seconds (float      , optional): 마감까지 남은 시간 (초). None이면 무제한
+        token   (CancelToken, optional): 취소 토큰
+    """
+
+    def __init__(self, seconds: float = None, token: CancelToken = None):
+        self.expires = None if seconds is None else time.monotonic() + seconds
+        self.token = token if token is not None else CancelToken()
+
+    def remaining(self):
+        """마감까지 남은 시간 (초). 마감이 없으면 None"""
+        if self.expires is None:
+            return None
+        return self.expires - time.monotonic()
+
+    def check(self):
+        """취소되었거나 마감이 지났으면 예외를 발생시킨다.
+
+        Raises:
+            CancelledError: 토큰이 취소된 경우
+            TimeoutError  : 마감 시각이 지난 경우
+        """
+        if self.token.cancelled:
+            raise CancelledError("pykrx 작업이 취소되었습니다.")
+        remaining = self.remaining()
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError("pykrx 작업의 마감 시간이 지났습니다.")
+
+    def timeout(self, timeout: float) -> float:
+        """요청의 timeout을 남은 시간 이내로 줄인다."""
+        self.check()
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def sleep(self, seconds: float):
+        """seconds 동안 쉬되 취소되거나 마감이 지나면 즉시 예외를 발생시킨다."""
+        self.token.wait(self.timeout(seconds))
+        self.check()
+
+    def wait(self, event: threading.Event, interval: float = 0.05):
+        """event가 설정될 때까지 기다리되 취소와 마감을 확인한다."""
+        while not event.wait(self.timeout(interval)):
+            self.check()
+
+
+def current_deadline():
+    """현재 컨텍스트의 Deadline. 없으면 None"""
+    return _current.get()
+
+
+@contextlib.contextmanager
+def deadline(seconds: float = None, token: CancelToken = None):
+    """블록 안의 모든 pykrx 네트워크 호출에 마감 시간과 취소 토큰을 적용한다.
+
+    중첩하면 더 이른 마감 시각을 사용하고, token을 지정하지 않으면 바깥
+    deadline의 토큰을 이어받는다. concurrent_map으로 실행한 작업에도
+    전달된다.
+
+        >> token = CancelToken()
+        >> with deadline(30, token):
+        >>     df = stock.get_market_ohlcv("20000101", "20240102", "005930")
+
+    Args:
+        seconds (float      , optional): 마감까지 남은 시간 (초)
+        token   (CancelToken, optional): 취소 토큰
+
+    Raises:
+        TimeoutError  : 블록 안의 호출이 마감 시간을 넘긴 경우
+        CancelledError: token이 취소된 경우
+    """
+    parent = _current.get()
+    current = Deadline(seconds, token)
+    if parent is not None:
+        if token is None:
+            current.token = parent.token
+        if parent.expires is not None and (
+            current.expires is None or parent.expires < current.expires
+        ):
+            current.expires = parent.expires
+    reset = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(reset)
+
+
+def pause(seconds: float, reason: str = "sleep"):
+    """현재 deadline을 따르는 time.sleep
+
+    Args:
+        seconds (float): 대기 시간 (초)
+        reason  (str  ): 지표(pykrx_sleep_seconds)에 기록할 대기 이유
+    """
+    current = _current.get()
+    with (
+        tracing.span("sleep", reason=reason),
+        metrics.timer("pykrx_sleep_seconds", io=True, reason=reason),
+    ):
+        if current is None:
+            time.sleep(seconds)
+        else:
+            current.sleep(seconds)
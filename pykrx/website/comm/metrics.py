@@ -0,0 +1,256 @@
+import bisect
+import contextlib
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 지연 시간 히스토그램의 기본 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class _Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        cumulative = 0
+        buckets = {}
+        for le, n in zip(self.buckets + (float("inf"),), self.counts, strict=True):
+            cumulative += n
+            buckets[le] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class MetricsRegistry:
+    """pykrx 내부 동작을 집계하는 카운터/히스토그램 저장소
+
+    이름과 레이블의 조합마다 카운터 값을 누적하거나 히스토그램에 관측값을
+    기록한다. snapshot()은 dict로, prometheus()는 Prometheus 텍스트 형식으로
+    현재 값을 반환한다.
+
+        >> from pykrx.website.comm import metrics
+        >> metrics.snapshot()["pykrx_requests_total"]
+        [{'labels': {'host': 'data.krx.co.kr', 'result': 'ok'}, 'value': 12}]
+        >> metrics.serve(9108)  # http://127.0.0.1:9108/metrics
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def get(self, name: str, **labels) -> float:
+        """카운터 값. 히스토그램이면 관측 횟수"""
+        key = self._key(name, labels)
+        with self._lock:
+            if key in self._histograms:
+                return self._histograms[key].count
+            return self._counters.get(key, 0)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        """현재 값
+
+        Returns:
+            dict: 카운터는 {이름: [{"labels": {...}, "value": 값}]},
+                  히스토그램은 {이름: [{"labels": {...}, "count": 횟수,
+                  "sum": 합계, "buckets": {상한: 누적 횟수}}]}
+        """
+        result = {}
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                result.setdefault(name, []).append(
+                    {"labels": dict(labels), "value": value}
+                )
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                result.setdefault(name, []).append(
+                    {"labels": dict(labels), **histogram.snapshot()}
+                )
+        return result
+
+    def prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)"""
+
+        def _labels(labels: dict, **extra) -> str:
+            items = {**labels, **extra}
+            if not items:
+                return ""
+            text = ",".join(
+                '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+                for k, v in items.items()
+            )
+            return "{" + text + "}"
+
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = [
+                (k, v.snapshot()) for k, v in sorted(self._histograms.items())
+            ]
+
+        lines = []
+        typed = set()
+        for (name, labels), value in counters:
+            if name not in typed:
+                lines.append(f"# TYPE {name} counter")
+                typed.add(name)
+            lines.append(f"{name}{_labels(dict(labels))} {value}")
+        for (name, labels), histogram in histograms:
+            if name not in typed:
+                lines.append(f"# TYPE {name} histogram")
+                typed.add(name)
+            labels = dict(labels)
+            for le, n in histogram["buckets"].items():
+                le = "+Inf" if le == float("inf") else repr(float(le))
+                lines.append(f"{name}_bucket{_labels(labels, le=le)} {n}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram['sum']}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# 스레드별로 네트워크, 디코드, 대기에 쓴 시간을 누적해서 변환 시간을 구하는 데
+# 사용한다.
+_local = threading.local()
+
+
+def inc(name: str, value: float = 1, **labels):
+    registry.inc(name, value, **labels)
+
+
+def observe(name: str, value: float, **labels):
+    registry.observe(name, value, **labels)
+
+
+def snapshot() -> dict:
+    return registry.snapshot()
+
+
+def prometheus() -> str:
+    return registry.prometheus()
+
+
+def add_io_time(seconds: float):
+    """현재 스레드가 네트워크, 디코드, 대기에 쓴 시간을 기록한다."""
+    _local.io = getattr(_local, "io", 0.0) + seconds
+
+
+@contextlib.contextmanager
+def timer(name: str, io: bool = False, **labels):
+    """블록의 실행 시간을 name 히스토그램에 기록한다.
+
+    Args:
+        name (str ): 히스토그램 이름
+        io   (bool): 네트워크, 디코드, 대기처럼 변환 시간 계산에서 제외할
+                     시간이면 True
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        registry.observe(name, elapsed, **labels)
+        if io:
+            add_io_time(elapsed)
+
+
+def transform_timer(func):
+    """wrap 함수의 변환(pandas) 시간을 pykrx_transform_seconds에 기록한다.
+
+    전체 실행 시간에서 같은 스레드의 네트워크, 디코드, 대기 시간을 뺀 값이며,
+    중첩된 호출은 가장 바깥 함수에만 기록한다.
+    """
+    name = func.__name__
+
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "depth", 0):
+            return func(*args, **kwargs)
+        _local.depth = 1
+        io = getattr(_local, "io", 0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            spent = getattr(_local, "io", 0.0) - io
+            _local.depth = 0
+            registry.observe(
+                "pykrx_transform_seconds", max(elapsed - spent, 0), func=name
+            )
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def write_prometheus(path: str):
+    """Prometheus 텍스트를 파일에 기록한다. node_exporter의 textfile collector
+    처럼 파일을 읽는 수집기에서 사용할 수 있도록 원자적으로 교체한다."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(registry.prometheus())
+    os.replace(tmp, path)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(port: int = 9108, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """/metrics 경로로 Prometheus 텍스트를 제공하는 HTTP 서버를 백그라운드
+    스레드에서 시작한다.
+
+    Args:
+        port (int, optional): 포트. 0이면 임의의 빈 포트
+        addr (str, optional): 바인드 주소
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버. shutdown()으로 종료한다.
+    """
+    server = ThreadingHTTPServer((addr, port), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
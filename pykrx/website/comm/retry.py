@@ -0,0 +1,238 @@
+import json
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from pykrx.website.comm import metrics
+from pykrx.website.comm.context import pause
+
+
+class TransientError(OSError):
+    """재시도하면 성공할 수 있는 응답 오류
+
+    Args:
+        kind (str): 오류 분류
+            - http      : 429 또는 5xx 응답
+            - blocked   : json 대신 HTML(차단/점검 페이지)을 받은 경우
+            - empty     : 응답 본문이나 json이 비어 있는 경우
+            - truncated : json이 중간에 끊긴 경우
+            - network   : 연결 실패, timeout
+            - circuit   : 서킷 브레이커가 열려 있어 요청하지 않은 경우
+        message (str): 오류 메시지
+    """
+
+    def __init__(self, kind: str, message: str = ""):
+        super().__init__(f"[{kind}] {message}")
+        self.kind = kind
+
+
+class CircuitOpenError(TransientError):
+    def __init__(self, host: str):
+        super().__init__("circuit", f"{host}의 서킷 브레이커가 열려 있습니다.")
+        self.host = host
+
+
+# 서킷 브레이커의 실패로 세지 않는 오류. 빈 응답은 잘못된 파라미터로도 생긴다.
+_NOT_REJECTED = ("empty",)
+
+
+def check_response(resp: requests.Response):
+    """HTTP 상태와 본문으로 응답을 분류한다.
+
+    Raises:
+        TransientError         : 재시도할 수 있는 응답
+        requests.HTTPError     : 재시도해도 소용없는 4xx 응답
+    """
+    status = resp.status_code
+    if status == 429 or status >= 500:
+        raise TransientError("http", f"HTTP {status}: {resp.url}")
+    if status == 403:
+        raise TransientError("blocked", f"HTTP {status}: {resp.url}")
+    resp.raise_for_status()
+    if not resp.content:
+        raise TransientError("empty", f"빈 응답: {resp.url}")
+
+
+def decode_json(resp: requests.Response):
+    """KRX json 응답을 분류하고 디코딩한다.
+
+    Raises:
+        TransientError: HTML 페이지, 빈 json, 끊긴 json 등 재시도할 수 있는 응답
+    """
+    check_response(resp)
+    # KRX는 json 응답도 Content-Type을 text/html로 보내므로 본문으로 판단한다.
+    if resp.content.lstrip()[:1] == b"<":
+        raise TransientError("blocked", f"HTML 응답: {resp.url}")
+    try:
+        result = resp.json()
+    except (json.JSONDecodeError, ValueError) as e:
+        raise TransientError("truncated", f"{e}: {resp.url}") from e
+    if not result:
+        raise TransientError("empty", f"빈 json: {resp.url}")
+    return result
+
+
+class RetryPolicy:
+    """지수 백오프와 full jitter를 사용하는 재시도 정책
+
+    n번째 재시도 전에 [0, min(max_delay, base_delay * 2**n)] 사이의 임의의
+    시간만큼 기다린다.
+
+    Args:
+        attempts   (int  , optional): 최대 시도 횟수 (첫 요청 포함)
+        base_delay (float, optional): 백오프 기준 시간 (초)
+        max_delay  (float, optional): 최대 대기 시간 (초)
+    """
+
+    def __init__(self, attempts: int = 4, base_delay: float = 0.5, max_delay=8.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retry: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+class CircuitBreaker:
+    """호스트별 서킷 브레이커
+
+    연속 실패가 failure_threshold에 이르면 열리고, 열려 있는 동안에는 요청을
+    보내지 않고 CircuitOpenError를 발생시킨다. reset_timeout이 지나면 한 번의
+    시험 요청을 허용해서 성공하면 닫고, 실패하면 다시 연다.
+
+    Args:
+        host              (str  ): 호스트 이름
+        failure_threshold (int  , optional): 열리기까지의 연속 실패 횟수
+        reset_timeout     (float, optional): 열린 뒤 시험 요청까지의 시간 (초)
+    """
+
+    def __init__(self, host: str, failure_threshold: int = 5, reset_timeout=30.0):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened is None:
+                return "closed"
+            if time.monotonic() - self._opened >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def allow(self):
+        """요청을 보내도 되는지 확인한다.
+
+        Raises:
+            CircuitOpenError: 서킷 브레이커가 열려 있는 경우
+        """
+        with self._lock:
+            if self._opened is None:
+                return
+            elapsed = time.monotonic() - self._opened
+            if elapsed >= self.reset_timeout and not self._probing:
+                self._probing = True
+                return
+        metrics.inc("pykrx_circuit_rejected_total", host=self.host)
+        raise CircuitOpenError(self.host)
+
+    def record(self, success: bool):
+        with self._lock:
+            self._probing = False
+            if success:
+                self._failures = 0
+                self._opened = None
+                return
+            self._failures += 1
+            if self._opened is not None or self._failures >= self.failure_threshold:
+                if self._opened is None:
+                    metrics.inc("pykrx_circuit_opened_total", host=self.host)
+                self._opened = time.monotonic()
+
+    def release(self):
+        """결과를 기록하지 않고 요청을 마친다.
+
+        반쯤 열린 상태의 시험 요청이 호스트 상태와 관계없는 오류(4xx, 취소,
+        deadline 초과 등)로 끝나면 다음 요청이 다시 시험 요청이 된다.
+        """
+        with self._lock:
+            self._probing = False
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._opened = None
+            self._probing = False
+
+
+_policy = RetryPolicy()
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def set_retry_policy(policy: RetryPolicy):
+    """모든 요청에 적용할 재시도 정책을 설정한다."""
+    global _policy
+    _policy = policy
+
+
+def circuit_breaker(url: str) -> CircuitBreaker:
+    """url의 호스트에 해당하는 서킷 브레이커"""
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+def call_with_retry(url: str, func):
+    """func를 재시도 정책과 서킷 브레이커를 적용해서 호출한다.
+
+    Args:
+        url  (str): 요청 url (호스트별 서킷 브레이커와 지표에 사용)
+        func      : 인자 없이 호출되는 요청 함수. 실패를 TransientError나
+                    requests의 연결 오류로 알린다.
+
+    Returns:
+        func의 반환값
+
+    Raises:
+        TransientError: 모든 시도가 실패한 경우 마지막 오류
+    """
+    breaker = circuit_breaker(url)
+    policy = _policy
+    host = breaker.host
+    for attempt in range(policy.attempts):
+        breaker.allow()
+        try:
+            result = func()
+        except TransientError as e:
+            error = e
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = TransientError("network", str(e))
+            error.__cause__ = e
+        except BaseException:
+            breaker.release()
+            raise
+        else:
+            breaker.record(True)
+            metrics.inc("pykrx_requests_total", host=host, result="ok")
+            return result
+
+        metrics.inc("pykrx_requests_total", host=host, result=error.kind)
+        if error.kind not in _NOT_REJECTED:
+            breaker.record(False)
+        else:
+            breaker.release()
+        if attempt + 1 < policy.attempts:
+            metrics.inc("pykrx_retries_total", host=host, kind=error.kind)
+            pause(policy.delay(attempt), "backoff")
+    raise error
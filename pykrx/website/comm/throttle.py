@@ -0,0 +1,240 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from pykrx.website.comm import metrics
+from pykrx.website.comm.context import current_deadline, pause
+from pykrx.website.comm.retry import TransientError
+
+# 혼잡 신호로 보지 않는 TransientError (요청 자체는 정상 처리됨)
+_NOT_CONGESTION = ("empty", "circuit")
+
+
+class AimdLimiter:
+    """지연 시간과 오류로 동시 요청 수와 요청 속도를 조절하는 제한기
+
+    요청이 latency_target 안에 성공하면 동시 요청 수와 초당 요청 수를
+    조금씩 늘리고(additive increase), 오류나 느린 응답이 관측되면 decrease
+    비율만큼 줄인다(multiplicative decrease). 같은 혼잡 구간에서 연달아
+    줄어들지 않도록 감소는 cooldown 초에 한 번만 적용한다.
+
+        >> with limiter.slot():
+        >>     resp = session.post(...)
+
+    Args:
+        name           (str  ): 제한기 이름 (호스트 또는 bld)
+        concurrency    (float): 초기 동시 요청 수
+        rate           (float): 초기 초당 요청 수
+        min_concurrency(float): 최소 동시 요청 수
+        max_concurrency(float): 최대 동시 요청 수
+        min_rate       (float): 최소 초당 요청 수
+        max_rate       (float): 최대 초당 요청 수
+        increase       (float): 성공 한 번에 늘리는 양의 기준 (x += increase / x)
+        decrease       (float): 혼잡 시 곱하는 비율
+        latency_target (float): 이보다 느린 응답은 혼잡으로 본다 (초)
+        cooldown       (float): 감소 사이의 최소 간격 (초)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        concurrency: float = 4,
+        rate: float = 8,
+        min_concurrency: float = 1,
+        max_concurrency: float = 16,
+        min_rate: float = 0.5,
+        max_rate: float = 50,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_target: float = 3.0,
+        cooldown: float = 1.0,
+    ):
+        self.name = name
+        self.concurrency = concurrency
+        self.rate = rate
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._next = 0.0
+        self._last_decrease = -float("inf")
+
+    @property
+    def inflight(self) -> int:
+        return self._inflight
+
+    def acquire(self):
+        """동시 요청 수와 요청 속도가 허용할 때까지 기다린다."""
+        deadline = current_deadline()
+        with self._cond:
+            if self._inflight >= max(int(self.concurrency), 1):
+                with metrics.timer("pykrx_wait_seconds", io=True, on="throttle"):
+                    while self._inflight >= max(int(self.concurrency), 1):
+                        if deadline is None:
+                            self._cond.wait()
+                        else:
+                            self._cond.wait(deadline.timeout(0.05))
+                            deadline.check()
+            self._inflight += 1
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + 1.0 / self.rate
+        if start > now:
+            try:
+                pause(start - now, "throttle")
+            except BaseException:
+                self.release()
+                raise
+
+    def release(self, latency: float = None, congested: bool = None):
+        """요청을 마치고 결과로 한도를 조절한다.
+
+        Args:
+            latency   (float, optional): 응답 시간 (초)
+            congested (bool , optional): 혼잡 신호 여부. None이면 조절하지 않는다.
+        """
+        with self._cond:
+            self._inflight -= 1
+            if congested is not None:
+                if latency is not None and latency > self.latency_target:
+                    congested = True
+                if congested:
+                    self._on_congestion()
+                else:
+                    self.concurrency = min(
+                        self.max_concurrency,
+                        self.concurrency + self.increase / self.concurrency,
+                    )
+                    self.rate = min(
+                        self.max_rate, self.rate + self.increase / self.rate
+                    )
+            self._cond.notify_all()
+
+    def _on_congestion(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.concurrency = max(self.min_concurrency, self.concurrency * self.decrease)
+        self.rate = max(self.min_rate, self.rate * self.decrease)
+        metrics.inc("pykrx_throttle_decrease_total", limiter=self.name)
+
+    def slot(self):
+        return _Slot(self)
+
+    def snapshot(self) -> dict:
+        with self._cond:
+            return {
+                "concurrency": self.concurrency,
+                "rate": self.rate,
+                "inflight": self._inflight,
+            }
+
+
+class _Slot:
+    def __init__(self, limiter: AimdLimiter):
+        self.limiter = limiter
+
+    def __enter__(self):
+        self.limiter.acquire()
+        self.start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        latency = time.monotonic() - self.start
+        if exc is None:
+            congested = False
+        elif isinstance(exc, TransientError):
+            congested = exc.kind not in _NOT_CONGESTION
+        elif isinstance(exc, requests.ConnectionError | requests.Timeout):
+            congested = True
+        else:
+            congested = None
+        self.limiter.release(latency, congested)
+        return False
+
+
+# 호스트별 기본 한도
+HOST_LIMITS = {
+    "data.krx.co.kr": {"concurrency": 4, "rate": 8, "max_concurrency": 16},
+    "fchart.stock.naver.com": {"concurrency": 8, "rate": 20, "max_concurrency": 32},
+}
+
+# 무거운 bld의 한도. 호스트 한도와 함께 적용된다.
+BLD_LIMITS = {
+    # 전종목 시세
+    "dbms/MDC/STAT/standard/MDCSTAT01501": {
+        "concurrency": 2,
+        "rate": 2,
+        "max_concurrency": 4,
+        "max_rate": 4,
+    },
+}
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def set_limits(name: str, **kwargs):
+    """호스트(예: data.krx.co.kr) 또는 bld의 한도를 설정한다.
+
+    Args:
+        name (str): 호스트 이름 또는 bld
+        kwargs    : AimdLimiter의 인자 (concurrency, rate, max_rate 등)
+    """
+    table = BLD_LIMITS if "/" in name else HOST_LIMITS
+    with _limiters_lock:
+        table[name] = {**table.get(name, {}), **kwargs}
+        _limiters.pop(name, None)
+
+
+def limiter(name: str) -> AimdLimiter:
+    """호스트 또는 bld의 제한기"""
+    with _limiters_lock:
+        item = _limiters.get(name)
+        if item is None:
+            limits = BLD_LIMITS.get(name) or HOST_LIMITS.get(name, {})
+            item = _limiters[name] = AimdLimiter(name, **limits)
+        return item
+
+
+class _Slots:
+    def __init__(self, limiters: list):
+        self.slots = [x.slot() for x in limiters]
+
+    def __enter__(self):
+        entered = []
+        try:
+            for x in self.slots:
+                entered.append(x.__enter__())
+        except BaseException:
+            for x in reversed(entered):
+                x.limiter.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        for x in reversed(self.slots):
+            x.__exit__(exc_type, exc, tb)
+        return False
+
+
+def slot(url: str, bld: str = None):
+    """url의 호스트 제한기와 (한도가 지정된) bld 제한기의 슬롯
+
+    >> with slot(url, params.get("bld")):
+    >>     resp = session.post(url, data=params)
+    """
+    limiters = []
+    if bld in BLD_LIMITS:
+        limiters.append(limiter(bld))
+    limiters.append(limiter(urlparse(url).netloc or url))
+    return _Slots(limiters)
@@ -0,0 +1,206 @@
+import contextvars
+import threading
+import time
+
+# 현재 열려 있는 span과 수집기. 스레드/asyncio 태스크마다 따로 관리된다.
+_current = contextvars.ContextVar("pykrx_span", default=None)
+_collector = contextvars.ContextVar("pykrx_span_collector", default=None)
+_hooks = []
+
+
+class Span:
+    """pykrx 처리 단계 하나의 실행 구간
+
+    Attributes:
+        name       (str  ): 단계 이름
+            - wrap    : wrap 함수 전체 (자기 시간은 pandas 변환)
+            - fetch   : core의 fetch (자기 시간은 json -> DataFrame 파싱)
+            - read    : KrxWebIo.read (bld 단위 조회)
+            - chunk   : 기간 조회를 나눈 한 구간 (index)
+            - request : read_json/read 호출 (재시도, 중복 요청 대기 포함)
+            - network : HTTP 요청 한 번
+            - decode  : json 디코딩과 응답 검사
+            - sleep   : 청크 사이 휴식, 재시도 대기, 속도 제한 대기
+        attributes (dict ): bld, rows, index 등
+        parent     (Span ): 상위 span
+        start      (float): 시작 시각 (time.perf_counter)
+        end        (float): 종료 시각. 진행 중이면 None
+    """
+
+    __slots__ = ("name", "attributes", "parent", "start", "end", "error", "_child")
+
+    def __init__(self, name: str, attributes: dict, parent):
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.start = time.perf_counter()
+        self.end = None
+        self.error = None
+        self._child = 0.0
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return end - self.start
+
+    @property
+    def self_time(self) -> float:
+        """하위 span을 제외한 시간. 동시에 실행된 하위 span이 있으면 0이 될 수 있다."""
+        return max(self.duration - self._child, 0.0)
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def __repr__(self):
+        return f"Span({self.name!r}, {self.duration * 1000:.2f} ms, {self.attributes})"
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+
+class _NoopContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return _NOOP_SPAN
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+_NOOP_CONTEXT = _NoopContext()
+
+
+class _SpanContext:
+    __slots__ = ("name", "attributes", "collector", "span", "token")
+
+    def __init__(self, name: str, attributes: dict, collector):
+        self.name = name
+        self.attributes = attributes
+        self.collector = collector
+
+    def __enter__(self):
+        self.span = Span(self.name, self.attributes, _current.get())
+        self.token = _current.set(self.span)
+        for hook in list(_hooks):
+            hook.on_start(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        span = self.span
+        span.end = time.perf_counter()
+        span.error = exc
+        _current.reset(self.token)
+        if span.parent is not None:
+            span.parent._child += span.duration
+        if self.collector is not None:
+            self.collector._add(span)
+        for hook in list(_hooks):
+            hook.on_end(span)
+        return False
+
+
+def span(name: str, **attributes):
+    """처리 단계를 span으로 기록하는 context manager
+
+    등록된 hook이나 collect() 수집기가 없으면 아무 일도 하지 않는 객체를
+    반환하므로 비용이 거의 없다.
+
+        >> with span("fetch", bld=self.bld) as sp:
+        >>     df = DataFrame(result["output"])
+        >>     sp.set(rows=len(df))
+    """
+    collector = _collector.get()
+    if collector is None and not _hooks:
+        return _NOOP_CONTEXT
+    return _SpanContext(name, attributes, collector)
+
+
+def enabled() -> bool:
+    return bool(_hooks) or _collector.get() is not None
+
+
+class SpanHook:
+    """span 시작/종료 시 호출되는 hook의 기본 클래스
+
+    on_start/on_end는 span을 실행한 스레드에서 호출되므로 빨리 반환해야 한다.
+
+        >> class Printer(SpanHook):
+        >>     def on_end(self, span):
+        >>         print(span)
+        >> add_hook(Printer())
+    """
+
+    def on_start(self, span: Span):
+        pass
+
+    def on_end(self, span: Span):
+        pass
+
+
+def add_hook(hook: SpanHook) -> SpanHook:
+    """모든 span에 대해 호출할 hook을 등록한다."""
+    _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook: SpanHook):
+    _hooks.remove(hook)
+
+
+class Collector:
+    """collect() 블록 안에서 끝난 span을 모으는 수집기"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans = []
+
+    def _add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def breakdown(self) -> dict:
+        """단계별 횟수, 전체 시간, 자기 시간(하위 단계 제외)
+
+        Returns:
+            dict: {단계 이름: {"count": 횟수, "total": 초, "self": 초}}
+
+            >> with collect() as c:
+            >>     stock.get_market_ohlcv("20240102", "20240131", "005930")
+            >> c.breakdown()
+            {'request': {'count': 2, 'total': 0.41, 'self': 0.41},
+             'decode': {'count': 2, 'total': 0.002, 'self': 0.002},
+             'fetch': {'count': 1, 'total': 0.42, 'self': 0.001}, ...}
+        """
+        result = {}
+        with self._lock:
+            spans = list(self.spans)
+        for x in spans:
+            item = result.setdefault(x.name, {"count": 0, "total": 0.0, "self": 0.0})
+            item["count"] += 1
+            item["total"] += x.duration
+            item["self"] += x.self_time
+        return result
+
+
+class collect:
+    """블록 안(concurrent_map 작업 포함)의 span을 수집하는 context manager
+
+    >> with collect() as c:
+    >>     df = stock.get_market_snapshot("20240102")
+    >> c.breakdown()
+    """
+
+    def __enter__(self) -> Collector:
+        self.collector = Collector()
+        self.token = _collector.set(self.collector)
+        return self.collector
+
+    def __exit__(self, exc_type, exc, tb):
+        _collector.reset(self.token)
+        return False
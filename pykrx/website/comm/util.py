@@ -1,12 +1,25 @@
+import contextvars
 import logging
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
 
+import pandas as pd
 from pandas import DataFrame
 
+from pykrx.website.comm import metrics, tracing
+from pykrx.website.comm.context import current_deadline
+
 
 def dataframe_empty_handler(func):
+    name = func.__name__
+    func = metrics.transform_timer(func)
+
     def wrapper(*args, **kwargs):
         try:
-            return func(*args, **kwargs)
+            with tracing.span("wrap", func=name) as sp:
+                df = func(*args, **kwargs)
+                sp.set(rows=getattr(df, "shape", (None,))[0])
+                return df
         except (AttributeError, KeyError, TypeError, ValueError) as e:
             logging.info(args, kwargs)
             logging.info(e)
@@ -33,3 +46,205 @@ def singleton(class_):
 
     class_w.__name__ = class_.__name__
     return class_w
+
+
+def concurrent_map(func, items, max_workers: int = None) -> list:
+    """items의 각 원소에 func를 스레드 풀에서 동시에 적용한다.
+
+    Args:
+        func                  : 각 원소에 적용할 함수
+        items                 : 입력 원소 목록
+        max_workers (int, optional): 최대 동시 실행 수. 입력하지 않으면 원소 수
+
+    Returns:
+        list: items와 같은 순서의 결과 목록. 작업 중 발생한 예외는 호출자에게
+              그대로 전달된다.
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(x) for x in items]
+    if max_workers is None:
+        max_workers = len(items)
+    # deadline 등 호출자의 contextvars를 작업 스레드에 전달한다.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, func, x) for x in items
+        ]
+        try:
+            with metrics.timer("pykrx_wait_seconds", io=True, on="workers"):
+                return [x.result() for x in futures]
+        except BaseException:
+            for x in futures:
+                x.cancel()
+            raise
+
+
+# 실행한 스레드에만 해당하는 예외 (SingleFlight가 공유하지 않는다)
+_NOT_SHARED = (CancelledError, TimeoutError)
+
+
+class SingleFlight:
+    """같은 키의 작업이 동시에 요청되면 한 번만 실행하고 결과를 공유한다.
+
+    먼저 요청한 스레드가 작업을 실행하는 동안 같은 키로 요청한 스레드는
+    완료를 기다렸다가 같은 결과(또는 예외)를 받는다. 작업이 끝나면 키를
+    지우므로 결과를 보관하지는 않는다. 실행한 스레드가 취소되거나 마감
+    시간을 넘기면 기다리던 스레드는 그 예외를 받지 않고 다시 요청한다.
+
+        >> flight = SingleFlight()
+        >> flight.do(("POST", url, params), lambda: requests.post(...))
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func, copy=None):
+        """key로 func를 실행하고 결과를 반환한다.
+
+        Args:
+            key        : 요청을 구분하는 hashable 값
+            func       : 인자 없이 호출되는 작업
+            copy       : 결과를 호출자마다 복사하는 함수. 공유된 결과를
+                         호출자가 수정할 수 있으면 지정한다.
+
+        Returns:
+            func의 반환값 (copy를 지정하면 복사본)
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                leader = call is None
+                if leader:
+                    call = self._calls[key] = self._Call()
+
+            if leader:
+                try:
+                    call.result = func()
+                except BaseException as e:
+                    call.error = e
+                finally:
+                    with self._lock:
+                        del self._calls[key]
+                    call.done.set()
+            else:
+                deadline = current_deadline()
+                with metrics.timer("pykrx_wait_seconds", io=True, on="inflight"):
+                    if deadline is None:
+                        call.done.wait()
+                    else:
+                        deadline.wait(call.done)
+
+            if call.error is None:
+                return call.result if copy is None else copy(call.result)
+            # 취소와 deadline 초과는 먼저 요청한 스레드의 사정이므로 공유하지
+            # 않는다. 기다리던 스레드는 다시 요청한다.
+            if leader or not isinstance(call.error, _NOT_SHARED):
+                raise call.error
+
+    def __len__(self):
+        with self._lock:
+            return len(self._calls)
+
+
+def freeze(params: dict) -> tuple:
+    """dict 파라미터를 키로 쓸 수 있는 정렬된 tuple로 바꾼다."""
+    return tuple(sorted((k, str(v)) for k, v in params.items()))
+
+
+def copy_json(result):
+    """json 응답의 최상위 dict와 행 목록을 복사한다. 행(dict)은 공유한다."""
+    if isinstance(result, dict):
+        return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
+    if isinstance(result, list):
+        return list(result)
+    return result
+
+
+def to_numeric(df: DataFrame, dtypes: dict, pattern: str = r"[^-\w\.]") -> DataFrame:
+    """KRX의 숫자 문자열 열을 dtypes로 변환한다.
+
+    pattern에 해당하는 문자(천 단위 구분 기호 등)를 지우고, "-"로 끝나는 값과
+    빈 문자열은 0으로 본다. 전체 DataFrame에 replace를 여러 번 적용하면 종목명
+    같은 문자열 열까지 매번 복사되므로, 변환할 열만 한 번씩 정리한다.
+
+    Args:
+        df      (DataFrame): KRX 응답으로 만든 DataFrame
+        dtypes  (dict     ): {열 이름: dtype}
+        pattern (str      , optional): 지울 문자의 정규식
+
+    Returns:
+        DataFrame: dtypes의 열을 변환한 DataFrame. 나머지 열은 그대로 둔다.
+    """
+    columns = {}
+    for name, dtype in dtypes.items():
+        s = df[name]
+        if s.dtype == object:
+            s = s.str.replace(pattern, "", regex=True)
+            s = s.str.replace(r"\-$", "0", regex=True)
+            s = s.mask(s == "", "0")
+        columns[name] = s.astype(dtype)
+    df = df.assign(**columns)
+    # set_index로 만든 인덱스는 원래 문자열 블록의 view라서, 복사하지 않으면
+    # 변환 전 문자열 열 전체가 결과와 함께 메모리에 남는다.
+    if getattr(df.index.to_numpy(), "base", None) is not None:
+        df.index = df.index.copy(deep=True)
+    return df
+
+
+def to_timestamp(date) -> pd.Timestamp:
+    """YYYYMMDD/YYYY-MM-DD 문자열, datetime 등을 자정 Timestamp로 변환한다."""
+    if isinstance(date, str):
+        date = date.replace("-", "").replace("/", "")
+    return pd.Timestamp(date).normalize()
+
+
+def merge_intervals(intervals: list) -> list:
+    """겹치거나 이어지는 (시작일, 종료일) 구간을 병합한다.
+
+    Args:
+        intervals (list): (Timestamp, Timestamp) 구간 목록. 양 끝 포함
+
+    Returns:
+        list: 정렬 및 병합된 구간 목록
+    """
+    merged = []
+    for s, e in sorted(intervals):
+        if merged and s <= merged[-1][1] + pd.Timedelta(days=1):
+            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+        else:
+            merged.append((s, e))
+    return merged
+
+
+def missing_intervals(covered: list, start, end) -> list:
+    """[start, end] 중 covered 구간에 포함되지 않는 구간을 반환한다.
+
+    Args:
+        covered (list): (Timestamp, Timestamp) 구간 목록. 양 끝 포함
+        start         : 조회 시작 일자
+        end           : 조회 종료 일자
+
+    Returns:
+        list: 누락된 (Timestamp, Timestamp) 구간 목록
+    """
+    start, end = to_timestamp(start), to_timestamp(end)
+    gaps = []
+    cursor = start
+    for s, e in merge_intervals(covered):
+        if e < cursor:
+            continue
+        if s > end:
+            break
+        if s > cursor:
+            gaps.append((cursor, s - pd.Timedelta(days=1)))
+        cursor = max(cursor, e + pd.Timedelta(days=1))
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
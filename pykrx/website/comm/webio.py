@@ -1,9 +1,129 @@
+import functools
 from abc import abstractmethod
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from pykrx.website.comm import metrics, throttle, tracing
+from pykrx.website.comm.context import current_deadline
+from pykrx.website.comm.retry import (
+    TransientError,
+    call_with_retry,
+    check_response,
+    decode_json,
+)
+from pykrx.website.comm.util import SingleFlight, copy_json, freeze
+
+# 동시에 들어온 같은 요청(url, 파라미터)은 한 번만 보낸다.
+_inflight = SingleFlight()
+
+# 연결을 재사용하도록 모든 요청이 하나의 세션을 공유한다.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+# (연결, 읽기) timeout (초)
+_timeout = [5.0, 30.0]
+
+# 실제로 요청을 보낼 주소. 부하 테스트에서 pykrx.testing.FakeServer로 바꾼다.
+_base_urls = {}
+
+
+def set_timeout(connect: float = None, read: float = None):
+    """모든 요청의 연결/읽기 timeout을 설정한다.
+
+    Args:
+        connect (float, optional): 연결 timeout (초)
+        read    (float, optional): 응답 대기 timeout (초)
+    """
+    if connect is not None:
+        _timeout[0] = connect
+    if read is not None:
+        _timeout[1] = read
+
+
+def set_base_url(origin: str, base: str = None):
+    """origin으로 보내는 요청을 base로 보낸다.
+
+    서킷 브레이커, 요청 한도, 지표는 원래 주소를 기준으로 동작한다.
+
+    Args:
+        origin (str): 원래 주소 (예: https://data.krx.co.kr)
+        base   (str, optional): 대신 사용할 주소 (예: http://127.0.0.1:8080).
+                                None이면 원래 주소로 되돌린다.
+    """
+    origin = origin.rstrip("/")
+    if base is None:
+        _base_urls.pop(origin, None)
+    else:
+        _base_urls[origin] = base.rstrip("/")
+
+
+def resolve_url(url: str) -> str:
+    """set_base_url을 반영한 실제 요청 주소"""
+    for origin, base in _base_urls.items():
+        if url.startswith(origin):
+            return base + url[len(origin) :]
+    return url
+
+
+def request_timeout() -> tuple:
+    """현재 deadline의 남은 시간을 반영한 (연결, 읽기) timeout"""
+    connect, read = _timeout
+    deadline = current_deadline()
+    if deadline is not None:
+        connect, read = deadline.timeout(connect), deadline.timeout(read)
+    return connect, read
+
+
+def _record_response(endpoint: str, resp: requests.Response):
+    metrics.inc(
+        "pykrx_responses_total", endpoint=endpoint, status=str(resp.status_code)
+    )
+    metrics.inc("pykrx_response_bytes_total", len(resp.content), endpoint=endpoint)
+
+
+def _rows(result) -> int:
+    """json 응답에 담긴 행 수"""
+    if not isinstance(result, dict):
+        return 0
+    return sum(len(x) for x in result.values() if isinstance(x, list))
+
+
+def _len(result):
+    try:
+        return len(result)
+    except TypeError:
+        return None
+
+
+def _traced_fetch(cls):
+    """cls가 정의한 fetch를 fetch span으로 감싼다.
+
+    fetch span의 자기 시간(하위 span 제외)은 json을 DataFrame으로 만드는
+    파싱 시간이다.
+    """
+    fetch = cls.__dict__.get("fetch")
+    if not callable(fetch) or getattr(fetch, "_traced", False):
+        return
+
+    @functools.wraps(fetch)
+    def wrapper(self, *args, **kwargs):
+        with tracing.span("fetch", source=type(self).__name__) as sp:
+            result = fetch(self, *args, **kwargs)
+            if isinstance(sp, tracing.Span):
+                sp.set(bld=getattr(self, "bld", None), rows=_len(result))
+            return result
+
+    wrapper._traced = True
+    cls.fetch = wrapper
 
 
 class Get:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _traced_fetch(cls)
+
     def __init__(self):
         self.headers = {
             "User-Agent": "Mozilla/5.0",
@@ -11,8 +131,27 @@ class Get:
         }
 
     def read(self, **params):
-        resp = requests.get(self.url, headers=self.headers, params=params)
-        return resp
+        def _get():
+            with (
+                throttle.slot(self.url),
+                tracing.span("network", endpoint=self.url),
+            ):
+                with metrics.timer("pykrx_network_seconds", io=True, endpoint=self.url):
+                    resp = _session.get(
+                        resolve_url(self.url),
+                        headers=self.headers,
+                        params=params,
+                        timeout=request_timeout(),
+                    )
+                _record_response(self.url, resp)
+                check_response(resp)
+                return resp
+
+        def _get_with_retry():
+            return call_with_retry(self.url, _get)
+
+        with tracing.span("request", endpoint=self.url):
+            return _inflight.do(("GET", self.url, freeze(params)), _get_with_retry)
 
     @property
     @abstractmethod
@@ -21,6 +160,10 @@ class Get:
 
 
 class Post:
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _traced_fetch(cls)
+
     def __init__(self, headers=None):
         self.headers = {
             "User-Agent": "Mozilla/5.0",
@@ -30,9 +173,56 @@ class Post:
             self.headers.update(headers)
 
     def read(self, **params):
-        resp = requests.post(self.url, headers=self.headers, data=params)
+        resp = _session.post(
+            resolve_url(self.url),
+            headers=self.headers,
+            data=params,
+            timeout=request_timeout(),
+        )
         return resp
 
+    def read_json(self, **params):
+        """POST 요청의 json 응답을 반환한다.
+
+        HTTP 오류, HTML 차단 페이지, 빈 json, 끊긴 json은 재시도하고, 빈
+        json이 계속되면 빈 dict를 반환한다. 같은 (url, 파라미터)의 요청이
+        진행 중이면 새로 요청하지 않고 그 결과를 공유한다. 호출자마다 응답의
+        행 목록을 복사해서 반환한다.
+        """
+
+        endpoint = params.get("bld", self.url)
+
+        def _attempt():
+            with throttle.slot(self.url, params.get("bld")):
+                with (
+                    tracing.span("network", endpoint=endpoint),
+                    metrics.timer("pykrx_network_seconds", io=True, endpoint=endpoint),
+                ):
+                    resp = Post.read(self, **params)
+                _record_response(endpoint, resp)
+                # 429, 403, 차단 페이지를 제한기가 혼잡으로 판단하도록 응답
+                # 분류까지 슬롯 안에서 한다.
+                with (
+                    tracing.span("decode", endpoint=endpoint) as sp,
+                    metrics.timer("pykrx_decode_seconds", io=True, endpoint=endpoint),
+                ):
+                    result = decode_json(resp)
+                    if isinstance(sp, tracing.Span):
+                        sp.set(bytes=len(resp.content), rows=_rows(result))
+                    return result
+
+        def _post():
+            try:
+                return call_with_retry(self.url, _attempt)
+            except TransientError as e:
+                if e.kind == "empty":
+                    return {}
+                raise
+
+        key = ("POST", self.url, freeze(params))
+        with tracing.span("request", endpoint=endpoint):
+            return _inflight.do(key, _post, copy=copy_json)
+
     @property
     @abstractmethod
     def url(self):
@@ -61,6 +61,8 @@ class 전종목_장외채권수익률(KrxWebIo):
 
 
 class 개별추이_장외채권수익률(KrxWebIo):
+    date_field = "DISCLS_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT11402"
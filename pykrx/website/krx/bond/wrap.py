@@ -2,9 +2,24 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import concurrent_map, dataframe_empty_handler
 from pykrx.website.krx.bond.core import 개별추이_장외채권수익률, 전종목_장외채권수익률
 
+# 장외 채권 티커와 개별추이 조회 코드
+_TICKER2CODE = {
+    "국고채1년": "3006",
+    "국고채2년": "3019",
+    "국고채3년": "3000",
+    "국고채5년": "3007",
+    "국고채10년": "3013",
+    "국고채20년": "3014",
+    "국고채30년": "3017",
+    "국민주택1종5년": "3008",
+    "회사채AA": "3009",
+    "회사채BBB": "3010",
+    "CD": "4000",
+}
+
 
 @dataframe_empty_handler
 def get_otc_treasury_yields_by_ticker(date: str) -> DataFrame:
@@ -75,21 +90,7 @@ def get_otc_treasury_yields_by_date(
         2022-01-07  1.895  0.017
         2022-01-10  1.902  0.007
     """
-    ticker2code = {
-        "국고채1년": "3006",
-        "국고채2년": "3019",
-        "국고채3년": "3000",
-        "국고채5년": "3007",
-        "국고채10년": "3013",
-        "국고채20년": "3014",
-        "국고채30년": "3017",
-        "국민주택1종5년": "3008",
-        "회사채AA": "3009",
-        "회사채BBB": "3010",
-        "CD": "4000",
-    }
-
-    df = 개별추이_장외채권수익률().fetch(fromdate, todate, ticker2code[ticker])
+    df = 개별추이_장외채권수익률().fetch(fromdate, todate, _TICKER2CODE[ticker])
     df.columns = ["일자", "수익률", "대비"]
     df = df.astype({"수익률": np.float32, "대비": np.float32})
     df = df.set_index("일자")
@@ -97,6 +98,49 @@ def get_otc_treasury_yields_by_date(
     return df.sort_index()
 
 
+@dataframe_empty_handler
+def get_otc_treasury_yield_curve(
+    fromdate: str, todate: str, tickers: list = None, max_workers: int = 8
+) -> DataFrame:
+    """[14017] 장외 채권수익률 - 여러 채권종류의 개별추이를 날짜로 정렬
+
+    채권종류마다 개별추이를 동시에 조회해서 일자 x 채권종류 행렬로 맞춘다.
+    IntervalCache를 켜 두면 이미 조회한 구간은 다시 요청하지 않는다.
+
+    Args:
+        fromdate    (str ): 조회 시작 일자 (YYYYMMDD)
+        todate      (str ): 조회 종료 일자 (YYYYMMDD)
+        tickers     (list, optional): 장외 채권 티커 목록. 입력하지 않으면
+                                      11개 전체
+        max_workers (int , optional): 동시에 보낼 최대 요청 수
+
+    Returns:
+        DataFrame: 일자 index, 채권종류 columns인 수익률 (%) DataFrame
+
+            > get_otc_treasury_yield_curve("20220104", "20220105")
+
+                            국고채1년  국고채2년  국고채3년  국고채5년  ...
+            일자
+            2022-01-04      1.299      1.717      1.859      2.032  ...
+            2022-01-05      1.340      1.791      1.945      2.127  ...
+    """
+    tickers = list(tickers or _TICKER2CODE)
+    frames = concurrent_map(
+        lambda x: get_otc_treasury_yields_by_date(fromdate, todate, x),
+        tickers,
+        max_workers,
+    )
+    parts = {
+        k: v["수익률"] for k, v in zip(tickers, frames, strict=True) if not v.empty
+    }
+    if not parts:
+        return DataFrame()
+    # 개별추이의 float32 수익률을 KRX가 공시하는 소수점 셋째 자리로 되돌린다.
+    df = pd.concat(parts, axis=1).astype(np.float64).round(3)
+    df.index.name = "일자"
+    return df.reindex(columns=[x for x in tickers if x in parts]).sort_index()
+
+
 if __name__ == "__main__":
     pd.set_option("display.width", None)
     # df = get_otc_treasury_yields_by_ticker("20220204")
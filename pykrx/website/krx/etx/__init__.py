@@ -1,2 +1,3 @@
+from .deviation import *
 from .ticker import *
 from .wrap import *
@@ -0,0 +1,187 @@
+import logging
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm import (
+    CircuitOpenError,
+    concurrent_map,
+    dataframe_empty_handler,
+)
+from pykrx.website.krx.etx.ticker import EtxTicker
+from pykrx.website.krx.etx.wrap import (
+    get_etf_price_deviation,
+    get_etf_tracking_error,
+)
+
+_FIELDS = ["종가", "NAV", "괴리율", "지수", "추적오차율"]
+_STATISTICS = [
+    "괴리율평균",
+    "괴리율표준편차",
+    "괴리율Z",
+    "이상치",
+    "추적차이",
+    "추적오차",
+]
+
+# 연율화에 사용하는 연간 영업일 수
+_TRADING_DAYS = 252
+
+
+def _rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """axis 0 방향으로 [t - window + 1, t] 구간의 합"""
+    c = np.zeros((x.shape[0] + 1,) + x.shape[1:])
+    np.cumsum(x, axis=0, out=c[1:])
+    hi = np.arange(1, x.shape[0] + 1)
+    return c[hi] - c[np.maximum(hi - window, 0)]
+
+
+def _rolling_mean_std(x: np.ndarray, window: int) -> tuple:
+    """NaN을 제외한 이동 평균과 표본 표준편차
+
+    누적합의 차로 구간 합을 구하므로 ETF 수와 관계없이 배열 연산 몇 번으로
+    끝난다. 구간 안의 값이 window개보다 적으면 NaN이다 (pandas rolling과 같다).
+    """
+    valid = ~np.isnan(x)
+    v = np.where(valid, x, 0.0)
+    n = _rolling_sum(valid.astype(np.float64), window)
+    s = _rolling_sum(v, window)
+    s2 = _rolling_sum(v * v, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = s / n
+        var = np.maximum(s2 - s * mean, 0) / (n - 1)
+    full = n >= window
+    return np.where(full, mean, np.nan), np.where(full, np.sqrt(var), np.nan)
+
+
+def _returns(x: np.ndarray) -> np.ndarray:
+    r = np.full_like(x, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r[1:] = x[1:] / x[:-1] - 1
+    return r
+
+
+def _fetch(job: tuple):
+    """ETF 하나의 조회. 실패하면 None을 반환해서 그 ETF만 NaN으로 남긴다.
+
+    취소, deadline 초과, 서킷 브레이커 거부는 전체 조회를 멈춰야 하므로
+    그대로 발생시킨다.
+    """
+    func, fromdate, todate, ticker = job
+    try:
+        return func(fromdate, todate, ticker)
+    except (CancelledError, TimeoutError, CircuitOpenError):
+        raise
+    except Exception as e:
+        logging.warning(f"{func.__name__}({ticker}) 조회 실패: {e}")
+        return None
+
+
+@dataframe_empty_handler
+def get_etf_nav_panel(
+    fromdate: str, todate: str, tickers: list = None, max_workers: int = 8
+) -> DataFrame:
+    """[13112][13113] 여러 ETF의 종가/NAV/괴리율/지수/추적오차율을 날짜로 정렬
+
+    ETF마다 괴리율 추이와 추적오차율 추이를 동시에 조회해서 날짜 x ETF
+    행렬로 맞춘다. 조회 결과가 없는 (날짜, ETF)는 NaN이다. 조회에 실패한
+    ETF는 다른 ETF의 결과에 영향을 주지 않고 해당 필드만 NaN으로 남는다.
+
+    Args:
+        fromdate    (str ): 조회 시작 일자 (YYYYMMDD)
+        todate      (str ): 조회 종료 일자 (YYYYMMDD)
+        tickers     (list, optional): ETF 티커 목록. 입력하지 않으면 todate에
+                                      상장된 전체 ETF
+        max_workers (int , optional): 동시에 보낼 최대 요청 수
+
+    Returns:
+        DataFrame: 날짜 index, (필드, 티커) columns인 float64 DataFrame
+
+                            종가                NAV          ...
+                          069500  152100     069500   152100 ...
+            날짜
+            2021-01-04   40815.0 42345.0   40885.24 42401.17 ...
+            2021-01-05   41450.0 42975.0   41510.71 43002.53 ...
+    """
+    if tickers is None:
+        tickers = EtxTicker().get_ticker("ETF", todate)
+    jobs = [
+        (func, fromdate, todate, ticker)
+        for ticker in tickers
+        for func in (get_etf_price_deviation, get_etf_tracking_error)
+    ]
+    frames = concurrent_map(_fetch, jobs, max_workers)
+
+    parts, columns = {}, []
+    for i, ticker in enumerate(tickers):
+        deviation, tracking = frames[2 * i], frames[2 * i + 1]
+        failed = deviation is None or tracking is None
+        deviation = DataFrame() if deviation is None else deviation
+        tracking = DataFrame() if tracking is None else tracking
+        if deviation.empty and tracking.empty:
+            if failed:
+                columns.append(ticker)
+            continue
+        if not deviation.empty and not tracking.empty:
+            tracking = tracking.drop(columns="NAV")
+        parts[ticker] = pd.concat([deviation, tracking], axis=1)
+        columns.append(ticker)
+    if not parts:
+        return DataFrame()
+
+    df = pd.concat(parts, axis=1).astype(np.float64)
+    df = df.swaplevel(axis=1).reindex(
+        columns=pd.MultiIndex.from_product([_FIELDS, columns])
+    )
+    df.index.name = "날짜"
+    return df.sort_index()
+
+
+def get_etf_deviation_statistics(
+    panel: DataFrame, window: int = 20, threshold: float = 3.0
+) -> DataFrame:
+    """get_etf_nav_panel의 결과로 괴리율과 추적오차 통계를 계산한다.
+
+    모든 ETF를 한 번에 (날짜, ETF) 배열로 계산한다.
+
+    - 괴리율평균/괴리율표준편차: 당일을 포함한 window 영업일의 괴리율 평균과
+      표준편차 (%)
+    - 괴리율Z: 전일까지 window 영업일의 평균과 표준편차로 정규화한 당일 괴리율
+    - 이상치: |괴리율Z| > threshold
+    - 추적차이: NAV 수익률 - 지수 수익률 (%p)
+    - 추적오차: window 영업일 추적차이의 표준편차를 연율화한 값 (%)
+
+    Args:
+        panel     (DataFrame): get_etf_nav_panel의 결과
+        window    (int  , optional): 이동 구간의 영업일 수
+        threshold (float, optional): 이상치로 볼 괴리율Z의 절대값
+
+    Returns:
+        DataFrame: 날짜 index, (통계, 티커) columns인 DataFrame
+    """
+    if panel.empty:
+        return DataFrame()
+    tickers = panel["괴리율"].columns
+    premium = panel["괴리율"].to_numpy(dtype=np.float64)
+    mean, std = _rolling_mean_std(premium, window)
+
+    # 당일 값이 자신의 기준에 섞이지 않도록 전일까지의 통계와 비교한다.
+    prev_mean = np.vstack([np.full((1, mean.shape[1]), np.nan), mean[:-1]])
+    prev_std = np.vstack([np.full((1, std.shape[1]), np.nan), std[:-1]])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        z = (premium - prev_mean) / prev_std
+        outlier = np.abs(z) > threshold
+
+    nav = panel["NAV"].to_numpy(dtype=np.float64)
+    index = panel["지수"].to_numpy(dtype=np.float64)
+    difference = (_returns(nav) - _returns(index)) * 100
+    tracking = _rolling_mean_std(difference, window)[1] * np.sqrt(_TRADING_DAYS)
+
+    values = [mean, std, z, outlier, difference, tracking]
+    return pd.concat(
+        [DataFrame(x, index=panel.index, columns=tickers, copy=False) for x in values],
+        axis=1,
+        keys=_STATISTICS,
+    )
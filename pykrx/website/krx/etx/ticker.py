@@ -27,9 +27,11 @@ class EtxTicker:
         df_elw = df_elw[["ISU_CD", "ISU_SRT_CD", "ISU_ABBRV", "LIST_DD"]].copy()
         df_elw["CATEGORY"] = "ELW"
 
-        df = pd.concat([df_etf, df_etn, df_elw])
+        df = pd.concat([df_etf, df_etn, df_elw], ignore_index=True)
         df.columns = ["isin", "ticker", "종목명", "상장일", "시장"]
-        df = df.replace("/", "", regex=True)
+        for name in ["종목명", "상장일"]:
+            df[name] = df[name].str.replace("/", "", regex=False)
+        df["시장"] = df["시장"].astype("category")
         return df.set_index("ticker")
 
     def get_ticker(self, market, date) -> list:
@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import dataframe_empty_handler, to_numeric
 from pykrx.website.krx.etx.core import (
     ETF_투자자별거래실적_개별종목_기간합계,
     ETF_투자자별거래실적_개별종목_일별추이,
@@ -131,10 +131,9 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
         "거래대금",
         "기초지수",
     ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
     df = df.set_index("티커")
-    df = df.astype(
+    df = to_numeric(
+        df,
         {
             "NAV": np.float64,
             "시가": np.uint32,
@@ -144,7 +143,7 @@ def get_etf_ohlcv_by_ticker(date: str) -> DataFrame:
             "거래량": np.uint64,
             "거래대금": np.uint64,
             "기초지수": np.float64,
-        }
+        },
     )
     return df
 
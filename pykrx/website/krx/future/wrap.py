@@ -1,8 +1,9 @@
 import numpy as np
+import pandas as pd
 from pandas import DataFrame
 
-from pykrx.website.comm import dataframe_empty_handler
-from pykrx.website.krx.future.core import 전종목시세, 파생상품검색
+from pykrx.website.comm import FreshnessPolicy, dataframe_empty_handler
+from pykrx.website.krx.future.core import 전종목기본정보, 전종목시세, 파생상품검색
 
 
 def get_future_ticker_and_name() -> DataFrame:
@@ -87,6 +88,96 @@ def get_future_ohlcv_by_ticker(date: str, prod: str) -> DataFrame:
     return df
 
 
+@dataframe_empty_handler
+def get_future_contract_info(prod: str) -> DataFrame:
+    """상품의 전 종목 상장일/최종거래일/최종결제일
+
+    Args:
+        prod (str): 조회 상품
+
+    Returns:
+    >> get_future_contract_info("KRDRVFUK2I")
+
+                               종목명     상장일  최종거래일  최종결제일  거래승수
+        종목코드
+        101S9000      코스피200 F 202209 2021-09-10 2022-09-08 2022-09-13    250000
+        101SC000      코스피200 F 202212 2019-12-13 2022-12-08 2022-12-09    250000
+        401S9SCS  코스피200 SP 2209-2212 2022-06-10 2022-09-08 2022-09-13    250000
+    """  # pylint: disable=line-too-long # noqa: E501
+    df = 전종목기본정보().fetch(prod)
+    df = df[["ISU_SRT_CD", "ISU_NM", "LIST_DD", "LSTTRD_DD", "LST_SETL_DD", "SETLMULT"]]
+    df.columns = [
+        "종목코드",
+        "종목명",
+        "상장일",
+        "최종거래일",
+        "최종결제일",
+        "거래승수",
+    ]
+    df = df.set_index("종목코드")
+    for name in ["상장일", "최종거래일", "최종결제일"]:
+        df[name] = pd.to_datetime(df[name], format="%Y/%m/%d")
+    df["거래승수"] = df["거래승수"].str.replace(",", "").astype(np.float64)
+    return df
+
+
+def _parse_option_name(names: pd.Series) -> DataFrame:
+    # 코스피200 C 202209 300.0 -> (C, 202209, 300.0)
+    return names.str.extract(r"\s([CP])\s(\d{6})\s([\d.]+)")
+
+
+def _last_trading_day(month: str) -> pd.Timestamp:
+    """만기월(YYYYMM)의 최종거래일. 둘째 목요일이 휴장일이면 직전 영업일이다."""
+    first = pd.Timestamp(f"{month}01")
+    day = first + pd.Timedelta(days=(3 - first.weekday()) % 7 + 7)
+    calendar = FreshnessPolicy().calendar
+    while not calendar(day):
+        day -= pd.Timedelta(days=1)
+    return day
+
+
+@dataframe_empty_handler
+def get_option_chain(date: str, prod: str) -> DataFrame:
+    """특정 일자의 옵션 전 종목 시세를 구분/만기/행사가 열로 정리
+
+    종목명에 들어 있는 콜/풋 구분, 만기월, 행사가를 분리하고, 전종목기본정보의
+    만기월별 최종거래일을 붙인다. 전종목기본정보는 상장 중인 종목만 제공하므로
+    만기가 지난 월물은 만기월의 둘째 목요일(휴장일이면 직전 영업일)을
+    최종거래일로 쓴다.
+
+    Args:
+        date (str): 조회 일자 (YYYYMMDD)
+        prod (str): 옵션 상품 (예: KRDRVOPK2I - 코스피200 옵션)
+
+    Returns:
+    >> get_option_chain("20220902", "KRDRVOPK2I")
+
+                 구분  만기월  행사가  최종거래일   종가  정산가  거래량
+        종목코드
+        201S9300    C  202209   300.0  2022-09-08  14.20   14.20    1032
+        301S9300    P  202209   300.0  2022-09-08   0.41    0.41   40021
+    """  # pylint: disable=line-too-long # noqa: E501
+    df = get_future_ohlcv_by_ticker(date, prod)
+    if df.empty:
+        return DataFrame()
+    parts = _parse_option_name(df["종목명"])
+    parts.columns = ["구분", "만기월", "행사가"]
+
+    info = get_future_contract_info(prod)
+    expiry = pd.concat(
+        [_parse_option_name(info["종목명"])[1], info["최종거래일"]], axis=1
+    )
+    expiry = expiry.dropna().drop_duplicates(1).set_index(1)["최종거래일"]
+
+    df = pd.concat([parts, df[["종가", "현물가", "거래량"]]], axis=1).dropna()
+    df = df.rename(columns={"현물가": "정산가"})
+    df["행사가"] = df["행사가"].astype(np.float64)
+    for month in set(df["만기월"]) - set(expiry.index):
+        expiry[month] = _last_trading_day(month)
+    df.insert(3, "최종거래일", df["만기월"].map(expiry))
+    return df
+
+
 if __name__ == "__main__":
     tickers = get_future_ticker_list()
     for t in tickers[:1]:
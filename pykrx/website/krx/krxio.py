@@ -1,8 +1,10 @@
-import time
 from abc import abstractmethod
 
 import pandas as pd
 
+from pykrx.website.comm import metrics, tracing
+from pykrx.website.comm.cache import IntervalCache, ResponseCache
+from pykrx.website.comm.context import pause
 from pykrx.website.comm.webio import Get, Post
 
 
@@ -22,41 +24,88 @@ class KrxFutureIo(Get):
 
 
 class KrxWebIo(Post):
+    # 기간 조회 응답의 일자 필드. 지정하면 IntervalCache를 사용할 수 있다.
+    date_field = None
+    # 데이터가 공개되기까지 걸리는 영업일 수 (IntervalCache가 최근 일자를
+    # 확정하지 않을 기간)
+    date_lag = 0
+
     def read(self, **params):
         params.update(bld=self.bld)
+        with tracing.span("read", bld=self.bld):
+            return self._read(params)
+
+    def _read(self, params):
         if "strtDd" in params and "endDd" in params:
-            dt_s = pd.to_datetime(params["strtDd"])
-            dt_e = pd.to_datetime(params["endDd"])
-            delta = pd.to_timedelta("730 days")
-
-            result = None
-            while dt_s + delta < dt_e:
-                dt_tmp = dt_s + delta
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_tmp.strftime("%Y%m%d")
-                dt_s += delta + pd.to_timedelta("1 days")
-                resp = super().read(**params)
+            cache = IntervalCache()
+            if self.date_field is not None and cache.enabled:
+                return self._read_cached(cache, params)
+            return self._read_range(params)
+        else:
+            cache = ResponseCache()
+            if "trdDd" in params and cache.enabled:
+                key = cache.make_key(params)
+                result = cache.get(key)
+                metrics.inc(
+                    "pykrx_cache_requests_total",
+                    cache="response",
+                    result="miss" if result is None else "hit",
+                )
                 if result is None:
-                    result = resp.json()
-                else:
-                    result["output"] += resp.json()["output"]
-
-                # 초당 2년 데이터 조회
-                time.sleep(1)
+                    result = self.read_json(**params)
+                    cache.put(key, params["trdDd"], result)
+                return result
+            return self.read_json(**params)
+
+    def _read_range(self, params):
+        dt_s = pd.to_datetime(params["strtDd"])
+        dt_e = pd.to_datetime(params["endDd"])
+        delta = pd.to_timedelta("730 days")
+
+        result = None
+        index = 0
+        while dt_s <= dt_e:
+            dt_tmp = min(dt_s + delta, dt_e)
+            params["strtDd"] = dt_s.strftime("%Y%m%d")
+            params["endDd"] = dt_tmp.strftime("%Y%m%d")
+            dt_s = dt_tmp + pd.to_timedelta("1 days")
+            with tracing.span(
+                "chunk",
+                bld=self.bld,
+                index=index,
+                strtDd=params["strtDd"],
+                endDd=params["endDd"],
+            ):
+                resp = self.read_json(**params)
+            index += 1
+            if result is None:
+                result = resp
+            else:
+                # output/OutBlock_1 등 행 목록을 담은 키를 이어 붙인다.
+                for key, val in resp.items():
+                    if isinstance(val, list) and isinstance(result.get(key), list):
+                        result[key] += val
 
             if dt_s <= dt_e:
-                params["strtDd"] = dt_s.strftime("%Y%m%d")
-                params["endDd"] = dt_e.strftime("%Y%m%d")
-                resp = super().read(**params)
-
-                if result is not None:
-                    result["output"] += resp.json()["output"]
-                else:
-                    result = resp.json()
-            return result
-        else:
-            resp = super().read(**params)
-            return resp.json()
+                # 초당 2년 데이터 조회
+                pause(1, "chunk")
+        return result
+
+    def _read_cached(self, cache, params):
+        key = (self.bld,) + cache.make_key(params)
+        start, end = params["strtDd"], params["endDd"]
+        gaps = cache.missing(key, start, end)
+        metrics.inc(
+            "pykrx_cache_requests_total",
+            cache="interval",
+            result="miss" if gaps else "hit",
+        )
+        for s, e in gaps:
+            gap = dict(params, strtDd=s.strftime("%Y%m%d"), endDd=e.strftime("%Y%m%d"))
+            result = self._read_range(gap)
+            if not cache.put(key, s, e, result, self.date_field, self.date_lag):
+                return self._read_range(params)
+        return cache.get(key, start, end)
 
     @property
     def url(self):
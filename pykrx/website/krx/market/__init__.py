@@ -1,2 +1,3 @@
+from .flow import *
 from .ticker import *
 from .wrap import *
@@ -76,6 +76,8 @@ class 상폐종목검색(KrxWebIo):
 
 
 class 개별종목시세(KrxWebIo):
+    date_field = "TRD_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT01701"
@@ -196,6 +198,8 @@ class PER_PBR_배당수익률_전종목(KrxWebIo):
 
 
 class PER_PBR_배당수익률_개별(KrxWebIo):
+    date_field = "TRD_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03502"
@@ -306,6 +310,8 @@ class 외국인보유량_전종목(KrxWebIo):
 
 
 class 외국인보유량_개별추이(KrxWebIo):
+    date_field = "TRD_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT03702"
@@ -770,6 +776,8 @@ class 주가지수검색(KrxWebIo):
 
 
 class 개별지수시세(KrxWebIo):
+    date_field = "TRD_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/standard/MDCSTAT00301"
@@ -1136,6 +1144,8 @@ class 개별종목_공매도_거래_전종목(KrxWebIo):
 
 
 class 개별종목_공매도_거래_개별추이(KrxWebIo):
+    date_field = "TRD_DD"
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30102"
@@ -1354,6 +1364,10 @@ class 전종목_공매도_잔고(KrxWebIo):
 
 
 class 개별종목_공매도_잔고(KrxWebIo):
+    # 공매도 잔고는 보고 의무 발생일(T)로부터 2영업일 뒤에 공개된다.
+    date_field = "RPT_DUTY_OCCR_DD"
+    date_lag = 2
+
     @property
     def bld(self):
         return "dbms/MDC/STAT/srt/MDCSTAT30502"
@@ -0,0 +1,266 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from pykrx.website.comm import (
+    FreshnessPolicy,
+    concurrent_map,
+    dataframe_empty_handler,
+    merge_intervals,
+    missing_intervals,
+    singleton,
+    to_timestamp,
+)
+from pykrx.website.krx.market.wrap import (
+    get_market_trading_value_and_volume_on_market_by_date,
+    get_market_trading_value_and_volume_on_ticker_by_date,
+)
+
+_MEASURES = ["거래량", "거래대금"]
+_SIDES = ["매도", "매수", "순매수"]
+
+# 일반 조회의 투자자 구분과 이를 구성하는 상세 조회의 투자자 구분
+_GENERAL_INVESTORS = {
+    "기관합계": ["금융투자", "보험", "투신", "사모", "은행", "기타금융", "연기금"],
+    "기타법인": ["기타법인"],
+    "개인": ["개인"],
+    "외국인합계": ["외국인", "기타외국인"],
+    "전체": ["전체"],
+}
+_DETAIL_INVESTORS = [x for v in _GENERAL_INVESTORS.values() for x in v]
+
+_COLUMNS = ["날짜", "투자자구분", "거래구분", "매매구분", "값"]
+_KEYS = _COLUMNS[:-1]
+_MARKETS = ("KOSPI", "KOSDAQ", "KONEX", "ALL")
+
+
+def _to_general(df: DataFrame) -> DataFrame:
+    """상세 조회의 일자별 투자자 열을 일반 조회의 투자자 열로 합친다."""
+    return DataFrame(
+        {k: df[v].sum(axis=1) for k, v in _GENERAL_INVESTORS.items()},
+        index=df.index,
+    )
+
+
+def _melt(df: DataFrame, measure: str, side: str) -> DataFrame:
+    """일자 x 투자자 DataFrame을 (날짜, 투자자구분, 거래구분, 매매구분, 값)으로"""
+    long = df.rename_axis(index="날짜", columns="투자자구분").stack().rename("값")
+    long = long.reset_index()
+    return long.assign(거래구분=measure, 매매구분=side)[_COLUMNS]
+
+
+class InvestorFlowTable:
+    """투자자별 거래실적 일별추이를 long-form 표로 보관한다.
+
+    (종목 또는 시장, ETF/ETN/ELW 포함 여부)마다 (날짜, 투자자구분, 거래구분,
+    매매구분, 값) 표 하나와 (거래구분, 상세조회 여부)별로 조회한 날짜 구간을
+    보관한다. 상세 조회를 보관할 때 일반 조회의 투자자구분도 함께 계산해서
+    넣으므로, 상세 조회를 한 구간은 일반 조회도 한 구간이 된다. policy로
+    확정되지 않은 일자는 조회한 구간으로 취급하지 않는다.
+
+    Args:
+        maxsize (int           , optional): 보관할 최대 키 수
+        policy  (FreshnessPolicy, optional): 일자의 확정 여부를 정하는 정책
+    """
+
+    def __init__(self, maxsize: int = 128, policy: FreshnessPolicy = None):
+        self.maxsize = maxsize
+        self.policy = policy if policy is not None else FreshnessPolicy()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def missing(self, key: tuple, measure: str, detail: bool, start, end) -> list:
+        """[start, end] 중 보관되지 않은 (Timestamp, Timestamp) 구간 목록"""
+        with self._lock:
+            entry = self._entries.get(key)
+            covered = [] if entry is None else entry["covered"].get((measure, detail))
+        return missing_intervals(covered or [], start, end)
+
+    def put(self, key: tuple, measure: str, detail: bool, start, end, frames: dict):
+        """[start, end] 구간의 조회 결과를 보관한다.
+
+        Args:
+            key     (tuple): 캐시 키
+            measure (str  ): 거래량/거래대금
+            detail  (bool ): 상세조회 여부
+            start          : 조회 시작 일자
+            end            : 조회 종료 일자
+            frames  (dict ): {매매구분: 일자 x 투자자 DataFrame}
+        """
+        start, end = to_timestamp(start), to_timestamp(end)
+        levels = [detail]
+        if detail:
+            frames = {
+                k: pd.concat(
+                    [v, _to_general(v).drop(columns=["기타법인", "개인", "전체"])],
+                    axis=1,
+                )
+                for k, v in frames.items()
+            }
+            levels.append(False)
+        rows = pd.concat([_melt(v, measure, k) for k, v in frames.items()])
+        settled = min(end, self.policy.settled_through())
+
+        with self._lock:
+            entry = self._entries.setdefault(key, {"covered": {}, "table": None})
+            table = entry["table"]
+            if table is not None:
+                stale = (
+                    (table["거래구분"] == measure)
+                    & table["투자자구분"].isin(rows["투자자구분"].unique())
+                    & table["날짜"].between(start, end)
+                )
+                rows = pd.concat([table[~stale], rows], ignore_index=True)
+            entry["table"] = rows
+            if start <= settled:
+                for level in levels:
+                    covered = entry["covered"].get((measure, level), [])
+                    entry["covered"][(measure, level)] = merge_intervals(
+                        covered + [(start, settled)]
+                    )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, key: tuple, measures: list, investors: list, start, end) -> DataFrame:
+        """보관된 [start, end] 구간의 long-form 행"""
+        start, end = to_timestamp(start), to_timestamp(end)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["table"] is None:
+                return DataFrame(columns=_COLUMNS)
+            self._entries.move_to_end(key)
+            table = entry["table"]
+        mask = (
+            table["날짜"].between(start, end)
+            & table["거래구분"].isin(measures)
+            & table["투자자구분"].isin(investors)
+        )
+        return table[mask]
+
+
+@singleton
+class InvestorFlowCache(InvestorFlowTable):
+    """get_market_investor_flow_by_date가 사용하는 InvestorFlowTable
+
+    IntervalCache와 같이 기본적으로 꺼져 있어 호출마다 새 표를 사용한다.
+    enable()로 켜면 호출 사이에 결과를 보관하고, policy가 확정되지 않았다고
+    판단한 일자는 다시 조회한다.
+
+        >> InvestorFlowCache().enable()
+        >> stock.get_market_investor_flow_by_date("20240102", "20240110", "KOSPI")
+    """
+
+    def __init__(self, maxsize: int = 128):
+        super().__init__(maxsize)
+        self.enabled = False
+
+    def enable(self, maxsize: int = None, policy: FreshnessPolicy = None):
+        if maxsize is not None:
+            self.maxsize = maxsize
+        if policy is not None:
+            self.policy = policy
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+        self.clear()
+
+
+@dataframe_empty_handler
+def get_market_investor_flow_by_date(
+    fromdate: str,
+    todate: str,
+    ticker: str,
+    etf: bool = False,
+    etn: bool = False,
+    elw: bool = False,
+    detail_view: bool = False,
+    measures: list = None,
+) -> DataFrame:
+    """[12008] 투자자별 거래실적 일별추이의 매도/매수/순매수 거래량/거래대금
+
+    KRX는 거래량/거래대금과 매도/매수/순매수를 각각 다른 요청으로 조회해야
+    한다. 순매수는 매수 - 매도와 같으므로 거래구분마다 매도와 매수만 동시에
+    요청한다. InvestorFlowCache를 켜 두면 결과를 보관하고, 일반 조회는 같은
+    구간의 상세 조회가 보관되어 있으면 상세 조회의 투자자구분을 합쳐서 만든다.
+
+    Args:
+        fromdate    (str ): 조회 시작 일자 (YYYYMMDD)
+        todate      (str ): 조회 종료 일자 (YYYYMMDD)
+        ticker      (str ): 조회 종목 티커 또는 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+        etf         (bool): 시장 포함 여부 - 시장을 조회할 때만 유효
+        etn         (bool): 시장 포함 여부 - 시장을 조회할 때만 유효
+        elw         (bool): 시장 포함 여부 - 시장을 조회할 때만 유효
+        detail_view (bool): 상세조회 여부
+        measures    (list): 조회할 거래구분. 입력하지 않으면 거래량/거래대금
+
+    Returns:
+        DataFrame:
+
+            >> get_market_investor_flow_by_date("20210115", "20210122", "005930")
+
+                                         거래량                         거래대금
+                                           매도      매수    순매수         매도  ...
+            날짜       투자자구분
+            2021-01-15 기관합계         9744915   4738800  -5006115  8.58e+11  ...
+                       기타법인          337815    626647    288832  2.97e+10  ...
+                       개인            23420340  30906125   7485785  2.06e+12  ...
+                       외국인합계       9925099   7156597  -2768502  8.73e+11  ...
+                       전체            43428169  43428169         0  3.82e+12  ...
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    measures = list(measures or _MEASURES)
+    investors = _DETAIL_INVESTORS if detail_view else list(_GENERAL_INVESTORS)
+    if ticker in _MARKETS:
+        key = (ticker, bool(etf), bool(etn), bool(elw))
+    else:
+        key = (ticker,)
+
+    cache = InvestorFlowCache()
+    if not cache.enabled:
+        cache = InvestorFlowTable(policy=cache.policy)
+
+    gaps = [
+        (measure, s, e)
+        for measure in measures
+        for s, e in cache.missing(key, measure, detail_view, fromdate, todate)
+    ]
+
+    def fetch(job):
+        measure, s, e, side = job
+        s, e = s.strftime("%Y%m%d"), e.strftime("%Y%m%d")
+        if ticker in _MARKETS:
+            return get_market_trading_value_and_volume_on_market_by_date(
+                s, e, ticker, etf, etn, elw, measure, side, detail_view
+            )
+        return get_market_trading_value_and_volume_on_ticker_by_date(
+            s, e, ticker, measure, side, detail_view
+        )
+
+    frames = concurrent_map(fetch, [x + (y,) for x in gaps for y in ("매도", "매수")])
+    for i, (measure, s, e) in enumerate(gaps):
+        sell, buy = frames[2 * i], frames[2 * i + 1]
+        if sell.empty or buy.empty:
+            # 휴장일만 있는 구간이거나 응답이 올바르지 않으면 보관하지 않는다.
+            continue
+        cache.put(key, measure, detail_view, s, e, {"매도": sell, "매수": buy})
+
+    rows = cache.get(key, measures, investors, fromdate, todate)
+    if rows.empty:
+        return DataFrame()
+    df = rows.set_index(_KEYS)["값"].unstack(["거래구분", "매매구분"])
+    for measure in measures:
+        df[(measure, "순매수")] = df[(measure, "매수")] - df[(measure, "매도")]
+    df = df.reindex(columns=pd.MultiIndex.from_product([measures, _SIDES]))
+    # 날짜별로 KRX 화면과 같은 투자자구분 순서로 정렬한다.
+    order = {x: i for i, x in enumerate(investors)}
+    df = df.sort_index(key=lambda x: x.map(order) if x.name == "투자자구분" else x)
+    return df.astype(np.int64)
@@ -17,9 +17,9 @@ class StockTicker:
         market = market_dict.get(market, "ALL")
         df = what().fetch(market)
         df = df[["short_code", "codeName", "full_code", "marketName"]]
-        df = df.replace("유가증권", "코스피")
         df.columns = ["티커", "종목", "ISIN", "시장"]
-        df["시장"] = df["시장"].apply(lambda x: market_dict[x])
+        market = df["시장"].replace("유가증권", "코스피")
+        df = df.assign(시장=market.map(market_dict).astype("category"))
         df = df.set_index("티커")
         return df
 
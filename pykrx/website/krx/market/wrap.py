@@ -2,7 +2,7 @@ import numpy as np
 import pandas as pd
 from pandas import DataFrame, Series
 
-from pykrx.website.comm import dataframe_empty_handler
+from pykrx.website.comm import concurrent_map, dataframe_empty_handler, to_numeric
 from pykrx.website.krx.market.core import (
     PER_PBR_배당수익률_개별,
     PER_PBR_배당수익률_개별지수,
@@ -94,10 +94,8 @@ def get_market_ohlcv_by_date(
     ]
     df = df.set_index("날짜")
     df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
-    df = df.astype(
+    df = to_numeric(
+        df,
         {
             "시가": np.int32,
             "고가": np.int32,
@@ -106,7 +104,7 @@ def get_market_ohlcv_by_date(
             "거래량": np.int32,
             "거래대금": np.int64,
             "등락률": np.float32,
-        }
+        },
     )
     return df.sort_index()
 
@@ -133,6 +131,10 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
     df = 전종목시세().fetch(date, market2mktid[market])
+    return _parse_market_ohlcv_by_ticker(df)
+
+
+def _parse_market_ohlcv_by_ticker(df: DataFrame) -> DataFrame:
     df = df[
         [
             "ISU_SRT_CD",
@@ -157,11 +159,9 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
         "등락률",
         "시가총액",
     ]
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
     df = df.set_index("티커")
-    df = df.astype(
+    df = to_numeric(
+        df,
         {
             "시가": np.int32,
             "고가": np.int32,
@@ -171,7 +171,7 @@ def get_market_ohlcv_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
             "거래대금": np.int64,
             "등락률": np.float32,
             "시가총액": np.int64,
-        }
+        },
     )
     return df
 
@@ -238,16 +238,18 @@ def get_market_cap_by_ticker(
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
 
     df = 전종목시세().fetch(date, market2mktid[market])
+    df = _parse_market_cap_by_ticker(df)
+    return df.sort_values("시가총액", ascending=ascending)
+
+
+def _parse_market_cap_by_ticker(df: DataFrame) -> DataFrame:
     df = df[
         ["ISU_SRT_CD", "TDD_CLSPRC", "MKTCAP", "ACC_TRDVOL", "ACC_TRDVAL", "LIST_SHRS"]
     ]
     df.columns = ["티커", "종가", "시가총액", "거래량", "거래대금", "상장주식수"]
 
     df = df.set_index("티커")
-    df = df.replace(r"\W", "", regex=True)
-    df = df.replace("", 0)
-    df = df.astype(np.int64)
-    return df.sort_values("시가총액", ascending=ascending)
+    return to_numeric(df, dict.fromkeys(df.columns, np.int64), pattern=r"\W")
 
 
 @dataframe_empty_handler
@@ -271,7 +273,10 @@ def get_market_fundamental_by_ticker(date: str, market: str = "KOSPI") -> DataFr
 
     market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
     df = PER_PBR_배당수익률_전종목().fetch(date, market2mktid[market])
+    return _parse_market_fundamental_by_ticker(df)
+
 
+def _parse_market_fundamental_by_ticker(df: DataFrame) -> DataFrame:
     df = df[["ISU_SRT_CD", "BPS", "PER", "PBR", "EPS", "DVD_YLD", "DPS"]]
     df.columns = ["티커", "BPS", "PER", "PBR", "EPS", "DIV", "DPS"]
     df.set_index("티커", inplace=True)
@@ -511,7 +516,10 @@ def get_exhaustion_rates_of_foreign_investment_by_ticker(
 
     balance_limit = 1 if balance_limit else 0
     df = 외국인보유량_전종목().fetch(date, market2mktid[market], balance_limit)
+    return _parse_exhaustion_rates_of_foreign_investment_by_ticker(df)
 
+
+def _parse_exhaustion_rates_of_foreign_investment_by_ticker(df: DataFrame) -> DataFrame:
     df = df[
         [
             "ISU_SRT_CD",
@@ -911,7 +919,10 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
         "KOSDAQ": "KSQ",
     }
     df = 업종분류현황().fetch(date, market2mktid[market])
+    return _parse_market_sector_classifications(df)
+
 
+def _parse_market_sector_classifications(df: DataFrame) -> DataFrame:
     df = df[
         [
             "ISU_SRT_CD",
@@ -933,11 +944,76 @@ def get_market_sector_classifications(date: str, market: str) -> DataFrame:
             "대비": np.float64,
             "등락률": np.float64,
             "시가총액": np.int64,
+            "업종명": "category",
         }
     )
     return df.set_index("종목코드")
 
 
+@dataframe_empty_handler
+def get_market_snapshot_by_ticker(date: str, market: str = "KOSPI") -> DataFrame:
+    """특정 일자의 전종목 시세/시가총액/PER·PBR/외국인 보유량/업종을 한 번에 조회
+
+    전종목 시세, PER/PBR/배당수익률, 외국인보유량, 업종분류현황을 동시에
+    요청한다. OHLCV와 시가총액은 같은 전종목 시세 응답을 공유하며, 나머지
+    결과는 시세의 티커 인덱스에 한 번씩만 맞춘 뒤 열 방향으로 결합한다.
+
+    Args:
+        date   (str): 조회 일자 (YYYYMMDD)
+        market (str): 조회 시장 (KOSPI/KOSDAQ/KONEX/ALL)
+
+    Returns:
+        DataFrame:
+
+            > get_market_snapshot_by_ticker("20220902", "KOSPI")
+
+                      종목명   시가   고가   저가   종가  거래량  ...  한도소진률    업종명
+            티커
+            095570  AJ네트웍스  7220  7350  7170  7280   56802  ...    3.900391  서비스업
+            006840    AK홀딩스 15750 16000 15700 15900   12483  ...    3.269531  기타금융
+            027410         BGF  3990  4010  3960  3990  164383  ...   11.148438  기타금융
+
+        NOTE: 업종분류현황은 KOSPI/KOSDAQ만 제공되므로 KONEX의 업종명은 비어 있다.
+    """  # pylint: disable=line-too-long # noqa: E501
+
+    market2mktid = {"ALL": "ALL", "KOSPI": "STK", "KOSDAQ": "KSQ", "KONEX": "KNX"}
+    mktid = market2mktid[market]
+    sector_mktids = {"ALL": ["STK", "KSQ"], "KOSPI": ["STK"], "KOSDAQ": ["KSQ"]}
+
+    jobs = [
+        (전종목시세(), (date, mktid)),
+        (PER_PBR_배당수익률_전종목(), (date, mktid)),
+        (외국인보유량_전종목(), (date, mktid, 0)),
+    ]
+    jobs += [(업종분류현황(), (date, x)) for x in sector_mktids.get(market, [])]
+    payloads = concurrent_map(lambda x: x[0].fetch(*x[1]), jobs)
+    price, fundamental, foreign = payloads[:3]
+
+    names = price[["ISU_SRT_CD", "ISU_ABBRV"]].set_index("ISU_SRT_CD")["ISU_ABBRV"]
+    ohlcv = _parse_market_ohlcv_by_ticker(price)
+    cap = _parse_market_cap_by_ticker(price)
+    index = ohlcv.index
+
+    frames = [
+        names.rename("종목명").reindex(index),
+        ohlcv,
+        cap[["상장주식수"]].reindex(index),
+        _parse_market_fundamental_by_ticker(fundamental).reindex(index),
+        _parse_exhaustion_rates_of_foreign_investment_by_ticker(foreign)
+        .drop(columns="상장주식수")
+        .reindex(index),
+    ]
+    if len(payloads) > 3:
+        sector = pd.concat(
+            [_parse_market_sector_classifications(x) for x in payloads[3:]]
+        )
+        frames.append(sector["업종명"].reindex(index))
+
+    df = pd.concat(frames, axis=1, copy=False)
+    df.index.name = "티커"
+    return df
+
+
 # -----------------------------------------------------------------------------
 # index
 @dataframe_empty_handler
@@ -984,11 +1060,9 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
         "상장시가총액",
     ]
 
-    df = df.replace(r"[^-\w\.]", "", regex=True)
-    df = df.replace(r"\-$", "0", regex=True)
-    df = df.replace("", "0")
     df = df.set_index("날짜")
-    df = df.astype(
+    df = to_numeric(
+        df,
         {
             "시가": np.float64,
             "고가": np.float64,
@@ -997,9 +1071,9 @@ def get_index_ohlcv_by_date(fromdate: str, todate: str, ticker: str) -> DataFram
             "거래량": np.int64,
             "거래대금": np.int64,
             "상장시가총액": np.int64,
-        }
+        },
     )
-    df.index = pd.to_datetime(df.index, format="%Y%m%d")
+    df.index = pd.to_datetime(df.index, format="%Y/%m/%d")
     return df.sort_index()
 
 
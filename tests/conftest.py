@@ -131,6 +131,29 @@ _global_vcr.register_matcher("uri_ignore_dates", uri_without_dates)
 _global_vcr.register_matcher("body_ignore_dates", form_body_matcher)
 
 
+@pytest.fixture(autouse=True)
+def reset_retry_state(monkeypatch):
+    """한 테스트의 네트워크 실패가 다른 테스트의 서킷 브레이커나 요청 한도에
+    영향을 주지 않도록 하고, 재시도 사이에 기다리지 않는다."""
+    from pykrx.website.comm import retry, throttle
+
+    monkeypatch.setattr(retry, "_breakers", {})
+    monkeypatch.setattr(retry, "_policy", retry.RetryPolicy(base_delay=0))
+    monkeypatch.setattr(throttle, "_limiters", {})
+
+
+@pytest.fixture(autouse=True)
+def weekday_calendar(monkeypatch):
+    """FreshnessPolicy의 기본 KRX 영업일 달력이 영업일을 조회하는 요청을
+    테스트의 요청 흐름에 끼워 넣지 않도록 평일 달력으로 바꾼다."""
+    import pandas as pd
+
+    from pykrx.website.comm import cache
+
+    monkeypatch.setattr(cache._calendar, "loader", pd.bdate_range)
+    monkeypatch.setattr(cache._calendar, "_years", {})
+
+
 @pytest.fixture(scope="module")
 def vcr_cassette_dir():
     """pytest-vcr: cassette directory location"""
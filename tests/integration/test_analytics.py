@@ -0,0 +1,157 @@
+import pytest
+import numpy as np
+import pandas as pd
+from pykrx import stock
+from pykrx.analytics import get_yield_curve_spreads, interpolate_yield_curve
+from pykrx.analytics import bollinger_bands, high_low_52w, rolling_mean, rsi
+from pykrx.analytics import black_price, get_option_greeks, implied_volatility
+from pykrx.testing import FakeServer
+# pylint: disable-all
+# flake8: noqa
+
+
+class TestOptionAnalytics:
+    def test_implied_volatility_round_trip(self):
+        rng = np.random.default_rng(0)
+        n = 10_000
+        strike = rng.uniform(250, 350, n)
+        t = rng.uniform(0.02, 1.0, n)
+        vol = rng.uniform(0.05, 0.8, n)
+        call = rng.random(n) < 0.5
+        discount = np.exp(-0.03 * t)
+        price = black_price(300.0, strike, t, vol, discount, call)
+
+        iv = implied_volatility(price, 300.0, strike, t, discount, call)
+        # 시간가치가 거의 없는 옵션은 변동성을 구분할 수 없으므로 제외한다.
+        intrinsic = discount * np.maximum(np.where(call, 1, -1) * (300 - strike), 0)
+        solvable = price - intrinsic > 1e-4
+        assert solvable.mean() > 0.95
+        np.testing.assert_allclose(iv[solvable], vol[solvable], atol=1e-6)
+
+        # 무차익 범위 밖의 가격은 NaN이다.
+        bad = implied_volatility([0.0, 400.0], 300.0, 300.0, 0.5, 1.0, True)
+        assert np.isnan(bad).all()
+
+    def test_option_chain_greeks(self):
+        with FakeServer(size=5):
+            chain = stock.get_option_chain("20240105")
+
+        assert set(chain["구분"]) == {"C", "P"}
+        assert chain["행사가"].dtype == np.float64
+        assert (chain["최종거래일"] >= pd.Timestamp("2024-01-05")).all()
+
+        df = get_option_greeks(chain, "20240105")
+        atm = df.loc[(df["행사가"] - df["선도가"]).abs().groupby(df["만기월"]).idxmin()]
+        # 합성 시세의 ATM 변동성은 약 20%다.
+        assert atm["내재변동성"].to_numpy() == pytest.approx(0.2, abs=0.01)
+        calls = df[df["구분"] == "C"]
+        assert calls["델타"].between(0, 1).all()
+        assert (df["감마"].dropna() > 0).all()
+
+    def test_expired_month_has_last_trading_day(self, monkeypatch):
+        from pykrx.website.comm import cache
+        from pykrx.website.krx.future import wrap
+
+        # 전종목기본정보는 상장 중인 종목만 제공한다.
+        fetch = wrap.전종목기본정보.fetch
+
+        def listed(self, prodId):
+            df = fetch(self, prodId)
+            return df[df["LSTTRD_DD"] > "2024/01/31"]
+
+        def holidays(fromdate, todate):
+            days = pd.bdate_range(fromdate, todate)
+            return days[days != pd.Timestamp("2024-01-11")]
+
+        monkeypatch.setattr(wrap.전종목기본정보, "fetch", listed)
+        monkeypatch.setattr(cache._calendar, "loader", holidays)
+        with FakeServer(size=5):
+            chain = stock.get_option_chain("20240105")
+
+        expiry = chain.groupby("만기월")["최종거래일"].first()
+        # 둘째 목요일(1월 11일)이 휴장일이면 직전 영업일이다.
+        assert expiry["202401"] == pd.Timestamp("2024-01-10")
+        assert expiry["202402"] == pd.Timestamp("2024-02-08")
+        df = get_option_greeks(chain, "20240105")
+        assert df.loc[df["만기월"] == "202401", "내재변동성"].notna().any()
+
+
+class TestYieldCurve:
+    @pytest.fixture
+    def curve(self):
+        index = pd.bdate_range("20240102", periods=3, name="일자")
+        return pd.DataFrame(
+            {
+                "CD": [3.6, 3.6, 3.6],
+                "국고채1년": [3.5, 3.4, 3.3],
+                "국고채3년": [3.2, 3.3, 3.4],
+                "국고채5년": [3.3, 3.3, 3.5],
+                "국고채10년": [3.4, 3.2, 3.6],
+                "회사채AA": [3.9, 3.9, 4.0],
+            },
+            index=index,
+        )
+
+    def test_interpolation(self, curve):
+        tenors = [0.1, 1.0, 2.0, 4.0, 7.5, 10.0, 30.0]
+        linear = interpolate_yield_curve(curve, tenors)
+        assert linear[1.0].to_list() == pytest.approx([3.5, 3.4, 3.3])
+        assert linear[2.0].to_list() == pytest.approx([3.35, 3.35, 3.35])
+        # 양 끝 밖은 가장 짧거나 긴 만기의 수익률이다.
+        assert linear[0.1].equals(curve["CD"].rename(0.1))
+        assert linear[30.0].equals(curve["국고채10년"].rename(30.0))
+
+        monotone = interpolate_yield_curve(curve, tenors, "monotone")
+        np.testing.assert_allclose(monotone[10.0], curve["국고채10년"])
+        # 단조 보존: 이웃한 두 만기 사이의 값은 두 수익률 사이에 있다.
+        lo = np.minimum(curve["국고채1년"], curve["국고채3년"])
+        hi = np.maximum(curve["국고채1년"], curve["국고채3년"])
+        assert ((monotone[2.0] >= lo - 1e-12) & (monotone[2.0] <= hi + 1e-12)).all()
+
+    def test_spreads_and_slope(self, curve):
+        df = get_yield_curve_spreads(curve)
+        assert df.columns.to_list() == [
+            "10년-3년",
+            "3년-CD",
+            "AA-국고채3년",
+            "곡률",
+            "기울기",
+        ]
+        assert df["10년-3년"].to_list() == pytest.approx([20.0, -10.0, 20.0])
+        assert df["곡률"].to_list() == pytest.approx([0.0, 10.0, 0.0])
+        assert df["기울기"].iloc[0] == pytest.approx(
+            np.polyfit([0.25, 1, 3, 5, 10], [3.6, 3.5, 3.2, 3.3, 3.4], 1)[0] * 100
+        )
+
+
+class TestIndicators:
+    @pytest.fixture
+    def close(self):
+        rng = np.random.default_rng(0)
+        values = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.02, (400, 6)), axis=0))
+        df = pd.DataFrame(values, index=pd.bdate_range("20230102", periods=400))
+        # 상장 전과 거래정지 구간
+        df.iloc[:30, 1] = np.nan
+        df.iloc[200:203, 2] = np.nan
+        return df
+
+    def test_same_as_pandas_rolling(self, close):
+        pd.testing.assert_frame_equal(rolling_mean(close, 20), close.rolling(20).mean())
+
+        bands = bollinger_bands(close, 20)
+        upper = close.rolling(20).mean() + 2 * close.rolling(20).std()
+        pd.testing.assert_frame_equal(bands["상단"], upper, rtol=1e-8)
+
+        df = high_low_52w(close)
+        pd.testing.assert_frame_equal(df["최고가"], close.rolling(252).max())
+        pd.testing.assert_frame_equal(df["최저가"], close.rolling(252).min())
+
+    def test_rsi(self, close):
+        delta = close.diff()
+        gain = delta.clip(lower=0).rolling(14).mean()
+        loss = (-delta).clip(lower=0).rolling(14).mean()
+        pd.testing.assert_frame_equal(rsi(close), 100 - 100 / (1 + gain / loss))
+
+        wilder = rsi(close, method="wilder")
+        assert wilder.iloc[:14].isna().all().all()
+        assert wilder.stack().between(0, 100).all()
@@ -1,5 +1,8 @@
 import pytest
+import datetime
 from pykrx import bond
+from pykrx.testing import FakeServer
+from pykrx.website import krx
 import pandas as pd
 import numpy as np
 # pylint: disable-all
@@ -33,3 +36,24 @@ class TestBondOtcTreasuryYiledByDate:
         df = bond.get_otc_treasury_yields("20220104", "20220203", "국고채1년")
         assert len(df) != 0
         assert isinstance(df, pd.DataFrame)
+
+
+class TestBondOtcTreasuryYieldCurve:
+    def test_all_tenors_aligned_by_date(self):
+        with FakeServer() as server:
+            df = bond.get_otc_treasury_yield_curve("20240102", "20240131")
+            assert server.stats()["requests"] == 11
+            one = bond.get_otc_treasury_yields("20240102", "20240131", "국고채3년")
+
+        assert df.shape == (22, 11)
+        assert df.columns[0] == "국고채1년"
+        assert df.index.is_monotonic_increasing
+        np.testing.assert_allclose(df["국고채3년"], one["수익률"], atol=1e-6)
+
+    def test_accepts_datetime_and_dashed_dates(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            krx, "get_otc_treasury_yield_curve", lambda *args: calls.append(args)
+        )
+        bond.get_otc_treasury_yield_curve("2024-01-02", datetime.datetime(2024, 1, 31))
+        assert calls == [("20240102", "20240131", None)]
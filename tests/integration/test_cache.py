@@ -0,0 +1,210 @@
+import pytest
+import json
+import requests
+import datetime
+import math
+import threading
+import time
+from concurrent.futures import CancelledError
+import pandas as pd
+from pykrx.website.comm import BusinessCalendar, FreshnessPolicy
+from pykrx.website.comm import IntervalCache, ResponseCache
+from pykrx.website.comm import SingleFlight, concurrent_map
+from pykrx.website.comm.cache import KST
+from pykrx.website.comm.webio import Post
+from pykrx.website.krx.market.core import 개별종목_공매도_잔고, 개별종목시세, 전종목시세
+# pylint: disable-all
+# flake8: noqa
+
+
+def FakeResponse(payload, status=200, content_type="application/json"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers["Content-Type"] = content_type
+    resp._content = (
+        payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    )
+    resp.url = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+    return resp
+
+
+class TestIntervalCache:
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def read(self, **params):
+            calls.append((params["strtDd"], params["endDd"]))
+            days = pd.bdate_range(params["strtDd"], params["endDd"])[::-1]
+            rows = [
+                {"TRD_DD": x.strftime("%Y/%m/%d"), "TDD_CLSPRC": x.strftime("%d")}
+                for x in days
+            ]
+            return FakeResponse({"output": rows})
+
+        monkeypatch.setattr(Post, "read", read)
+        IntervalCache().enable()
+        yield calls
+        IntervalCache().disable()
+
+    def test_fetches_only_missing_interval(self, calls):
+        first = 개별종목시세().fetch("20240101", "20240112", "KR7005930003", 2)
+        second = 개별종목시세().fetch("20240108", "20240119", "KR7005930003", 2)
+        assert calls == [("20240101", "20240112"), ("20240113", "20240119")]
+        assert len(first) == 10
+        assert second["TRD_DD"].tolist() == [
+            x.strftime("%Y/%m/%d") for x in pd.bdate_range("20240108", "20240119")[::-1]
+        ]
+
+    def test_lagged_days_are_refetched(self, monkeypatch):
+        calls = []
+
+        def read(self, **params):
+            calls.append((params["strtDd"], params["endDd"]))
+            days = pd.bdate_range(params["strtDd"], params["endDd"])[::-1]
+            rows = [{"RPT_DUTY_OCCR_DD": x.strftime("%Y/%m/%d")} for x in days]
+            return FakeResponse({"OutBlock_1": rows})
+
+        monkeypatch.setattr(Post, "read", read)
+        clock = Clock(datetime.datetime(2024, 1, 10, 19, 0, tzinfo=KST))
+        IntervalCache().enable(policy=FreshnessPolicy(clock=clock))
+        try:
+            for _ in range(2):
+                개별종목_공매도_잔고().fetch("20240102", "20240110", "KR7005930003")
+            # 공개가 늦는 최근 2영업일만 negative_ttl 뒤에 다시 조회한다.
+            clock.value += datetime.timedelta(hours=2)
+            개별종목_공매도_잔고().fetch("20240102", "20240110", "KR7005930003")
+            assert calls == [("20240102", "20240110"), ("20240109", "20240110")]
+        finally:
+            IntervalCache().disable()
+            IntervalCache().policy = FreshnessPolicy()
+
+    def test_key_includes_other_params(self, calls):
+        개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        개별종목시세().fetch("20240101", "20240105", "KR7000660001", 2)
+        개별종목시세().fetch("20240102", "20240104", "KR7000660001", 2)
+        assert len(calls) == 2
+
+
+class Clock:
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self):
+        return self.value
+
+
+class TestFreshnessPolicy:
+    def policy(self, *args):
+        return FreshnessPolicy(clock=Clock(datetime.datetime(*args, tzinfo=KST)))
+
+    def test_settled_dates_never_expire(self):
+        policy = self.policy(2024, 1, 10, 10, 0)  # 수요일 장중
+        assert policy.settled_through() == pd.Timestamp("20240109")
+        assert math.isinf(policy.ttl("20240102", "20240109"))
+        assert policy.ttl("20240102", "20240110") == policy.intraday_ttl
+
+    def test_today_is_settled_after_post_close(self):
+        assert self.policy(2024, 1, 10, 16, 0).ttl("20240110", "20240110") == 600
+        assert math.isinf(self.policy(2024, 1, 10, 18, 0).ttl("20240110", "20240110"))
+
+    def test_negative_caching(self):
+        policy = self.policy(2024, 1, 10, 10, 0)
+        assert math.isinf(policy.ttl("20240106", "20240107", empty=True))
+        assert policy.ttl("20240108", "20240108", empty=True) == policy.negative_ttl
+
+    def test_krx_holidays_are_not_sessions(self):
+        loads = []
+
+        def loader(fromdate, todate):
+            loads.append((fromdate, todate))
+            days = pd.bdate_range(fromdate, todate)
+            return days[~days.isin(pd.to_datetime(["20240101", "20240209"]))]
+
+        calendar = BusinessCalendar(loader)
+        clock = Clock(datetime.datetime(2024, 2, 9, 10, 0, tzinfo=KST))
+        policy = FreshnessPolicy(calendar=calendar, clock=clock)
+        # 설 연휴의 빈 응답은 만료되지 않고, 휴장일 장중에는 당일도 확정이다.
+        assert math.isinf(policy.ttl("20240101", "20240101", empty=True))
+        assert policy.settled_through() == pd.Timestamp("20240209")
+        assert not calendar("20240101") and calendar("20240102")
+        assert len(loads) == 1
+
+
+class TestResponseCache:
+    def test_volatile_response_expires(self, monkeypatch):
+        calls = []
+
+        def read(self, **params):
+            calls.append(params["trdDd"])
+            return FakeResponse({"OutBlock_1": [{"ISU_SRT_CD": "005930"}]})
+
+        monkeypatch.setattr(Post, "read", read)
+        clock = Clock(datetime.datetime(2024, 1, 10, 10, 0, tzinfo=KST))
+        ResponseCache().enable(policy=FreshnessPolicy(clock=clock))
+        try:
+            for date in ["20240109", "20240110", "20240109", "20240110"]:
+                전종목시세().fetch(date, "STK")
+            assert calls == ["20240109", "20240110"]
+
+            clock.value += datetime.timedelta(minutes=5)
+            전종목시세().fetch("20240109", "STK")
+            전종목시세().fetch("20240110", "STK")
+            assert calls == ["20240109", "20240110", "20240110"]
+        finally:
+            ResponseCache().disable()
+            ResponseCache().policy = FreshnessPolicy()
+
+
+class TestSingleFlight:
+    def test_concurrent_duplicates_share_one_request(self, monkeypatch):
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def read(self, **params):
+            calls.append(params["trdDd"])
+            time.sleep(0.2)
+            return FakeResponse({"OutBlock_1": [{"ISU_SRT_CD": "005930"}]})
+
+        monkeypatch.setattr(Post, "read", read)
+
+        def fetch(date):
+            barrier.wait()
+            return 전종목시세().read_json(trdDd=date, mktId="STK")
+
+        results = concurrent_map(fetch, ["20240110"] * 3 + ["20240111"])
+        assert sorted(calls) == ["20240110", "20240111"]
+        assert results[0] == results[1] == results[2]
+        assert results[0]["OutBlock_1"] is not results[1]["OutBlock_1"]
+
+    def test_error_is_shared(self):
+        flight = SingleFlight()
+        with pytest.raises(ValueError):
+            flight.do("key", lambda: int("x"))
+        assert len(flight) == 0
+
+    @pytest.mark.parametrize("error", [CancelledError, TimeoutError])
+    def test_cancellation_is_not_shared(self, error):
+        flight = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def cancelled():
+            started.set()
+            time.sleep(0.1)
+            raise error()
+
+        def leader():
+            try:
+                flight.do("key", cancelled)
+            except BaseException as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=leader)
+        thread.start()
+        started.wait()
+        # 먼저 요청한 스레드가 취소되면 다시 요청해서 결과를 받는다.
+        assert flight.do("key", lambda: 1) == 1
+        thread.join()
+        assert isinstance(errors[0], error)
+        assert len(flight) == 0
@@ -157,6 +157,59 @@ class TestEtfPdf:
         assert df.iloc[1, 0] == pytest.approx(-3.58)
 
 
+class TestEtfNavPanel:
+    @pytest.fixture
+    def server(self):
+        from pykrx.testing import FakeServer
+        from pykrx.website.krx.etx.ticker import EtxTicker
+
+        # 합성 ETF 목록을 읽도록 보관된 티커 목록을 잠시 비운다.
+        saved, EtxTicker._instance = EtxTicker._instance, None
+        with FakeServer(size=40) as server:
+            yield server
+        EtxTicker._instance = saved
+
+    def test_matches_per_ticker_calls(self, server):
+        df = stock.get_etf_nav_panel("20240102", "20240131")
+        tickers = df.columns.get_level_values(1).unique()
+        assert len(tickers) == 10
+        ticker = tickers[3]
+        deviation = stock.get_etf_price_deviation("20240102", "20240131", ticker)
+        tracking = stock.get_etf_tracking_error("20240102", "20240131", ticker)
+        assert np.allclose(df["괴리율"][ticker], deviation["괴리율"])
+        assert np.allclose(df["추적오차율"][ticker], tracking["추적오차율"])
+
+    def test_failed_ticker_is_nan(self, server, monkeypatch):
+        from pykrx.website.krx.etx import deviation
+
+        tickers = stock.get_etf_ticker_list("20240131")[:3]
+        fetch = deviation.get_etf_tracking_error
+
+        def flaky(fromdate, todate, ticker):
+            if ticker == tickers[1]:
+                raise ConnectionError(ticker)
+            return fetch(fromdate, todate, ticker)
+
+        monkeypatch.setattr(deviation, "get_etf_tracking_error", flaky)
+        df = stock.get_etf_nav_panel("20240102", "20240131", tickers)
+        assert df.columns.get_level_values(1).unique().to_list() == tickers
+        assert df["추적오차율"][tickers[1]].isna().all()
+        assert df["괴리율"][tickers[1]].notna().all()
+        assert df["추적오차율"][tickers[0]].notna().all()
+
+    def test_statistics_match_pandas_rolling(self, server):
+        df = stock.get_etf_deviation_statistics("20240102", "20240329", window=10)
+        panel = stock.get_etf_nav_panel("20240102", "20240329")
+        premium = panel["괴리율"]
+        expected = premium.rolling(10).std()
+        assert np.allclose(df["괴리율표준편차"], expected, equal_nan=True)
+        z = (premium - premium.rolling(10).mean().shift()) / expected.shift()
+        assert df["이상치"].equals(z.abs() > 3.0)
+        difference = (panel["NAV"].pct_change() - panel["지수"].pct_change()) * 100
+        expected = difference.rolling(10).std() * np.sqrt(252)
+        assert np.allclose(df["추적오차"], expected, equal_nan=True)
+
+
 class TestEtfTradingvolumeValue:
     @pytest.mark.vcr
     def test_investor_in_businessday(self):
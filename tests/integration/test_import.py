@@ -0,0 +1,36 @@
+import pytest
+import subprocess
+import sys
+# pylint: disable-all
+# flake8: noqa
+
+
+def run(code):
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return proc.stdout.split()
+
+
+class TestLazyImport:
+    def test_import_does_not_load_heavy_modules(self):
+        code = (
+            "import sys, pykrx\n"
+            "print(*[x in sys.modules for x in "
+            "('matplotlib', 'pandas', 'pykrx.stock')])"
+        )
+        assert run(code) == ["False", "False", "False"]
+
+    def test_submodule_loaded_on_access(self):
+        code = "import pykrx\nprint(pykrx.stock.__name__, pykrx.bond.__name__)"
+        assert run(code) == ["pykrx.stock", "pykrx.bond"]
+
+    def test_font_set_on_pyplot_import(self):
+        pytest.importorskip("matplotlib")
+        code = (
+            "import pykrx, matplotlib\n"
+            "matplotlib.use('Agg')\n"
+            "import matplotlib.pyplot\n"
+            "print(matplotlib.rcParams['axes.unicode_minus'])"
+        )
+        assert run(code) == ["False"]
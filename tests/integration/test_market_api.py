@@ -693,5 +693,134 @@ class TestStockExhaustionRatesOfForeignInvestmentByDateTest:
         assert len(df) == 1
 
 
+class TestStockMarketSnapshot:
+    @pytest.fixture
+    def fake_krx(self, monkeypatch):
+        from pykrx.website.krx.market import core
+
+        calls = []
+
+        def fake(payload):
+            def fetch(self, *args):
+                calls.append((type(self).__name__, args))
+                return pd.DataFrame(payload(args))
+
+            return fetch
+
+        price = {
+            "ISU_SRT_CD": ["005930", "000660"],
+            "ISU_ABBRV": ["삼성전자", "SK하이닉스"],
+            "TDD_OPNPRC": ["59,800", "92,000"],
+            "TDD_HGPRC": ["60,100", "93,000"],
+            "TDD_LWPRC": ["59,300", "91,100"],
+            "TDD_CLSPRC": ["59,400", "91,800"],
+            "ACC_TRDVOL": ["10,000", "2,000"],
+            "ACC_TRDVAL": ["594,000,000", "183,600,000"],
+            "FLUC_RT": ["-0.67", "1.10"],
+            "MKTCAP": ["354,605,000,000,000", "66,832,000,000,000"],
+            "LIST_SHRS": ["5,969,782,550", "728,002,365"],
+        }
+        fundamental = {
+            "ISU_SRT_CD": ["000660", "005930"],
+            "BPS": ["92,000", "43,611"],
+            "PER": ["5.60", "9.19"],
+            "PBR": ["1.00", "1.36"],
+            "EPS": ["16,390", "6,461"],
+            "DVD_YLD": ["1.31", "2.43"],
+            "DPS": ["1,200", "1,444"],
+        }
+        foreign = {
+            "ISU_SRT_CD": ["005930"],
+            "LIST_SHRS": ["5,969,782,550"],
+            "FORN_HD_QTY": ["3,000,000,000"],
+            "FORN_SHR_RT": ["50.25"],
+            "FORN_ORD_LMT_QTY": ["5,969,782,550"],
+            "FORN_LMT_EXHST_RT": ["50.25"],
+        }
+        sector = {
+            "ISU_SRT_CD": ["005930", "000660"],
+            "ISU_ABBRV": ["삼성전자", "SK하이닉스"],
+            "IDX_IND_NM": ["전기전자", "전기전자"],
+            "TDD_CLSPRC": ["59,400", "91,800"],
+            "CMPPREVDD_PRC": ["-400", "1,000"],
+            "FLUC_RT": ["-0.67", "1.10"],
+            "MKTCAP": ["354,605,000,000,000", "66,832,000,000,000"],
+        }
+        monkeypatch.setattr(core.전종목시세, "fetch", fake(lambda _: price))
+        monkeypatch.setattr(
+            core.PER_PBR_배당수익률_전종목, "fetch", fake(lambda _: fundamental)
+        )
+        monkeypatch.setattr(core.외국인보유량_전종목, "fetch", fake(lambda _: foreign))
+        monkeypatch.setattr(core.업종분류현황, "fetch", fake(lambda _: sector))
+        return calls
+
+    def test_joins_on_ticker(self, fake_krx):
+        df = stock.get_market_snapshot("20220902", "KOSPI")
+        assert df.index.to_list() == ["005930", "000660"]
+        assert df.loc["000660", "PER"] == pytest.approx(5.60)
+        assert df.loc["005930", "시가총액"] == 354605000000000
+        assert df.loc["005930", "업종명"] == "전기전자"
+        assert np.isnan(df.loc["000660", "한도소진률"])
+        assert df.columns.is_unique
+
+    def test_shared_payload_is_fetched_once(self, fake_krx):
+        stock.get_market_snapshot("20220902", "ALL")
+        names = sorted(name for name, _ in fake_krx)
+        assert names.count("전종목시세") == 1
+        assert names.count("업종분류현황") == 2
+
+
+class TestStockInvestorFlow:
+    @pytest.fixture
+    def server(self):
+        from pykrx.testing import FakeServer
+        from pykrx.website.krx.market.flow import InvestorFlowCache
+
+        InvestorFlowCache().enable()
+        with FakeServer() as server:
+            yield server
+        InvestorFlowCache().disable()
+
+    def test_matches_separate_requests(self, server):
+        df = stock.get_market_investor_flow_by_date("20240102", "20240110", "005930")
+        assert df.index.get_level_values("투자자구분")[:5].to_list() == [
+            "기관합계",
+            "기타법인",
+            "개인",
+            "외국인합계",
+            "전체",
+        ]
+        for on in ["매도", "매수", "순매수"]:
+            value = stock.get_market_trading_value_by_date(
+                "20240102", "20240110", "005930", on=on
+            )
+            assert df["거래대금"][on].unstack()[value.columns].equals(value)
+
+    def test_general_is_derived_from_detail(self, server):
+        detail = stock.get_market_investor_flow_by_date(
+            "20240102", "20240110", "KOSPI", detail=True
+        )
+        requests = server.stats()["requests"]
+        general = stock.get_market_investor_flow_by_date(
+            "20240103", "20240109", "KOSPI"
+        )
+        assert server.stats()["requests"] == requests
+        assert len(detail) == 7 * 12
+        volume = stock.get_market_trading_volume_by_date(
+            "20240103", "20240109", "KOSPI", on="매수"
+        )
+        assert general["거래량"]["매수"].unstack()[volume.columns].equals(volume)
+
+    def test_cache_is_opt_in(self):
+        from pykrx.testing import FakeServer
+
+        with FakeServer() as server:
+            stock.get_market_investor_flow_by_date("20240102", "20240110", "005930")
+            requests = server.stats()["requests"]
+            stock.get_market_investor_flow_by_date("20240102", "20240110", "005930")
+            # 거래량/거래대금 x 매도/매수
+            assert server.stats()["requests"] - requests == 4
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
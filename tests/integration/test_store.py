@@ -0,0 +1,545 @@
+import pytest
+import weakref
+import numpy as np
+import pandas as pd
+from pykrx import stock
+from pykrx.store import flows, futures, panel, warehouse
+from pykrx.store import Dataset, EtfPdfHistory, FlowStore, FutureHistory
+from pykrx.store import IndexMembership
+from pykrx.store import PanelStore, ShortingStore, Warehouse
+from pykrx.store import update_flows, update_panel, update_shorting
+from pykrx.testing import FakeServer
+from pykrx.website.comm import FreshnessPolicy
+# pylint: disable-all
+# flake8: noqa
+
+pytest.importorskip("pyarrow")
+
+
+def weekdays(fromdate, todate):
+    return list(pd.bdate_range(fromdate, todate))
+
+
+class TestWarehouse:
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        calls = []
+
+        def by_ticker(date, market):
+            calls.append(date)
+            return pd.DataFrame(
+                {"종가": [100, 200], "거래량": [1, 2]},
+                index=pd.Index(["005930", "000660"], name="티커"),
+            )
+
+        def by_date(fromdate, todate, ticker):
+            calls.append((fromdate, todate))
+            index = pd.bdate_range(fromdate, todate)
+            return pd.DataFrame({"종가": range(len(index))}, index=index)
+
+        monkeypatch.setitem(
+            warehouse.DATASETS, "daily", Dataset("daily", by_ticker, "market")
+        )
+        monkeypatch.setitem(
+            warehouse.DATASETS, "series", Dataset("series", by_date, "ticker")
+        )
+        return calls
+
+    def test_sync_fetches_only_missing_days(self, tmp_path, calls):
+        wh = Warehouse(tmp_path, calendar=weekdays)
+        assert wh.sync("daily", "KOSPI", until="20240105", since="20240102") == 8
+        calls.clear()
+
+        wh = Warehouse(tmp_path, calendar=weekdays)
+        wh.sync("daily", "KOSPI", until="20240109")
+        assert calls == ["20240108", "20240109"]
+
+    def test_read_with_projection_and_pruning(self, tmp_path, calls):
+        wh = Warehouse(tmp_path, calendar=weekdays)
+        wh.sync("daily", "KOSPI", until="20240209", since="20240129")
+        df = wh.read("daily", "KOSPI", "20240201", "20240205", columns=["종가"])
+        assert df.columns.to_list() == ["종가"]
+        assert df.index.names == ["날짜", "티커"]
+        assert len(df) == 6
+
+    def test_range_dataset_fills_gaps(self, tmp_path, calls):
+        wh = Warehouse(tmp_path, calendar=weekdays)
+        wh.sync("series", "005930", until="20240131", since="20240115")
+        calls.clear()
+        wh.sync("series", "005930", until="20240209", since="20240110")
+        assert calls == [("20240110", "20240114"), ("20240201", "20240209")]
+        assert len(wh.read("series", "005930")) == 23
+
+    def test_default_until_is_settled(self, tmp_path, calls, monkeypatch):
+        # 2024-01-05(금) 장중에는 당일 데이터가 확정되지 않았다.
+        intraday = pd.Timestamp("2024-01-05 10:00")
+        monkeypatch.setattr(FreshnessPolicy, "now", lambda self: intraday)
+        wh = Warehouse(tmp_path, calendar=weekdays)
+        with FakeServer(size=5):
+            wh.sync("daily", "KOSPI", since="20240102")
+        assert calls == ["20240102", "20240103", "20240104"]
+
+
+class TestPanelStore:
+    def test_append_and_memmap_read(self, tmp_path):
+        store = PanelStore.create(
+            tmp_path, {"종가": "int32", "PER": "float32"}, ticker_capacity=2
+        )
+        store.append(
+            "20240102",
+            pd.DataFrame({"종가": [100, 200], "PER": [1.5, 2.5]}, index=["A", "B"]),
+        )
+        store.append("20240103", pd.DataFrame({"종가": [300, 400]}, index=["B", "C"]))
+
+        store = PanelStore(tmp_path)
+        assert store.tickers.to_list() == ["A", "B", "C"]
+        assert store.ticker_capacity >= 3
+        close = store.field("종가")
+        assert isinstance(close.base, np.memmap)
+        assert close.tolist() == [[100, 200, 0], [0, 300, 400]]
+        assert np.isnan(store.field("PER")[1]).all()
+        assert store.present().tolist() == [[True, True, False], [False, True, True]]
+        assert store.frame("종가", "20240103").loc["2024-01-03", "C"] == 400
+
+    def test_dates_must_increase(self, tmp_path):
+        store = PanelStore.create(tmp_path, {"종가": "int32"})
+        store.append("20240103", pd.DataFrame({"종가": [1]}, index=["A"]))
+        with pytest.raises(ValueError):
+            store.append("20240102", pd.DataFrame({"종가": [1]}, index=["A"]))
+
+    def test_recovers_from_interrupted_writes(self, tmp_path, monkeypatch):
+        store = PanelStore.create(
+            tmp_path, {"종가": "int32", "PER": "float32"}, ticker_capacity=1
+        )
+        store.append("20240102", pd.DataFrame({"종가": [1], "PER": [1.0]}, index=["A"]))
+
+        # 필드 파일을 쓴 뒤 meta를 갱신하기 전에 중단
+        monkeypatch.setattr(PanelStore, "_write_meta", classmethod(_crash))
+        with pytest.raises(OSError):
+            store.append("20240103", pd.DataFrame({"종가": [2]}, index=["A"]))
+        monkeypatch.undo()
+
+        # 열 폭을 늘리면서 meta를 갱신한 뒤 파일 교체 도중 중단
+        replace = panel.os.replace
+        replaced = []
+
+        def replace_one(src, dst):
+            if str(src).endswith(".grow"):
+                if replaced:
+                    _crash()
+                replaced.append(src)
+            replace(src, dst)
+
+        monkeypatch.setattr(panel.os, "replace", replace_one)
+        store = PanelStore(tmp_path)
+        with pytest.raises(OSError):
+            store.append("20240104", pd.DataFrame({"종가": [3]}, index=["B"]))
+        monkeypatch.setattr(panel.os, "replace", replace)
+
+        store = PanelStore(tmp_path)
+        assert store.ticker_capacity == 2
+        assert store.field("종가").tolist() == [[1]]
+        store.append("20240104", pd.DataFrame({"종가": [3]}, index=["B"]))
+        assert store.field("종가").tolist() == [[1, 0], [0, 3]]
+        assert store.field("PER")[0, 0] == 1.0
+        assert store.present().tolist() == [[True, False], [False, True]]
+
+    def test_update_stops_at_settled_day(self, tmp_path, monkeypatch):
+        # 2024-01-05(금) 장중의 단면은 추가하지 않는다.
+        intraday = pd.Timestamp("2024-01-05 10:00")
+        monkeypatch.setattr(FreshnessPolicy, "now", lambda self: intraday)
+        monkeypatch.setattr(stock, "get_previous_business_days", weekdays)
+        monkeypatch.setattr(stock, "get_nearest_business_day_in_a_week", str)
+        monkeypatch.setattr(
+            stock,
+            "get_market_snapshot",
+            lambda date, market: pd.DataFrame({"종가": [1]}, index=["A"]),
+        )
+        store = PanelStore.create(tmp_path, {"종가": "int32"})
+        assert update_panel(store, "20240105", "20240102") == 3
+        assert update_panel(store) == 0
+        assert store.dates[-1] == pd.Timestamp("2024-01-04")
+
+
+def _crash(*args):
+    raise OSError("중단")
+
+
+class TestFlowStore:
+    @pytest.fixture
+    def server(self):
+        with FakeServer(size=5) as server:
+            yield server
+
+    def test_update_fetches_only_new_days(self, tmp_path, server):
+        store = FlowStore.create(tmp_path, ticker_capacity=2)
+        assert update_flows(store, "20240105", "20240102", calendar=weekdays) == 4
+        requests = server.stats()["requests"]
+        assert update_flows(FlowStore(tmp_path), "20240109", calendar=weekdays) == 2
+        # 티커 목록 1회 + 티커마다 거래량/거래대금 x 매도/매수
+        assert server.stats()["requests"] - requests == 1 + 5 * 4
+
+        store = FlowStore(tmp_path)
+        assert store.field("거래량_매수").shape == (6, 5, 12)
+        assert store.present().all()
+        net = store.frame("거래대금_순매수", investor="외국인")["005930"]
+        value = stock.get_market_trading_value_by_date(
+            "20240102", "20240109", "005930", detail=True
+        )
+        assert net.to_list() == value["외국인"].to_list()
+
+    def test_update_stops_at_settled_day(self, tmp_path, server, monkeypatch):
+        # 2024-01-05(금) 장중의 거래실적은 추가하지 않는다.
+        intraday = pd.Timestamp("2024-01-05 10:00")
+        monkeypatch.setattr(FreshnessPolicy, "now", lambda self: intraday)
+        store = FlowStore.create(tmp_path)
+        assert update_flows(store, "20240105", "20240102", calendar=weekdays) == 3
+        assert update_flows(store, calendar=weekdays) == 0
+        assert store.dates[-1] == pd.Timestamp("2024-01-04")
+
+    def test_resume_from_checkpoint(self, tmp_path, server, monkeypatch):
+        fetch = flows._fetch_flows
+        calls = []
+        failures = [ConnectionError]
+
+        def flaky(store, ticker, dates):
+            calls.append(ticker)
+            if len(calls) == 3 and failures:
+                raise failures.pop()
+            return fetch(store, ticker, dates)
+
+        monkeypatch.setattr(flows, "_fetch_flows", flaky)
+        store = FlowStore.create(tmp_path)
+        with pytest.raises(ConnectionError):
+            update_flows(
+                store, "20240105", "20240102", max_workers=1, calendar=weekdays
+            )
+        assert len(store.dates) == 0
+        assert len(store.done()) == 2
+
+        calls.clear()
+        assert update_flows(store, "20240105", max_workers=1, calendar=weekdays) == 4
+        assert len(calls) == 3
+        assert store.pending() is None
+        assert len(store.tickers) == 5
+
+    def test_extend_opens_one_ticker_at_a_time(self, tmp_path):
+        store = FlowStore.create(tmp_path, detail=False, ticker_capacity=2)
+        dates = pd.bdate_range("20240102", periods=40)
+        live = set()
+        peak = []
+
+        def load(ticker):
+            values = np.full((4, len(dates), 5), int(ticker), dtype=np.int64)
+            live.add(ticker)
+            weakref.finalize(values, live.discard, ticker)
+            peak.append(len(live))
+            return values, np.ones(len(dates), dtype=bool)
+
+        store.extend(dates, ["1", "2", "3", "4", "5"], load)
+        assert max(peak) == 1
+        assert store.frame("거래량_매수").iloc[-1].to_list() == [1, 2, 3, 4, 5]
+
+        df = pd.DataFrame({("거래량_매수", "개인"): [7, 8]}, index=["1", "6"])
+        store.append("20240301", df)
+        day = store.frame("거래량_매수", "20240301", investor="개인")
+        assert day.iloc[0].to_list() == [7, 0, 0, 0, 0, 8]
+        assert store.present("20240301").tolist() == [[1, 0, 0, 0, 0, 1]]
+
+    def test_commit_is_idempotent(self, tmp_path, monkeypatch):
+        store = FlowStore.create(tmp_path, detail=False)
+        store.begin(weekdays("20240102", "20240103"), ["A"])
+        store.save("A", np.ones((4, 2, 5), dtype=np.int64), np.ones(2, dtype=bool))
+
+        # meta를 갱신한 뒤 checkpoint를 지우기 전에 중단
+        monkeypatch.setattr(flows.shutil, "rmtree", _crash)
+        with pytest.raises(OSError):
+            store.commit()
+        monkeypatch.undo()
+
+        store = FlowStore(tmp_path)
+        assert store.pending() is not None
+        assert store.commit() == 0
+        assert store.pending() is None
+        assert len(store.dates) == 2
+
+
+class TestIndexMembership:
+    # 변경일: (편입, 편출)
+    CHANGES = {
+        "20230612": ({"E"}, {"A"}),
+        "20230613": ({"F"}, {"B"}),
+        "20231208": ({"A"}, {"E"}),
+        "20240320": ({"G"}, set()),
+    }
+
+    def members(self, date):
+        members = {"A", "B", "C", "D"}
+        for day, (added, removed) in sorted(self.CHANGES.items()):
+            if day <= date:
+                members = (members | added) - removed
+        return sorted(members)
+
+    def test_bisects_change_dates(self):
+        m = IndexMembership("1028", fetch=self.members, calendar=weekdays)
+        requests = m.build("20230102", "20231229")
+        assert requests < len(m.dates) / 5
+        assert m.events().loc["2023-06-13", "티커"].to_list() == ["F", "B"]
+        for day in m.dates:
+            assert m.members(day) == self.members(day.strftime("%Y%m%d"))
+        matrix = m.matrix("20230609", "20230613")
+        assert matrix["A"].to_list() == [True, False, False]
+        assert matrix["F"].to_list() == [False, False, True]
+
+    def test_extend_and_reload(self, tmp_path):
+        m = IndexMembership("1028", fetch=self.members, calendar=weekdays)
+        m.build("20230102", "20231229")
+        m.build("20230102", "20240329")
+        assert m.members("20240329") == ["A", "C", "D", "F", "G"]
+        m.save(tmp_path / "1028.json")
+        loaded = IndexMembership.load(tmp_path / "1028.json")
+        assert loaded.matrix().equals(m.matrix())
+        with pytest.raises(ValueError):
+            loaded.members("20220103")
+
+    def test_matrix_without_changes(self):
+        m = IndexMembership("1028", fetch=self.members, calendar=weekdays)
+        m.build("20230102", "20230609")
+        matrix = m.matrix("20230605", "20230609")
+        assert matrix.columns.to_list() == ["A", "B", "C", "D"]
+        assert matrix.to_numpy().all()
+
+        empty = m.matrix("20240102", "20240131")
+        assert empty.shape == (0, 0)
+        assert empty.index.name == "날짜"
+        assert empty.columns.name == "티커"
+
+
+class TestEtfPdfHistory:
+    # 일자별 (ETF, 구성종목): 계약수. 금액은 계약수 x 1000
+    SHARES = {
+        ("A", "X"): {"20240102": 10, "20240110": 12},
+        ("A", "Y"): {"20240102": 5, "20240108": None, "20240115": 7},
+        ("B", "X"): {"20240103": 3},
+    }
+
+    def fetch(self, ticker, date):
+        rows = {}
+        for (etf, holding), history in self.SHARES.items():
+            value = None
+            for day, shares in sorted(history.items()):
+                if etf == ticker and day <= date:
+                    value = shares
+            if value is not None:
+                rows[holding] = [float(value), value * 1000, 1.0]
+        df = pd.DataFrame.from_dict(
+            rows, orient="index", columns=["계약수", "금액", "비중"]
+        )
+        return df.rename_axis("티커")
+
+    def test_stores_only_changes(self):
+        h = EtfPdfHistory(fetch=self.fetch, calendar=weekdays)
+        requests = h.build("20240102", "20240112", ["A", "B"])
+        assert requests == 2 * len(h.dates)
+        changes = h.changes("A")
+        assert len(changes[changes["필드"] == "계약수"]) == 4
+        assert h.holdings("A", "20240109").index.to_list() == ["X"]
+        for day in h.dates:
+            date = day.strftime("%Y%m%d")
+            expected = self.fetch("A", date).astype(
+                {"금액": np.int64, "비중": np.float32}
+            )
+            assert h.holdings("A", date).equals(
+                expected.sort_values("금액", ascending=False)
+            )
+        matrix = h.matrix("A", "계약수", "20240105", "20240110")
+        assert matrix["Y"].to_list() == [5, 0, 0, 0]
+        assert matrix["X"].to_list() == [10, 10, 10, 12]
+        assert h.holdings("B", "20240102").empty
+        with pytest.raises(ValueError):
+            h.holdings("A", "20231229")
+
+    def test_extend_and_reload(self, tmp_path):
+        h = EtfPdfHistory(fields=["계약수"], fetch=self.fetch, calendar=weekdays)
+        h.build("20240102", "20240112", ["A", "B"])
+        assert h.build("20240102", "20240119", ["A", "B"]) == 2 * 5
+        assert h.holdings("A", "20240119")["계약수"].to_dict() == {"X": 12, "Y": 7}
+        h.save(tmp_path / "pdf")
+        loaded = EtfPdfHistory.load(tmp_path / "pdf")
+        assert loaded.matrix("A").equals(h.matrix("A"))
+        assert loaded.holdings("B", "20240119").equals(h.holdings("B", "20240119"))
+
+    def test_extend_fills_gap(self):
+        h = EtfPdfHistory(fields=["계약수"], fetch=self.fetch, calendar=weekdays)
+        h.build("20240102", "20240105", ["A"])
+        # 보관한 구간 끝과 fromdate 사이의 영업일도 조회한다.
+        assert h.build("20240115", "20240119", ["A"]) == 10
+        assert h.holdings("A", "20240110")["계약수"].to_dict() == {"X": 12}
+
+    def test_failed_days_are_fetched_again(self):
+        failures = {("A", "20240110")}
+
+        def fetch(ticker, date):
+            if (ticker, date) in failures:
+                failures.discard((ticker, date))
+                raise ConnectionError(date)
+            return self.fetch(ticker, date)
+
+        h = EtfPdfHistory(fields=["계약수"], fetch=fetch, calendar=weekdays)
+        with pytest.raises(ConnectionError):
+            h.build("20240102", "20240112", ["A", "B"])
+        # 실패한 일자 전까지만 보관한다.
+        assert h.holdings("A", "20240109")["계약수"].to_dict() == {"X": 10}
+        with pytest.raises(ValueError):
+            h.holdings("A", "20240110")
+        assert h.holdings("B", "20240112")["계약수"].to_dict() == {"X": 3}
+
+        assert h.build("20240102", "20240112", ["A", "B"]) == 3
+        assert h.holdings("A", "20240112")["계약수"].to_dict() == {"X": 12}
+        assert h.matrix("A")["X"].to_list() == [10] * 6 + [12] * 3
+
+
+class TestShortingStore:
+    def test_picks_cheaper_endpoint(self, tmp_path):
+        # 종목 목록은 프로세스에 보관되므로 TestFlowStore와 같은 크기를 사용한다.
+        with FakeServer(size=5) as server:
+            # 하루씩 갱신하면 항상 전종목 조회를 사용한다.
+            bulk = ShortingStore.create(tmp_path / "bulk")
+            for day in weekdays("20240102", "20240202"):
+                update_shorting(bulk, f"{day:%Y%m%d}", "20240102", calendar=weekdays)
+
+            store = ShortingStore.create(tmp_path / "store")
+            requests = server.stats()["requests"]
+            # 22영업일 x 2시장 > 5종목이므로 종목별로 조회한다.
+            assert (
+                update_shorting(store, "20240131", "20240102", calendar=weekdays) == 22
+            )
+            assert server.stats()["requests"] - requests < 2 * 22 * 2
+
+            requests = server.stats()["requests"]
+            # 2영업일 x 2시장 < 5종목이므로 전종목 조회를 사용한다.
+            assert update_shorting(store, "20240202", calendar=weekdays) == 2
+            # 시장별 종목 목록 조회 2건을 포함한다.
+            assert server.stats()["requests"] - requests <= 2 * 2 * 2 + 2
+
+        assert bulk.dates.equals(store.dates)
+        for name in ["공매도거래량", "공매도잔고", "잔고비중"]:
+            expected = bulk.frame(name)[store.tickers]
+            assert np.allclose(store.frame(name), expected, equal_nan=True)
+
+    def test_days_to_cover(self, tmp_path):
+        store = ShortingStore.create(tmp_path / "store")
+        with FakeServer(size=5):
+            update_shorting(store, "20240229", "20240102", calendar=weekdays)
+        df = store.days_to_cover("20240201", "20240229", window=5)
+        volume = store.frame("거래량").astype(float).rolling(5).mean()
+        expected = store.frame("공매도잔고") / volume
+        assert df.index[0] == pd.Timestamp("20240201")
+        assert np.allclose(df, expected.loc["20240201":], equal_nan=True)
+
+        # 저장된 영업일이 없는 구간
+        empty = store.days_to_cover("20231201", "20231229", window=5)
+        assert empty.shape == (0, len(store.tickers))
+        assert empty.columns.to_list() == list(store.tickers)
+
+    def test_update_stops_at_settled_day(self, tmp_path, monkeypatch):
+        # 2024-01-05(금) 장중의 공매도 거래는 추가하지 않는다.
+        intraday = pd.Timestamp("2024-01-05 10:00")
+        monkeypatch.setattr(FreshnessPolicy, "now", lambda self: intraday)
+        store = ShortingStore.create(tmp_path / "store")
+        with FakeServer(size=5):
+            update_shorting(store, "20240105", "20240102", calendar=weekdays)
+        assert store.dates[-1] <= pd.Timestamp("2024-01-04")
+
+
+class TestFutureHistory:
+    def test_build_splits_snapshots_by_contract(self, tmp_path):
+        with FakeServer(size=5):
+            h = FutureHistory("KRDRVFUK2I", calendar=weekdays)
+            # 전종목기본정보 1회 + 영업일 42회
+            assert h.build("20240201", "20240329") == 43
+            # 새 영업일이 있으면 전종목기본정보를 다시 조회한다.
+            assert h.build("20240102", "20240329") == 23
+            assert h.build("20240102", "20240329") == 0
+
+        front = h.ohlcv("18240300")
+        assert front.index[-1] == pd.Timestamp("2024-03-14")
+        assert len(h.panel("종가", "20240102", "20240131")) == 22
+
+        h.save(tmp_path)
+        loaded = FutureHistory.load(tmp_path)
+        assert loaded.codes == h.codes
+        pd.testing.assert_frame_equal(loaded.ohlcv("18240600"), h.ohlcv("18240600"))
+
+    def test_continuous_is_back_adjusted_at_roll(self):
+        with FakeServer(size=5):
+            h = FutureHistory("KRDRVFUK2I", calendar=weekdays)
+            h.build("20240102", "20240628")
+
+        df = h.continuous(roll=1)
+        assert not df["종목코드"].str.startswith("4").any()
+        assert df.loc["2024-03-13", "종목코드"] == "18240300"
+        assert df.loc["2024-03-14", "종목코드"] == "18240600"
+
+        # 마지막 근월물 구간은 원래 가격이다.
+        raw = h.ohlcv("18240900")["종가"]
+        last = df[df["종목코드"] == "18240900"]
+        np.testing.assert_allclose(last["종가"], raw[last.index])
+
+        # 롤오버 전날의 조정 가격은 새 근월물 가격에 이후 조정값을 더한 값이다.
+        new = h.ohlcv("18240600")["종가"]["2024-03-13"]
+        expected = new + df.loc["2024-03-14", "조정"]
+        assert df.loc["2024-03-13", "종가"] == pytest.approx(expected)
+
+    def test_expired_contract_is_front_month(self):
+        expiries = {"A": "2024-03-14", "B": "2024-06-13"}
+
+        def fetch(date, prod):
+            codes = [
+                x for x in expiries if pd.Timestamp(date) <= pd.Timestamp(expiries[x])
+            ]
+            price = {"A": 100.0, "B": 105.0}
+            return pd.DataFrame(
+                {
+                    x: [price[c] for c in codes]
+                    for x in ["종가", "시가", "고가", "저가", "현물가"]
+                }
+                | {"대비": 0.0, "거래량": 1, "거래대금": 1, "종목명": codes},
+                index=codes,
+            )
+
+        def info(prod):
+            # 전종목기본정보는 상장 중인 종목만 제공한다.
+            return pd.DataFrame(
+                {"최종거래일": [pd.Timestamp(expiries["B"])]}, index=["B"]
+            )
+
+        h = FutureHistory("KRDRVFUK2I", fetch, info, weekdays)
+        h.build("20240201", "20240329")
+        df = h.continuous()
+        assert df.loc["2024-02-15", "종목코드"] == "A"
+        assert df.loc["2024-03-14", "종목코드"] == "A"
+        assert df.loc["2024-03-15", "종목코드"] == "B"
+        assert df.loc["2024-02-15", "종가"] == 105.0
+
+    def test_failed_days_are_fetched_again(self):
+        failures = {"20240104"}
+
+        def fetch(date, prod):
+            if date in failures:
+                failures.discard(date)
+                raise ConnectionError(date)
+            df = pd.DataFrame({"종목명": ["A"]}, index=["A"])
+            return df.assign(**dict.fromkeys(futures._FIELDS, 1.0))
+
+        def info(prod):
+            return pd.DataFrame({"최종거래일": [pd.Timestamp("20241231")]}, index=["A"])
+
+        h = FutureHistory("KRDRVFUK2I", fetch, info, weekdays)
+        with pytest.raises(ConnectionError):
+            h.build("20240102", "20240105")
+        assert pd.Timestamp("20240104") not in h.dates
+        assert len(h.ohlcv("A")) == 3
+        # 전종목기본정보 1회 + 실패한 1일
+        assert h.build("20240102", "20240105") == 2
+        assert len(h.ohlcv("A")) == 4
@@ -0,0 +1,378 @@
+import pytest
+import json
+import requests
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import CancelledError
+from pykrx.website.comm import CancelToken, concurrent_map, current_deadline, deadline
+from pykrx.website.comm import AimdLimiter, CircuitOpenError, TransientError
+from pykrx.website.comm import add_hook, remove_hook, to_numeric
+from pykrx.website.comm import metrics, retry, throttle, tracing, webio
+from pykrx.website.krx import krxio
+from pykrx.testing import Behavior, FakeServer
+from pykrx.website.comm.webio import Post
+from pykrx.website.krx.bond.wrap import get_otc_treasury_yields_by_date
+from pykrx.website.krx.market.core import 개별종목시세
+# pylint: disable-all
+# flake8: noqa
+
+
+def FakeResponse(payload, status=200, content_type="application/json"):
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers["Content-Type"] = content_type
+    resp._content = (
+        payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    )
+    resp.url = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+    return resp
+
+
+class TestDeadline:
+    @pytest.fixture
+    def timeouts(self, monkeypatch):
+        timeouts = []
+
+        def post(url, headers, data, timeout):
+            timeouts.append(timeout)
+            return FakeResponse({"output": []})
+
+        monkeypatch.setattr(webio._session, "post", post)
+        return timeouts
+
+    def test_timeout_is_bounded_by_deadline(self, timeouts):
+        개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        with deadline(2):
+            개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        assert timeouts[0] == (5.0, 30.0)
+        assert timeouts[1][0] <= 2 and timeouts[1][1] <= 2
+
+    def test_deadline_stops_multi_chunk_read(self, timeouts):
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            with deadline(0.2):
+                개별종목시세().fetch("20000101", "20240105", "KR7005930003", 2)
+        assert time.monotonic() - start < 1
+        assert len(timeouts) == 1
+
+    def test_cancel_stops_multi_chunk_read(self, timeouts):
+        token = CancelToken()
+        token.cancel()
+        with pytest.raises(CancelledError):
+            with deadline(token=token):
+                개별종목시세().fetch("20000101", "20240105", "KR7005930003", 2)
+
+    def test_deadline_propagates_to_workers(self):
+        with deadline(10) as outer:
+            results = concurrent_map(lambda _: current_deadline(), range(3))
+        assert all(x is outer for x in results)
+        assert current_deadline() is None
+
+
+class TestRetry:
+    @pytest.fixture
+    def responses(self, monkeypatch):
+        responses = []
+        calls = []
+
+        def post(url, headers, data, timeout):
+            calls.append(data)
+            return responses.pop(0)
+
+        monkeypatch.setattr(webio._session, "post", post)
+        metrics.registry.reset()
+        return responses, calls
+
+    def test_retries_transient_responses(self, responses):
+        responses, calls = responses
+        responses.extend(
+            [
+                FakeResponse({}, status=503),
+                FakeResponse(b"<html>blocked</html>", content_type="text/html"),
+                FakeResponse(b'{"output": [{"TRD_'),
+                FakeResponse({"output": [{"TRD_DD": "2024/01/05"}]}),
+            ]
+        )
+        df = 개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        assert len(df) == 1
+        assert len(calls) == 4
+        host = "data.krx.co.kr"
+        assert metrics.registry.get("pykrx_retries_total", host=host, kind="http") == 1
+        assert metrics.registry.get("pykrx_requests_total", host=host, result="ok") == 1
+
+    def test_rejections_reach_the_limiter(self, responses, monkeypatch):
+        responses, calls = responses
+        host = AimdLimiter("data.krx.co.kr", concurrency=4, cooldown=0)
+        monkeypatch.setitem(throttle._limiters, "data.krx.co.kr", host)
+        responses.extend(
+            [
+                FakeResponse({}, status=429),
+                FakeResponse(b"<html>blocked</html>", content_type="text/html"),
+                FakeResponse({"output": [{"TRD_DD": "2024/01/05"}]}),
+            ]
+        )
+        개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        assert len(calls) == 3
+        assert host.concurrency < 4
+
+    def test_empty_json_is_not_a_rejection(self, responses):
+        responses, calls = responses
+        responses.extend([FakeResponse({})] * 4)
+        assert 개별종목시세().read(strtDd="20240101", endDd="20240105") == {}
+        assert len(calls) == 4
+        assert retry.circuit_breaker("https://data.krx.co.kr").state == "closed"
+
+    def test_circuit_breaker_stops_fan_out(self, responses):
+        responses, calls = responses
+        responses.extend([FakeResponse({}, status=502)] * 8)
+        with pytest.raises(TransientError):
+            개별종목시세().fetch("20240101", "20240105", "KR7005930003", 2)
+        with pytest.raises(CircuitOpenError):
+            개별종목시세().fetch("20240101", "20240105", "KR7000660001", 2)
+        # 연속 5번 실패한 뒤에는 요청을 보내지 않는다.
+        assert len(calls) == 5
+
+    @pytest.mark.parametrize("error", [requests.HTTPError("404"), CancelledError()])
+    def test_failed_probe_does_not_wedge_the_breaker(self, error):
+        url = f"https://probe-{type(error).__name__}.test"
+        breaker = retry.circuit_breaker(url)
+        breaker.reset_timeout = 0
+        for _ in range(breaker.failure_threshold):
+            breaker.record(False)
+
+        def probe():
+            raise error
+
+        with pytest.raises(type(error)):
+            retry.call_with_retry(url, probe)
+        assert retry.call_with_retry(url, lambda: 1) == 1
+        assert breaker.state == "closed"
+
+
+class TestThrottle:
+    def test_additive_increase_multiplicative_decrease(self):
+        limiter = AimdLimiter("test", concurrency=4, rate=20, cooldown=0)
+        with limiter.slot():
+            pass
+        assert limiter.concurrency == pytest.approx(4.25)
+        with pytest.raises(TransientError):
+            with limiter.slot():
+                raise TransientError("http")
+        assert limiter.concurrency == pytest.approx(2.125)
+        assert limiter.rate == pytest.approx((20 + 1 / 20) / 2)
+
+    def test_empty_response_is_not_congestion(self):
+        limiter = AimdLimiter("test", concurrency=4, cooldown=0)
+        with pytest.raises(TransientError):
+            with limiter.slot():
+                raise TransientError("empty")
+        assert limiter.concurrency >= 4
+
+    def test_concurrency_is_bounded(self):
+        limiter = AimdLimiter("test", concurrency=2, max_concurrency=2, rate=1000)
+        peak = []
+
+        def work(_):
+            with limiter.slot():
+                peak.append(limiter.inflight)
+                time.sleep(0.05)
+
+        concurrent_map(work, range(6))
+        assert max(peak) == 2
+
+    def test_heavy_bld_has_its_own_limiter(self):
+        url = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+        heavy = throttle.slot(url, "dbms/MDC/STAT/standard/MDCSTAT01501")
+        light = throttle.slot(url, "dbms/MDC/STAT/standard/MDCSTAT01701")
+        assert [x.limiter.name for x in heavy.slots] == [
+            "dbms/MDC/STAT/standard/MDCSTAT01501",
+            "data.krx.co.kr",
+        ]
+        assert [x.limiter.name for x in light.slots] == ["data.krx.co.kr"]
+
+
+class TestMetrics:
+    @pytest.fixture
+    def fetch(self, monkeypatch):
+        def post(url, headers, data, timeout):
+            return FakeResponse(
+                {
+                    "output": [
+                        {
+                            "DISCLS_DD": "2022/01/04",
+                            "LST_ORD_BAS_YD": "1.717",
+                            "CMP_YD": "0.007",
+                        }
+                    ]
+                }
+            )
+
+        monkeypatch.setattr(webio._session, "post", post)
+        metrics.registry.reset()
+        return lambda: get_otc_treasury_yields_by_date(
+            "20220104", "20220104", "국고채2년"
+        )
+
+    def test_records_each_stage(self, fetch):
+        df = fetch()
+        assert len(df) == 1
+        bld = "dbms/MDC/STAT/standard/MDCSTAT11402"
+        snapshot = metrics.snapshot()
+        assert metrics.registry.get("pykrx_network_seconds", endpoint=bld) == 1
+        assert metrics.registry.get("pykrx_decode_seconds", endpoint=bld) == 1
+        assert (
+            metrics.registry.get("pykrx_responses_total", endpoint=bld, status="200")
+            == 1
+        )
+        assert snapshot["pykrx_response_bytes_total"][0]["value"] > 0
+        transform = snapshot["pykrx_transform_seconds"][0]
+        assert transform["labels"] == {"func": "get_otc_treasury_yields_by_date"}
+        assert transform["buckets"][float("inf")] == 1
+
+    def test_prometheus_text(self, fetch, tmp_path):
+        fetch()
+        text = metrics.prometheus()
+        assert "# TYPE pykrx_network_seconds histogram" in text
+        assert (
+            'pykrx_network_seconds_bucket{endpoint="dbms/MDC/STAT/standard/MDCSTAT11402",le="+Inf"} 1'
+            in text
+        )
+
+        path = tmp_path / "pykrx.prom"
+        metrics.write_prometheus(str(path))
+        assert path.read_text(encoding="utf-8") == metrics.prometheus()
+
+        server = metrics.serve(port=0)
+        try:
+            url = "http://127.0.0.1:{}/metrics".format(server.server_address[1])
+            assert "pykrx_decode_seconds_count" in requests.get(url, timeout=5).text
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class TestTracing:
+    @pytest.fixture
+    def fetch(self, monkeypatch):
+        def post(url, headers, data, timeout):
+            return FakeResponse(
+                {
+                    "output": [
+                        {
+                            "DISCLS_DD": "2022/01/04",
+                            "LST_ORD_BAS_YD": "1.717",
+                            "CMP_YD": "0.007",
+                        }
+                    ]
+                }
+            )
+
+        monkeypatch.setattr(webio._session, "post", post)
+        monkeypatch.setattr(krxio, "pause", lambda seconds, reason="sleep": None)
+        return get_otc_treasury_yields_by_date
+
+    def test_disabled_by_default(self):
+        with tracing.span("fetch", bld="x") as sp:
+            sp.set(rows=1)
+        assert not isinstance(sp, tracing.Span)
+        assert not tracing.enabled()
+
+    def test_collect_breakdown(self, fetch):
+        with tracing.collect() as c:
+            df = fetch("20220104", "20220104", "국고채2년")
+        assert len(df) == 1
+        breakdown = c.breakdown()
+        for name in ("wrap", "fetch", "read", "chunk", "request", "network", "decode"):
+            assert breakdown[name]["count"] == 1
+        spans = {x.name: x for x in c.spans}
+        assert spans["read"].attributes["bld"] == "dbms/MDC/STAT/standard/MDCSTAT11402"
+        assert spans["fetch"].attributes["rows"] == 1
+        assert spans["decode"].attributes["rows"] == 1
+        assert spans["wrap"].attributes == {
+            "func": "get_otc_treasury_yields_by_date",
+            "rows": 1,
+        }
+        assert spans["fetch"].parent is spans["wrap"]
+        assert spans["wrap"].duration >= spans["fetch"].duration
+        assert not tracing.enabled()
+
+    def test_chunk_index_and_hooks(self, fetch):
+        events = []
+
+        class Hook(tracing.SpanHook):
+            def on_start(self, span):
+                events.append(("start", span.name))
+
+            def on_end(self, span):
+                if span.name == "chunk":
+                    events.append(
+                        ("end", span.attributes["index"], span.attributes["strtDd"])
+                    )
+
+        hook = add_hook(Hook())
+        try:
+            fetch("20180101", "20220104", "국고채2년")
+        finally:
+            remove_hook(hook)
+        assert events[0] == ("start", "wrap")
+        chunks = [x for x in events if x[0] == "end"]
+        assert chunks == [
+            ("end", 0, "20180101"),
+            ("end", 1, "20200102"),
+            ("end", 2, "20220102"),
+        ]
+
+
+class TestFakeServer:
+    def test_synthetic_responses(self):
+        with FakeServer(size=30) as server:
+            df = get_otc_treasury_yields_by_date("20231201", "20240105", "국고채3년")
+            again = get_otc_treasury_yields_by_date("20231201", "20240105", "국고채3년")
+        assert len(df) == 26
+        assert df.index.is_monotonic_increasing
+        assert df.equals(again)
+        assert server.stats()["status"] == {200: 2}
+        url = "https://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+        assert webio.resolve_url(url) == url
+
+    def test_injected_errors_are_retried(self):
+        behavior = Behavior(error_rate=0.5, truncated_rate=0.2, seed=1)
+        with FakeServer(behavior) as server:
+            df = get_otc_treasury_yields_by_date("20240102", "20240105", "CD")
+        stats = server.stats()
+        assert len(df) == 4
+        assert stats["requests"] > 1
+        assert stats["status"][500] >= 1
+
+    def test_rate_limit(self):
+        with FakeServer(Behavior(rate_limit=1, burst=1)) as server:
+            session = requests.Session()
+            status = [
+                session.post(
+                    server.url + "/comm/bldAttendant/getJsonData.cmd", data={"bld": "x"}
+                ).status_code
+                for _ in range(3)
+            ]
+        assert status[0] == 200
+        assert 429 in status[1:]
+
+
+class TestToNumeric:
+    def test_converts_only_given_columns(self):
+        df = pd.DataFrame(
+            {"종목명": ["A-1", "B"], "종가": ["1,200", "-"], "등락률": ["-1.5", ""]},
+            index=["000010", "000020"],
+        )
+        df = to_numeric(df, {"종가": np.int64, "등락률": np.float64})
+        assert df["종목명"].tolist() == ["A-1", "B"]
+        assert df["종가"].tolist() == [1200, 0]
+        assert df["등락률"].tolist() == [-1.5, 0.0]
+        assert df.dtypes["종가"] == np.int64
+
+    def test_index_does_not_pin_source_block(self):
+        df = pd.DataFrame(
+            {"티커": ["000010", "000020"], "종가": ["1", "2"]}, dtype=object
+        )
+        df = to_numeric(df.set_index("티커"), {"종가": np.int64})
+        assert df.index.to_numpy().base is None